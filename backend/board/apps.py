@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class BoardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'board'
+
+    def ready(self):
+        from config import checks  # noqa: F401  ✅ 공유 캐시 시스템 체크 등록 (config.W001)
+        from .models import BoardAttachment, handle_attachment_changed
+
+        # ✅ 첨부파일 추가/삭제 → 게시글 updated_at 갱신 (상세 조회 ETag)
+        post_save.connect(handle_attachment_changed, sender=BoardAttachment, dispatch_uid='board:attachment_saved')
+        post_delete.connect(handle_attachment_changed, sender=BoardAttachment, dispatch_uid='board:attachment_deleted')
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from board.models import BoardComment, BoardCommentLike, BoardPost, BoardPostLike, hot_vote_weight
+
+
+def count_subquery(model, fk_field, **filters):
+    """대상 행(OuterRef('pk'))별 연관 행 수를 세는 서브쿼리 (없으면 0)"""
+    counts = (
+        model.objects.filter(**{fk_field: OuterRef('pk')}, **filters)
+        .order_by()
+        .values(fk_field)
+        .annotate(count=Count('id'))
+        .values('count')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+class Command(BaseCommand):
+    help = "게시글/댓글의 추천·비추천·댓글 수 카운터를 실제 행 수 기준으로 다시 채웁니다."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            posts = BoardPost.objects.update(
+                like_count=count_subquery(BoardPostLike, 'post_id', is_like=True),
+                dislike_count=count_subquery(BoardPostLike, 'post_id', is_like=False),
+                comment_count=count_subquery(BoardComment, 'post_id'),
+            )
+            # 다시 계산된 추천 수 기준으로 핫 점수 갱신
+            BoardPost.objects.update(
+                hot_score=F('hot_base') + hot_vote_weight(F('like_count'), F('dislike_count'))
+            )
+            comments = BoardComment.objects.update(
+                like_count=count_subquery(BoardCommentLike, 'comment_id', is_like=True),
+                dislike_count=count_subquery(BoardCommentLike, 'comment_id', is_like=False),
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"게시글 {posts}개, 댓글 {comments}개의 카운터를 다시 계산했습니다."))
@@ -0,0 +1,164 @@
+import random
+import statistics
+import time
+from collections import Counter
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Q
+
+from board.models import BoardCategory, BoardPost
+from board.search import RANK_WINDOW, board_post_search_vector, rank_posts, search_highlight, search_posts
+
+BENCHMARK_SLUGS = ('benchmark-search-a', 'benchmark-search-b')
+
+
+class Command(BaseCommand):
+    help = (
+        "게시글 검색 성능 벤치마크: 한국어/영어 단어로 된 대량의 게시글을 만든 뒤 "
+        "기존 icontains 검색과 search_vector 전문 검색의 p95 지연 시간을 비교합니다. "
+        "(운영 DB가 아닌 별도 벤치마크 DB에서 실행하세요)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', type=int, default=1_000_000, help='생성할 게시글 수 (기본값: 1,000,000)')
+        parser.add_argument('--vocabulary', type=int, default=20000, help='단어 사전 크기 (Zipf 분포로 사용)')
+        parser.add_argument('--runs', type=int, default=10, help='검색어별 반복 측정 횟수 (기본값: 10)')
+        parser.add_argument('--batch-size', type=int, default=5000, help='bulk_create 배치 크기')
+        parser.add_argument('--skip-seed', action='store_true', help='이미 생성된 벤치마크 데이터를 재사용')
+        parser.add_argument('--cleanup', action='store_true', help='측정 후 벤치마크 데이터를 삭제')
+
+    def handle(self, *args, **options):
+        rng = random.Random(7)
+        vocabulary = self.make_vocabulary(rng, options['vocabulary'])
+        categories = [
+            BoardCategory.objects.get_or_create(slug=slug, defaults={'name': slug})[0] for slug in BENCHMARK_SLUGS
+        ]
+        if not options['skip_seed']:
+            self.seed(rng, vocabulary, categories, options)
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE board_boardpost')
+
+        self.stdout.write(f"측정 대상: 게시글 {BoardPost.objects.count():,}개")
+        # 빈도 구간별 검색어 (자주 나오는 단어일수록 일치 행이 많음)
+        # --skip-seed로 재사용할 때도 맞도록 실제 게시글 표본의 단어 빈도 순위로 고름
+        ranked = self.ranked_words(categories)
+        bands = {'common': ranked[5:10], 'medium': ranked[300:305], 'rare': ranked[5000:5005]}
+        base = BoardPost.objects.select_related('user', 'category').defer('search_vector')
+
+        legacy_filters = {
+            'title': lambda term: Q(title__icontains=term),
+            'title_content': lambda term: Q(title__icontains=term) | Q(content__icontains=term),
+            'user': lambda term: Q(user__username__icontains=term),
+        }
+        for search_type, legacy in legacy_filters.items():
+            for band, terms in bands.items():
+                if search_type == 'user':
+                    terms = ['bench_search_12', 'bench_search_345']
+                    if band != 'rare':
+                        continue
+
+                def before(term):
+                    return list(base.filter(legacy(term)).order_by('-created_at')[:20])
+
+                def after(term):
+                    if search_type == 'user':
+                        posts = list(search_posts(base, term, search_type).order_by('-created_at', '-id')[:20])
+                    else:
+                        posts = rank_posts(base, term, search_type)[:20]
+                    for post in posts:
+                        search_highlight(post, term)
+                    return posts
+
+                old_p95 = self.p95(before, terms, options['runs'])
+                new_p95 = self.p95(after, terms, options['runs'])
+                self.stdout.write(
+                    f"{search_type:<14} {band:<7} before p95 {old_p95:9.2f}ms   after p95 {new_p95:9.2f}ms"
+                )
+
+        category = categories[0]
+        terms = bands['medium']
+        old_p95 = self.p95(
+            lambda term: list(base.filter(Q(title__icontains=term) | Q(content__icontains=term), category=category)
+                              .order_by('-created_at')[:20]),
+            terms, options['runs'])
+        new_p95 = self.p95(
+            lambda term: rank_posts(base.filter(category=category), term, 'title_content')[:20],
+            terms, options['runs'])
+        self.stdout.write(f"{'+category':<14} {'medium':<7} before p95 {old_p95:9.2f}ms   after p95 {new_p95:9.2f}ms")
+
+        # 관련도 순위 범위(RANK_WINDOW) 뒤 페이지: 나머지 일치 글을 최신순으로 이어서 읽는 비용
+        for band in ('common', 'medium'):
+            terms = bands[band]
+            old_p95 = self.p95(
+                lambda term: list(base.filter(Q(title__icontains=term) | Q(content__icontains=term))
+                                  .order_by('-created_at')[RANK_WINDOW:RANK_WINDOW + 20]),
+                terms, options['runs'])
+            new_p95 = self.p95(
+                lambda term: rank_posts(base, term, 'title_content')[RANK_WINDOW:RANK_WINDOW + 20],
+                terms, options['runs'])
+            self.stdout.write(
+                f"{'+past window':<14} {band:<7} before p95 {old_p95:9.2f}ms   after p95 {new_p95:9.2f}ms"
+            )
+
+        if options['cleanup']:
+            BoardPost.objects.filter(category__in=categories).delete()
+            get_user_model().objects.filter(username__startswith='bench_search_').delete()
+            BoardCategory.objects.filter(slug__in=BENCHMARK_SLUGS).delete()
+
+    def p95(self, run_query, terms, runs):
+        timings = []
+        for term in terms:
+            for _ in range(runs):
+                start = time.perf_counter()
+                run_query(term)
+                timings.append((time.perf_counter() - start) * 1000)
+        return statistics.quantiles(timings, n=20)[18] if len(timings) > 1 else timings[0]
+
+    def ranked_words(self, categories, sample_size=3000):
+        counts = Counter()
+        sample = BoardPost.objects.filter(category__in=categories).order_by('-id').values_list('title', 'content')
+        for title, content in sample[:sample_size]:
+            counts.update(f"{title} {content}".split())
+        return [word for word, _ in counts.most_common()]
+
+    def make_vocabulary(self, rng, size):
+        syllables = [chr(0xAC00 + i) for i in range(0, 11172, 7)]
+        words = set()
+        while len(words) < size:
+            if rng.random() < 0.85:
+                words.add(''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4))))
+            else:
+                words.add(''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 9))))
+        words = sorted(words)
+        rng.shuffle(words)
+        return words
+
+    def seed(self, rng, vocabulary, categories, options):
+        User = get_user_model()
+        User.objects.bulk_create(
+            [User(username=f'bench_search_{i}', email=f'bench_search_{i}@example.com', password='!') for i in range(1000)],
+            ignore_conflicts=True,
+        )
+        users = list(User.objects.filter(username__startswith='bench_search_').values_list('id', flat=True))
+        # Zipf 분포: 앞쪽 단어일수록 자주 등장
+        weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+
+        def sentence(low, high):
+            return ' '.join(rng.choices(vocabulary, weights, k=rng.randint(low, high)))
+
+        remaining = options['posts']
+        while remaining > 0:
+            size = min(options['batch_size'], remaining)
+            remaining -= size
+            posts = []
+            for _ in range(size):
+                user_id = rng.choice(users)
+                title, content = sentence(3, 8), sentence(20, 60)
+                posts.append(BoardPost(
+                    category=rng.choice(categories), user_id=user_id, title=title, content=content,
+                    search_vector=board_post_search_vector(title, content),
+                ))
+            BoardPost.objects.bulk_create(posts)
+            self.stdout.write(f"게시글 {options['posts'] - remaining:,}/{options['posts']:,} 생성")
@@ -0,0 +1,127 @@
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from board.models import BoardCategory, BoardPost, BoardPostLike, hot_time_weight, hot_vote_weight
+
+BENCHMARK_SLUG = 'benchmark-hot'
+
+
+class Command(BaseCommand):
+    help = (
+        "핫글 조회 성능 벤치마크: 대량의 게시글/추천 데이터를 만든 뒤 "
+        "기존 Count() 집계 방식과 인덱스 컬럼 방식의 p95 지연 시간을 비교합니다. "
+        "(운영 DB가 아닌 별도 벤치마크 DB에서 실행하세요)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', type=int, default=1_000_000, help='생성할 게시글 수 (기본값: 1,000,000)')
+        parser.add_argument('--likes', type=int, default=20_000_000, help='생성할 추천/비추천 수 (기본값: 20,000,000)')
+        parser.add_argument('--users', type=int, default=2000, help='추천에 참여할 더미 유저 수 (기본값: 2,000)')
+        parser.add_argument('--runs', type=int, default=20, help='쿼리별 반복 측정 횟수 (기본값: 20)')
+        parser.add_argument('--batch-size', type=int, default=10000, help='bulk_create 배치 크기')
+        parser.add_argument('--skip-seed', action='store_true', help='이미 생성된 벤치마크 데이터를 재사용')
+        parser.add_argument('--cleanup', action='store_true', help='측정 후 벤치마크 데이터를 삭제')
+
+    def handle(self, *args, **options):
+        category, _ = BoardCategory.objects.get_or_create(
+            slug=BENCHMARK_SLUG, defaults={'name': '벤치마크 핫글'}
+        )
+        if not options['skip_seed']:
+            self.seed(category, options)
+
+        self.stdout.write(f"측정 대상: 게시글 {BoardPost.objects.count():,}개, 추천 {BoardPostLike.objects.count():,}개")
+        now = timezone.now()
+        day_ago, month_ago = now - timedelta(days=1), now - timedelta(days=30)
+
+        def before(window=None):
+            qs = BoardPost.objects.all()
+            if window:
+                qs = qs.filter(created_at__gte=window)
+            qs = qs.annotate(likes_total=Count('likes', filter=Q(likes__is_like=True)))
+            if window is None:
+                qs = qs.filter(likes_total__gte=10)
+            return qs.order_by('-likes_total', '-created_at')[:20]
+
+        scenarios = [
+            ('category=hot', lambda: before(), lambda: BoardPost.objects.filter(like_count__gte=10).order_by('-like_count', '-created_at')[:20]),
+            ('daily hot', lambda: before(day_ago), lambda: BoardPost.get_daily_hot_posts()[:20]),
+            ('monthly hot', lambda: before(month_ago), lambda: BoardPost.get_monthly_hot_posts()[:20]),
+            ('trending', None, lambda: BoardPost.get_trending_posts()[:20]),
+        ]
+        for name, old_query, new_query in scenarios:
+            old_p95 = self.p95(old_query, options['runs']) if old_query else None
+            new_p95 = self.p95(new_query, options['runs'])
+            old_text = f"{old_p95:9.2f}ms" if old_p95 is not None else '        -'
+            self.stdout.write(f"{name:<14} before p95 {old_text}   after p95 {new_p95:9.2f}ms")
+
+        if options['cleanup']:
+            BoardPost.objects.filter(category=category).delete()
+            get_user_model().objects.filter(username__startswith='bench_hot_').delete()
+            category.delete()
+
+    def p95(self, make_query, runs):
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            list(make_query())
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.quantiles(timings, n=20)[18] if len(timings) > 1 else timings[0]
+
+    def seed(self, category, options):
+        User = get_user_model()
+        batch_size = options['batch_size']
+        rng = random.Random(42)
+
+        User.objects.bulk_create(
+            [
+                User(username=f'bench_hot_{i}', email=f'bench_hot_{i}@example.com', password='!')
+                for i in range(options['users'])
+            ],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+        user_ids = list(User.objects.filter(username__startswith='bench_hot_').values_list('id', flat=True))
+        author_id = user_ids[0]
+
+        # 게시글별 추천 수를 평균 likes/posts 근처로 분배 (유저 수를 넘지 않도록 제한)
+        average = options['likes'] / max(options['posts'], 1)
+        now = timezone.now()
+        remaining_posts = options['posts']
+        while remaining_posts > 0:
+            size = min(batch_size, remaining_posts)
+            remaining_posts -= size
+            posts, votes = [], []
+            for _ in range(size):
+                created_at = now - timedelta(seconds=rng.randint(0, 60 * 24 * 3600))
+                voters = rng.sample(user_ids, min(int(rng.expovariate(1 / average)) if average else 0, len(user_ids)))
+                flags = [rng.random() < 0.8 for _ in voters]
+                like_count = sum(flags)
+                dislike_count = len(flags) - like_count
+                base = hot_time_weight(created_at)
+                posts.append(BoardPost(
+                    category=category, user_id=author_id, title='벤치마크 게시글', content='벤치마크',
+                    created_at=created_at, like_count=like_count, dislike_count=dislike_count,
+                    hot_base=base, hot_score=base + hot_vote_weight(like_count, dislike_count),
+                ))
+                votes.append((created_at, list(zip(voters, flags))))
+
+            posts = BoardPost.objects.bulk_create(posts)
+            # auto_now_add로 덮어쓴 작성 시각을 분산된 값으로 되돌림
+            for post, (created_at, _) in zip(posts, votes):
+                post.created_at = created_at
+            BoardPost.objects.bulk_update(posts, ['created_at'], batch_size=batch_size)
+
+            likes = [
+                BoardPostLike(post_id=post.id, user_id=user_id, is_like=flag)
+                for post, (_, post_votes) in zip(posts, votes)
+                for user_id, flag in post_votes
+            ]
+            BoardPostLike.objects.bulk_create(likes, batch_size=batch_size)
+            self.stdout.write(f"게시글 {options['posts'] - remaining_posts:,}/{options['posts']:,} 생성")
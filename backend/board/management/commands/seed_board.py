@@ -1,3 +1,4 @@
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from board.models import BoardCategory, BoardPost, BoardComment, BoardPostLike
 from django.contrib.auth import get_user_model
@@ -84,5 +85,8 @@ class Command(BaseCommand):
 
             created_count += 1
 
+        # get_or_create로 직접 만든 추천/댓글 행을 게시글/댓글 카운터에 반영
+        call_command('backfill_board_counters', stdout=self.stdout)
+
         self.stdout.write(self.style.SUCCESS(
             f"{created_count}개의 게시글(추천/비추천/댓글/조회수 포함) 더미 데이터가 생성되었습니다."))
\ No newline at end of file
@@ -0,0 +1,68 @@
+# Generated by Django 5.2 on 2026-10-18 18:34
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    BoardPost = apps.get_model('board', 'BoardPost')
+    BoardComment = apps.get_model('board', 'BoardComment')
+    BoardPostLike = apps.get_model('board', 'BoardPostLike')
+    BoardCommentLike = apps.get_model('board', 'BoardCommentLike')
+
+    def count_subquery(model, fk_field, **filters):
+        counts = (
+            model.objects.filter(**{fk_field: OuterRef('pk')}, **filters)
+            .order_by()
+            .values(fk_field)
+            .annotate(count=Count('id'))
+            .values('count')
+        )
+        return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+    BoardPost.objects.update(
+        like_count=count_subquery(BoardPostLike, 'post_id', is_like=True),
+        dislike_count=count_subquery(BoardPostLike, 'post_id', is_like=False),
+        comment_count=count_subquery(BoardComment, 'post_id'),
+    )
+    BoardComment.objects.update(
+        like_count=count_subquery(BoardCommentLike, 'comment_id', is_like=True),
+        dislike_count=count_subquery(BoardCommentLike, 'comment_id', is_like=False),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0006_boardattachment'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='boardcomment',
+            name='dislike_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='비추천 수'),
+        ),
+        migrations.AddField(
+            model_name='boardcomment',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='추천 수'),
+        ),
+        migrations.AddField(
+            model_name='boardpost',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='댓글 수'),
+        ),
+        migrations.AddField(
+            model_name='boardpost',
+            name='dislike_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='비추천 수'),
+        ),
+        migrations.AddField(
+            model_name='boardpost',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='추천 수'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
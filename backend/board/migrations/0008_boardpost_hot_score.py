@@ -0,0 +1,71 @@
+# Generated by Django 5.2 on 2026-10-18 18:37
+
+import math
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import migrations, models
+
+# 이 마이그레이션 시점의 핫 점수 공식 고정 복사본 (board.models를 import하면 이후 공식이 바뀔 때 과거 백필도 바뀜)
+HOT_SCORE_EPOCH = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+HOT_SCORE_DECAY_SECONDS = 45000
+BATCH_SIZE = 1000
+
+
+def hot_time_weight(created_at):
+    return (created_at - HOT_SCORE_EPOCH).total_seconds() / HOT_SCORE_DECAY_SECONDS
+
+
+def hot_vote_weight(like_count, dislike_count):
+    net = like_count - dislike_count
+    return math.copysign(math.log10(max(abs(net), 1)), net) if net else 0.0
+
+
+def backfill_hot_score(apps, schema_editor):
+    BoardPost = apps.get_model('board', 'BoardPost')
+
+    # 게시글 전체를 메모리에 올리지 않도록 BATCH_SIZE개씩 읽고 바로 반영
+    posts = []
+    for post in BoardPost.objects.only('id', 'created_at', 'like_count', 'dislike_count').iterator(chunk_size=BATCH_SIZE):
+        post.hot_base = hot_time_weight(post.created_at)
+        post.hot_score = post.hot_base + hot_vote_weight(post.like_count, post.dislike_count)
+        posts.append(post)
+        if len(posts) >= BATCH_SIZE:
+            BoardPost.objects.bulk_update(posts, ['hot_base', 'hot_score'])
+            posts = []
+    if posts:
+        BoardPost.objects.bulk_update(posts, ['hot_base', 'hot_score'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0007_board_denormalized_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='boardpost',
+            name='hot_base',
+            field=models.FloatField(default=0.0, verbose_name='핫 점수 시간 항'),
+        ),
+        migrations.AddField(
+            model_name='boardpost',
+            name='hot_score',
+            field=models.FloatField(default=0.0, verbose_name='핫 점수'),
+        ),
+        migrations.RunPython(backfill_hot_score, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='boardpost',
+            index=models.Index(fields=['-like_count', '-created_at'], name='board_post_like_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boardpost',
+            index=models.Index(fields=['created_at', 'like_count'], name='board_post_created_like_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boardpost',
+            index=models.Index(fields=['-hot_score'], name='board_post_hot_score_idx'),
+        ),
+    ]
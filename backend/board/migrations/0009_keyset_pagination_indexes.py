@@ -0,0 +1,39 @@
+# Generated by Django 5.2 on 2026-10-18 18:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0008_boardpost_hot_score'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='boardpost',
+            name='board_post_like_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='boardpost',
+            name='board_post_hot_score_idx',
+        ),
+        migrations.AddIndex(
+            model_name='boardpost',
+            index=models.Index(fields=['-created_at', '-id'], name='board_post_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boardpost',
+            index=models.Index(fields=['category', '-created_at', '-id'], name='board_post_cat_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boardpost',
+            index=models.Index(fields=['-like_count', '-created_at', '-id'], name='board_post_like_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boardpost',
+            index=models.Index(fields=['-hot_score', '-id'], name='board_post_hot_score_idx'),
+        ),
+    ]
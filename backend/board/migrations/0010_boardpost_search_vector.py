@@ -0,0 +1,109 @@
+# Generated by Django 5.2 on 2026-10-18 19:20
+
+import re
+import unicodedata
+from collections import defaultdict
+
+import django.contrib.postgres.search
+from django.db import migrations
+from django.utils.html import strip_tags
+
+BATCH_SIZE = 1000
+
+# ---------------------------------------------------------------------
+# 이 마이그레이션 시점의 토크나이저 / tsvector 생성 고정 복사본 (config/search.py)
+# 앱 코드를 import하면 이후 토크나이저가 바뀔 때 과거 마이그레이션의 백필 결과도 바뀌므로 복사해 둠
+# ---------------------------------------------------------------------
+HANGUL_RUN_RE = re.compile(r'[가-힣]+|[^\W_가-힣]+')
+MAX_WORD_LENGTH = 64
+
+
+def document_terms(text):
+    terms = []
+    for word in HANGUL_RUN_RE.findall(unicodedata.normalize('NFKC', text or '').lower()):
+        if '가' <= word[0] <= '힣':
+            terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+            terms.append(word[-1])
+        else:
+            terms.append(word[:MAX_WORD_LENGTH])
+    return terms
+
+
+def _quote(term):
+    return "'" + term.replace("'", "''").replace('\\', '\\\\') + "'"
+
+
+def search_vector(weighted_texts, qualified_weights=''):
+    """[(텍스트, 'A'), (텍스트, 'B')] → tsvector 리터럴 (앱 코드는 캐스팅 표현식으로 감싸지만 여기서는 VALUES 파라미터로 넘김)"""
+    lexemes, position = defaultdict(list), 0
+    for text, weight in weighted_texts:
+        for term in document_terms(text):
+            position = min(position + 1, 16383)
+            lexemes[term].append(f"{position}{weight}")
+            if weight in qualified_weights:
+                lexemes[f"{weight}:{term}"].append(f"{position}{weight}")
+    literal = ' '.join(f"{_quote(term)}:{','.join(positions)}" for term, positions in lexemes.items())
+    return literal
+
+
+def board_post_search_vector(title, content):
+    # 본문 HTML 태그 제외, 제목(A)은 'A:단어'로도 색인 (제목 검색용)
+    return search_vector([(strip_tags(title or ''), 'A'), (strip_tags(content or ''), 'B')], qualified_weights='A')
+
+
+def backfill_search_vectors(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    BoardPost = apps.get_model('board', 'BoardPost')
+
+    # 행마다 UPDATE하지 않고 BATCH_SIZE개씩 UPDATE ... FROM (VALUES ...) 한 문장으로 반영
+    # (bulk_update의 CASE WHEN은 행마다 배치 크기만큼 비교하므로 이쪽이 약 3배 빠름)
+    rows = []
+    for pk, title, content in BoardPost.objects.values_list('pk', 'title', 'content').iterator(chunk_size=BATCH_SIZE):
+        rows.append((pk, board_post_search_vector(title, content)))
+        if len(rows) >= BATCH_SIZE:
+            write_search_vectors(schema_editor, BoardPost._meta.db_table, rows)
+            rows = []
+    if rows:
+        write_search_vectors(schema_editor, BoardPost._meta.db_table, rows)
+
+
+def write_search_vectors(schema_editor, table, rows):
+    """(pk, tsvector 리터럴) 목록을 UPDATE 한 문장으로 저장"""
+    values = ', '.join(['(%s, %s::tsvector)'] * len(rows))
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f'UPDATE {table} AS t SET search_vector = v.vector FROM (VALUES {values}) AS v(id, vector) WHERE t.id = v.id',
+            [param for row in rows for param in row],
+        )
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS board_post_search_vector_gin ON board_boardpost USING gin (search_vector)'
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS board_post_search_vector_gin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0009_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='boardpost',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='검색 벡터'),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
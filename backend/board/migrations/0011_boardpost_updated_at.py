@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 21:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0010_boardpost_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='boardpost',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='수정 일시'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-19 00:01
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0011_boardpost_updated_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='boardpost',
+            name='board_post_created_like_idx',
+        ),
+    ]
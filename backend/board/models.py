@@ -1,9 +1,37 @@
+import math
+from datetime import datetime, timezone as dt_timezone
+
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import Case, F, FloatField, IntegerField, Value, When
+from django.db.models.functions import Abs, Cast, Greatest, Ln, Now, Sign
 from django.contrib.auth import get_user_model
-from django.db.models import Avg, Count, Q
+from django.utils import timezone
+
+from .search import update_search_document
 
 User = get_user_model()
 
+# ✅ 핫 점수 계산 기준 (Reddit hot 방식)
+# - 순추천(추천-비추천) 10배 차이 = 작성 시각 HOT_SCORE_DECAY_SECONDS(12.5시간) 차이
+# - 시간 항은 작성 시 한 번만 계산되므로, 추천 토글 시 추천 항만 다시 계산하면 됨
+HOT_SCORE_EPOCH = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+HOT_SCORE_DECAY_SECONDS = 45000
+
+
+def hot_time_weight(created_at):
+    """작성 시각에 따른 핫 점수의 시간 항 (최근 글일수록 큼)"""
+    return (created_at - HOT_SCORE_EPOCH).total_seconds() / HOT_SCORE_DECAY_SECONDS
+
+
+def hot_vote_weight(like_count, dislike_count):
+    """순추천 수에 따른 핫 점수의 추천 항 (값 또는 DB 표현식 모두 지원)"""
+    if isinstance(like_count, int) and isinstance(dislike_count, int):
+        net = like_count - dislike_count
+        return math.copysign(math.log10(max(abs(net), 1)), net) if net else 0.0
+    net = Cast(like_count - dislike_count, FloatField())
+    return Sign(net) * Ln(Greatest(Abs(net), 1.0)) / math.log(10)
+
 # ✅ 게시판 카테고리 모델 (ex. 자유게시판, 영화 정보, 국내 드라마 등)
 class BoardCategory(models.Model):
     name = models.CharField(max_length=50, unique=True, verbose_name="카테고리명")
@@ -26,32 +54,79 @@ class BoardPost(models.Model):
     title = models.CharField(max_length=200, verbose_name="제목")
     content = models.TextField(verbose_name="내용")
     created_at = models.DateTimeField(auto_now_add=True)
+    # ✅ 응답에 보이는 값(본문/카운터/첨부파일)이 바뀐 시각 (상세 조회 ETag / Last-Modified 검증값)
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정 일시")
     view_count = models.PositiveIntegerField(default=0, verbose_name="조회수")
+    # ✅ 추천/비추천/댓글 수 (토글·댓글 작성/삭제 시 F()로 원자적으로 갱신되는 비정규화 카운터)
+    like_count = models.PositiveIntegerField(default=0, verbose_name="추천 수")
+    dislike_count = models.PositiveIntegerField(default=0, verbose_name="비추천 수")
+    comment_count = models.PositiveIntegerField(default=0, verbose_name="댓글 수")
+    # ✅ 시간 감쇠 핫 점수 (hot_score = hot_base + 추천 항, 인덱스 정렬용)
+    hot_base = models.FloatField(default=0.0, verbose_name="핫 점수 시간 항")
+    hot_score = models.FloatField(default=0.0, verbose_name="핫 점수")
+    # ✅ 검색 문서 (제목 A / 본문 B n-gram tsvector, PostgreSQL에서만 채워짐, board/search.py)
+    search_vector = SearchVectorField(null=True, editable=False, verbose_name="검색 벡터")
+
+    class Meta:
+        indexes = [
+            # 게시글 목록(최신순) 키셋 페이지네이션: (created_at, id) < (..) ORDER BY created_at DESC, id DESC
+            models.Index(fields=['-created_at', '-id'], name='board_post_created_id_idx'),
+            models.Index(fields=['category', '-created_at', '-id'], name='board_post_cat_created_idx'),
+            # category=hot: like_count >= N ORDER BY like_count DESC, created_at DESC, id DESC
+            # 일간/월간 핫글(created_at >= X ORDER BY like_count DESC)도 이 인덱스를 따라 읽거나,
+            # 기간 안의 글이 적으면 board_post_created_id_idx 범위 스캔 후 정렬
+            models.Index(fields=['-like_count', '-created_at', '-id'], name='board_post_like_created_idx'),
+            # 실시간 인기글(category=trending): hot_score 내림차순 인덱스 스캔만 사용
+            models.Index(fields=['-hot_score', '-id'], name='board_post_hot_score_idx'),
+            # search_vector GIN 인덱스는 PostgreSQL 전용이라 마이그레이션(0010)에서 생성
+        ]
 
     def __str__(self):
         return f"[{self.category.name}] {self.title}"
 
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            self.hot_base = hot_time_weight(self.created_at or timezone.now())
+            self.hot_score = self.hot_base + hot_vote_weight(self.like_count, self.dislike_count)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'updated_at' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'updated_at']
+        super().save(*args, **kwargs)
+        # 제목/본문이 저장될 때만 검색 문서 갱신 (카운터만 저장할 때는 건너뜀)
+        if update_fields is None or {'title', 'content'} & set(update_fields):
+            update_search_document(self)
+
+    @classmethod
+    def like_toggle_updates(cls, like_count, dislike_count):
+        """
+        추천 토글 UPDATE에 함께 실을 hot_score / updated_at 갱신식
+        (like_count / dislike_count는 갱신 후 값을 나타내는 표현식)
+        """
+        return {
+            'hot_score': F('hot_base') + hot_vote_weight(like_count, dislike_count),
+            'updated_at': Now(),
+        }
+
+    # ✅ 실시간 인기글 조회 메서드 (시간 감쇠 핫 점수 순)
+    @classmethod
+    def get_trending_posts(cls):
+        return cls.objects.order_by('-hot_score')
+
     # ✅ 일일 핫글 조회 메서드
     @classmethod
     def get_daily_hot_posts(cls):
-        from django.utils import timezone
         from datetime import timedelta
 
         yesterday = timezone.now() - timedelta(days=1)
-        return cls.objects.filter(created_at__gte=yesterday).annotate(
-            like_count=Count('likes', filter=Q(likes__is_like=True))
-        ).order_by('-like_count')
+        return cls.objects.filter(created_at__gte=yesterday).order_by('-like_count')
 
     # ✅ 월간 핫글 조회 메서드
     @classmethod
     def get_monthly_hot_posts(cls):
-        from django.utils import timezone
         from datetime import timedelta
 
         thirty_days_ago = timezone.now() - timedelta(days=30)
-        return cls.objects.filter(created_at__gte=thirty_days_ago).annotate(
-            like_count=Count('likes', filter=Q(likes__is_like=True))
-        ).order_by('-like_count')
+        return cls.objects.filter(created_at__gte=thirty_days_ago).order_by('-like_count')
 
 
 # ✅ 댓글 모델
@@ -60,22 +135,31 @@ class BoardComment(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name="작성자")
     content = models.TextField(verbose_name="댓글 내용")
     created_at = models.DateTimeField(auto_now_add=True)
+    like_count = models.PositiveIntegerField(default=0, verbose_name="추천 수")
+    dislike_count = models.PositiveIntegerField(default=0, verbose_name="비추천 수")
 
     def __str__(self):
         return f"{self.user.username}: {self.content[:20]}"
 
     # ✅ 댓글 추천수로 정렬하는 메서드
+    # 추천 TOP_COMMENT_MIN_LIKES개 이상인 댓글 중 상위 TOP_COMMENT_COUNT개를 먼저, 나머지는 작성순
+    # (잘라낸 쿼리셋은 | 로 합칠 수 없으므로 상위 댓글 id를 먼저 구해 정렬 키로 annotate → 페이지네이션 가능한 쿼리셋 유지)
+    TOP_COMMENT_COUNT = 3
+    TOP_COMMENT_MIN_LIKES = 10
+
     @classmethod
     def get_sorted_comments(cls, post_id):
-        top_comments = cls.objects.filter(post_id=post_id).annotate(
-            like_count=Count('likes', filter=Q(likes__is_like=True))
-        ).order_by('-like_count')[:3]
-
-        remaining_comments = cls.objects.filter(post_id=post_id).exclude(
-            id__in=top_comments.values_list('id', flat=True)
-        ).order_by('created_at')
-
-        return list(top_comments) + list(remaining_comments)
+        comments = cls.objects.filter(post_id=post_id)
+        top_ids = list(
+            comments.filter(like_count__gte=cls.TOP_COMMENT_MIN_LIKES)
+            .order_by('-like_count', 'created_at', 'id')
+            .values_list('id', flat=True)[:cls.TOP_COMMENT_COUNT]
+        )
+        return comments.annotate(top_rank=Case(
+            *[When(id=comment_id, then=Value(rank)) for rank, comment_id in enumerate(top_ids)],
+            default=Value(len(top_ids)),
+            output_field=IntegerField(),
+        )).order_by('top_rank', 'created_at', 'id')
 
 
 # ✅ 게시글 추천/비추천 모델
@@ -111,4 +195,11 @@ class BoardAttachment(models.Model):
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
-        return self.file.name
\ No newline at end of file
+        return self.file.name
+
+
+# ✅ 첨부파일 추가/삭제 → 게시글 변경 시각 갱신 (apps.py에서 연결, QuerySet.delete()도 신호 발생)
+def handle_attachment_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    BoardPost.objects.filter(pk=instance.post_id).update(updated_at=Now())
@@ -0,0 +1,60 @@
+from django.utils.html import strip_tags
+
+from config.search import DocumentSearch, highlight
+
+# ---------------------------------------------------------------------
+# ✅ 게시글 검색 엔진 (제목 A / 본문 B 가중치)
+# - search_type별로 일치를 허용할 가중치만 바꿔서 같은 search_vector 하나로 처리
+# - 작성자 검색(user)은 게시글보다 훨씬 작은 유저 테이블에서 아이디를 찾고
+#   user_id FK 인덱스로 게시글을 가져오는 편이 빠르므로 색인에 넣지 않음
+# - 본문의 HTML 태그(<img> 등)는 색인/스니펫에서 제외
+# ---------------------------------------------------------------------
+SEARCH_TYPE_WEIGHTS = {
+    'title': 'A',
+    'title_content': 'AB',
+}
+SEARCH_TYPES = (*SEARCH_TYPE_WEIGHTS, 'user')
+
+# 관련도 순위는 일치하는 글 중 최신 RANK_WINDOW개 안에서만 계산하고, 나머지 일치 글은 그 뒤에 최신순으로 이어 붙임
+# (게시글이 수백만 개일 때 흔한 단어로 검색해도 순위 계산 비용이 일정하고, 오래된 글보다 최근 글을 우선)
+# 흔한 단어는 최신 RECENT_SCAN개 글 안에서 RANK_WINDOW개를 채우므로 GIN 인덱스 결과 전체를 정렬하지 않음
+RANK_WINDOW = 100
+RECENT_SCAN = 2000
+RANK_ORDERING = ('-created_at', '-id')
+
+board_post_search = DocumentSearch({'title': 'A', 'content': 'B'}, preprocess=strip_tags, qualified_weights='A')
+
+
+def board_post_search_vector(title, content):
+    return board_post_search.vector({'title': title, 'content': content})
+
+
+def update_search_document(post):
+    board_post_search.update_document(post)
+
+
+def search_posts(queryset, text, search_type):
+    """
+    search_type(title/title_content/user)에 맞는 글만 남깁니다 (정렬은 쿼리셋 그대로, 관련도 계산 없음)
+    핫/트렌딩 정렬이나 커서 페이지네이션처럼 관련도 순이 아닌 목록에서 사용
+    """
+    if search_type == 'user':
+        return queryset.filter(user__username__icontains=text)
+    return board_post_search.match(queryset, text, weights=SEARCH_TYPE_WEIGHTS[search_type])
+
+
+def rank_posts(queryset, text, search_type):
+    """
+    제목 / 제목+본문 검색 결과를 관련도 순으로 (RankedMatches, 페이지 번호 페이지네이션용)
+    최신 RANK_WINDOW개 일치 글은 관련도 순, 나머지 일치 글은 그 뒤에 최신순
+    """
+    return board_post_search.rank(
+        queryset, text, (RANK_ORDERING, RANK_WINDOW, RECENT_SCAN), weights=SEARCH_TYPE_WEIGHTS[search_type],
+    )
+
+
+def search_highlight(post, text):
+    return {
+        'title': highlight(post.title, text, max_length=200),
+        'content': highlight(strip_tags(post.content), text),
+    }
@@ -1,5 +1,35 @@
+from django.db import models
 from rest_framework import serializers
 from .models import BoardAttachment, BoardCategory, BoardPost, BoardComment, BoardPostLike, BoardCommentLike
+from .search import search_highlight
+
+
+def get_my_likes(request, like_model, target_field, objs):
+    """
+    요청 사용자의 추천 여부를 {대상 id: True | False} 형태로 한 번의 IN 쿼리로 조회합니다.
+    """
+    user = getattr(request, 'user', None)
+    if not user or not user.is_authenticated:
+        return {}
+    likes = like_model.objects.filter(
+        user=user, **{f'{target_field}_id__in': [obj.id for obj in objs]}
+    ).values_list(f'{target_field}_id', 'is_like')
+    return dict(likes)
+
+
+class MyLikeListSerializer(serializers.ListSerializer):
+    """
+    목록 직렬화 시 페이지 전체의 my_like 값을 한 번에 조회해 context로 전달합니다.
+    (child Serializer의 Meta에 like_model / like_target_field 지정 필요)
+    """
+    def to_representation(self, data):
+        objs = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        if 'my_likes' not in self.context:
+            meta = self.child.Meta
+            self.context['my_likes'] = get_my_likes(
+                self.context.get('request'), meta.like_model, meta.like_target_field, objs
+            )
+        return super().to_representation(objs)
 
 
 class BoardAttachmentSerializer(serializers.ModelSerializer):
@@ -12,25 +42,29 @@ class BoardPostSerializer(serializers.ModelSerializer):
     user = serializers.ReadOnlyField(source='user.username')
     category = serializers.PrimaryKeyRelatedField(queryset=BoardCategory.objects.all())
     category_name = serializers.CharField(source='category.name', read_only=True)
-    like_count = serializers.SerializerMethodField()
+    like_count = serializers.IntegerField(read_only=True)
     my_like = serializers.SerializerMethodField()
-    dislike_count = serializers.SerializerMethodField()
-    comment_count = serializers.SerializerMethodField()
+    dislike_count = serializers.IntegerField(read_only=True)
+    comment_count = serializers.IntegerField(read_only=True)
     view_count = serializers.IntegerField(read_only=True) 
     thumbnail_url = serializers.SerializerMethodField()
     attachments = BoardAttachmentSerializer(many=True, read_only=True)
+    search_highlight = serializers.SerializerMethodField()
 
     class Meta:
         model = BoardPost
         fields = ['id', 'category','category_name', 'title', 'content', 'user',
                    'created_at', 'dislike_count', 'comment_count', 'view_count', 'like_count', 'my_like'
-                   , 'thumbnail_url', 'attachments']
+                   , 'thumbnail_url', 'attachments', 'search_highlight']
+        list_serializer_class = MyLikeListSerializer
+        like_model = BoardPostLike
+        like_target_field = 'post'
 
-    def get_like_count(self, obj):
-        # 추천(True)만 카운트
-        return obj.likes.filter(is_like=True).count()
-    
     def get_my_like(self, obj):
+        # 목록 직렬화 시에는 context로 미리 조회한 값을 사용
+        my_likes = self.context.get('my_likes')
+        if my_likes is not None:
+            return my_likes.get(obj.id)
         user = self.context.get('request').user
         if user and user.is_authenticated:
             like = obj.likes.filter(user=user).first()
@@ -38,12 +72,11 @@ class BoardPostSerializer(serializers.ModelSerializer):
             return like.is_like if like else None
         return None
     
-    def get_dislike_count(self, obj):
-        return obj.likes.filter(is_like=False).count()
+    def get_search_highlight(self, obj):
+        # 검색 목록에서만: 제목/본문의 일치 부분을 <mark>로 감싼 스니펫 (HTML 이스케이프됨)
+        query = self.context.get('search_query')
+        return search_highlight(obj, query) if query else None
 
-    def get_comment_count(self, obj):
-        return obj.comments.count()
-    
     def get_thumbnail_url(self, obj):
         # 1. 첨부파일 중 이미지 확장자 찾기
         for attachment in obj.attachments.all():
@@ -59,6 +92,16 @@ class BoardPostSerializer(serializers.ModelSerializer):
 
         return None
     
+# 게시글 목록 시리얼라이저: 사용자와 무관한 본문만 (my_like 제외, 공유 캐시 가능)
+# - 내 추천 여부 / 작성자 여부는 /api/me/reactions/?posts=...로 덮어씀
+class PublicBoardPostSerializer(BoardPostSerializer):
+    my_like = None
+
+    class Meta(BoardPostSerializer.Meta):
+        fields = [field for field in BoardPostSerializer.Meta.fields if field != 'my_like']
+        list_serializer_class = serializers.ListSerializer
+
+
 class BoardCategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = BoardCategory
@@ -68,8 +111,8 @@ class BoardCategorySerializer(serializers.ModelSerializer):
 class BoardCommentSerializer(serializers.ModelSerializer):
     user = serializers.ReadOnlyField(source='user.username')
     post = serializers.PrimaryKeyRelatedField(read_only=True)
-    like_count = serializers.SerializerMethodField()
-    dislike_count = serializers.SerializerMethodField()
+    like_count = serializers.IntegerField(read_only=True)
+    dislike_count = serializers.IntegerField(read_only=True)
     my_like = serializers.SerializerMethodField()
 
     class Meta:
@@ -78,14 +121,14 @@ class BoardCommentSerializer(serializers.ModelSerializer):
             'id', 'post', 'user', 'content', 'created_at',
             'like_count', 'dislike_count', 'my_like'
         ]
-
-    def get_like_count(self, obj):
-        return obj.likes.filter(is_like=True).count()
-
-    def get_dislike_count(self, obj):
-        return obj.likes.filter(is_like=False).count()
+        list_serializer_class = MyLikeListSerializer
+        like_model = BoardCommentLike
+        like_target_field = 'comment'
 
     def get_my_like(self, obj):
+        my_likes = self.context.get('my_likes')
+        if my_likes is not None:
+            return my_likes.get(obj.id)
         user = self.context.get('request').user
         if user and user.is_authenticated:
             like = obj.likes.filter(user=user).first()
@@ -135,4 +178,8 @@ class BoardPostUpdateSerializer(serializers.ModelSerializer):
             for att in attachments:
                 att.file.delete(save=False)
                 att.delete()
-        return super().update(instance, validated_data)
\ No newline at end of file
+        # 변경된 필드만 저장 (동시에 갱신되는 추천/댓글/조회수 카운터를 덮어쓰지 않도록)
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=list(validated_data))
+        return instance
\ No newline at end of file
@@ -1,3 +1,390 @@
-from django.test import TestCase
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import F
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from board.models import BoardAttachment, BoardCategory, BoardComment, BoardCommentLike, BoardPost, BoardPostLike, hot_vote_weight
+from board.search import board_post_search
+from board.view_counter import ViewCountBuffer, view_count_buffer
+from config.checks import check_shared_cache
+from config.pagination import ApproximateCountPaginator, KeysetCursorPagination
+
+User = get_user_model()
+
+
+class BoardCounterTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='boarder',
+            email='boarder@example.com',
+            password='pass1234'
+        )
+        self.category = BoardCategory.objects.create(name='자유', slug='free')
+        self.post = BoardPost.objects.create(category=self.category, user=self.user, title='제목', content='내용')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_post_like_toggle_maintains_counters(self):
+        url = f'/api/board/posts/{self.post.id}/like/'
+        self.client.post(url, {'is_like': True}, format='json')
+        self.client.post(url, {'is_like': True}, format='json')
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.like_count, self.post.dislike_count), (1, 0))
+
+        self.client.post(url, {'is_like': False}, format='json')
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.like_count, self.post.dislike_count), (0, 1))
+
+        response = self.client.post(url, {}, format='json')
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post('/api/board/posts/999999/like/', {'is_like': True}, format='json')
+        self.assertEqual(response.status_code, 404)
+
+    def test_comment_list_puts_top_liked_comments_first(self):
+        likes = [0, 12, 3, 30, 11, 20, 0]
+        comments = [
+            BoardComment.objects.create(post=self.post, user=self.user, content=f'댓글 {i}', like_count=count)
+            for i, count in enumerate(likes)
+        ]
+        # 추천 10개 이상 중 상위 3개(30, 20, 12)를 먼저, 나머지는 작성순
+        expected = [comments[i].id for i in (3, 5, 1, 0, 2, 4, 6)]
+        url = f'/api/board/posts/{self.post.id}/comments/'
+        self.assertEqual([c['id'] for c in self.client.get(url).json()['results']], expected)
+
+        # 커서 페이지네이션도 같은 순서로 끝까지 (상위 댓글과 나머지 경계를 넘도록 2개씩)
+        ids, next_url, params = [], url, {'cursor': ''}
+        with mock.patch.object(KeysetCursorPagination, 'page_size', 2):
+            while next_url:
+                body = self.client.get(next_url, params).json()
+                ids += [c['id'] for c in body['results']]
+                next_url, params = body['next'], None
+        self.assertEqual(ids, expected)
+
+    def test_comment_create_delete_and_like_maintain_counters(self):
+        response = self.client.post(f'/api/board/posts/{self.post.id}/comments/', {'content': '댓글'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        comment_id = response.json()['id']
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 1)
+
+        self.client.post(f'/api/board/comments/{comment_id}/like/', {'is_like': False}, format='json')
+        comment = BoardComment.objects.get(pk=comment_id)
+        self.assertEqual((comment.like_count, comment.dislike_count), (0, 1))
+
+        self.client.delete(f'/api/board/comments/{comment_id}/')
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 0)
+
+    def test_post_list_query_count_is_constant(self):
+        def count_list_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get('/api/board/posts/')
+            self.assertEqual(response.status_code, 200)
+            return len(ctx.captured_queries)
+
+        single_post_queries = count_list_queries()
+        for i in range(10):
+            post = BoardPost.objects.create(category=self.category, user=self.user, title=f'글 {i}', content='내용')
+            BoardPostLike.objects.create(user=self.user, post=post, is_like=True)
+        self.assertEqual(count_list_queries(), single_post_queries)
+
+    def test_backfill_command_recounts_rows(self):
+        comment = BoardComment.objects.create(post=self.post, user=self.user, content='댓글')
+        BoardPostLike.objects.create(user=self.user, post=self.post, is_like=True)
+        BoardCommentLike.objects.create(user=self.user, comment=comment, is_like=False)
+        BoardPost.objects.filter(pk=self.post.pk).update(hot_score=999)
+
+        call_command('backfill_board_counters', stdout=StringIO())
+
+        self.post.refresh_from_db()
+        comment.refresh_from_db()
+        self.assertEqual((self.post.like_count, self.post.dislike_count, self.post.comment_count), (1, 0, 1))
+        self.assertEqual((comment.like_count, comment.dislike_count), (0, 1))
+        self.assertAlmostEqual(self.post.hot_score, self.post.hot_base + hot_vote_weight(1, 0))
+
+
+class BoardConditionalGetTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='etag', email='etag@example.com', password='pass1234')
+        category = BoardCategory.objects.create(name='자유', slug='free')
+        self.post = BoardPost.objects.create(category=category, user=self.user, title='제목', content='내용')
+        self.url = f'/api/board/posts/{self.post.id}/'
+        self.client = APIClient()
+        cache.clear()
+        view_count_buffer.flush()
+
+    def test_counters_and_attachments_invalidate_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+
+        member = APIClient()
+        member.force_authenticate(self.user)
+        etags = {etag}
+        member.post(f'/api/board/posts/{self.post.id}/like/', {'is_like': True}, format='json')
+        etags.add(self.client.get(self.url)['ETag'])
+        member.post(f'/api/board/posts/{self.post.id}/comments/', {'content': '댓글'}, format='json')
+        etags.add(self.client.get(self.url)['ETag'])
+        BoardAttachment.objects.create(post=self.post, file='board_attachments/a.png')
+        etags.add(self.client.get(self.url)['ETag'])
+        self.client.post(f'/api/board/posts/{self.post.id}/increment-view/')
+        view_count_buffer.flush()
+        response = self.client.get(self.url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['view_count'], 1)
+        etags.add(response['ETag'])
+        self.assertEqual(len(etags), 5)
+
+
+class BoardHotScoreTest(TestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(username=f'hot{i}', email=f'hot{i}@example.com', password='pass1234')
+            for i in range(2)
+        ]
+        self.category = BoardCategory.objects.create(name='자유', slug='free')
+        self.old_post = BoardPost.objects.create(category=self.category, user=self.users[0], title='오래된 글', content='내용')
+        self.new_post = BoardPost.objects.create(category=self.category, user=self.users[0], title='새 글', content='내용')
+        BoardPost.objects.filter(pk=self.old_post.pk).update(
+            hot_base=F('hot_base') - 1, hot_score=F('hot_score') - 1
+        )
+
+    def like(self, user, post, is_like=True):
+        client = APIClient()
+        client.force_authenticate(user)
+        client.post(f'/api/board/posts/{post.id}/like/', {'is_like': is_like}, format='json')
+
+    def test_like_toggle_updates_hot_score_incrementally(self):
+        for user in self.users:
+            self.like(user, self.old_post)
+        self.old_post.refresh_from_db()
+        self.assertAlmostEqual(self.old_post.hot_score, self.old_post.hot_base + hot_vote_weight(2, 0))
+
+        self.like(self.users[0], self.old_post, is_like=False)
+        self.old_post.refresh_from_db()
+        self.assertAlmostEqual(self.old_post.hot_score, self.old_post.hot_base)
+
+    def test_trending_prefers_recent_posts_at_equal_votes(self):
+        response = self.client.get('/api/board/posts/', {'category': 'trending'})
+        ids = [post['id'] for post in response.json()['results']]
+        self.assertEqual(ids, [self.new_post.id, self.old_post.id])
+
+        # 시간 항 1 = 순추천 10배 → 오래된 글이 순추천 10개를 받으면 동점을 넘어섬
+        BoardPost.objects.filter(pk=self.old_post.pk).update(
+            like_count=20, hot_score=F('hot_base') + hot_vote_weight(20, 0)
+        )
+        self.assertEqual(BoardPost.get_trending_posts().first(), self.old_post)
+
+
+
+class BoardKeysetPaginationTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='pager', email='pager@example.com', password='pass1234')
+        category = BoardCategory.objects.create(name='자유', slug='free')
+        posts = BoardPost.objects.bulk_create([
+            BoardPost(category=category, user=user, title=f'글 {i}', content='내용', like_count=10 + i % 2)
+            for i in range(25)
+        ])
+        # created_at까지 같은 동률 (bulk_create는 같은 시각이 들어가지 않을 수 있으므로 고정)
+        BoardPost.objects.filter(pk__in=[post.pk for post in posts]).update(created_at=posts[0].created_at)
+
+    def test_hot_cursor_walk_breaks_ties_by_id(self):
+        ids, url, params = [], '/api/board/posts/', {'category': 'hot', 'cursor': ''}
+        while url:
+            body = self.client.get(url, params).json()
+            ids += [post['id'] for post in body['results']]
+            url, params = body['next'], None
+        expected = BoardPost.objects.order_by('-like_count', '-created_at', '-id').values_list('id', flat=True)
+        self.assertEqual(ids, list(expected))
+
+    def test_page_number_mode_is_unchanged(self):
+        body = self.client.get('/api/board/posts/', {'page': 2}).json()
+        self.assertEqual((body['count'], len(body['results'])), (25, 5))
+
+    def test_cursor_on_unordered_model_without_created_at(self):
+        # 전역 기본 페이지네이션이므로 created_at이 없고 정렬도 없는 목록도 커서 모드 가능 (-pk 순)
+        BoardCategory.objects.bulk_create([BoardCategory(name=f'분류 {i}', slug=f'c{i}') for i in range(24)])
+        ids, url, params = [], '/api/board/categories/', {'cursor': ''}
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 200)
+            ids += [category['id'] for category in response.json()['results']]
+            url, params = response.json()['next'], None
+        self.assertEqual(ids, list(BoardCategory.objects.order_by('-pk').values_list('id', flat=True)))
+
+
+@override_settings(APPROXIMATE_COUNT={'EXACT_THRESHOLD': 10, 'CACHE_TIMEOUT': 60})
+class BoardApproximateCountTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user(username='counter', email='counter@example.com', password='pass1234')
+        category = BoardCategory.objects.create(name='자유', slug='free')
+        BoardPost.objects.bulk_create([
+            BoardPost(category=category, user=user, title=f'글 {i}', content='내용') for i in range(25)
+        ])
+
+    def get_page(self, page):
+        return self.client.get('/api/board/posts/', {'page': page}).json()
+
+    def test_large_estimate_skips_exact_count_until_last_page(self):
+        with mock.patch.object(ApproximateCountPaginator, 'estimate_count', return_value=100000):
+            with CaptureQueriesContext(connection) as ctx:
+                first = self.get_page(1)
+            last = self.get_page(2)
+        self.assertEqual((first['count'], first['count_is_approximate']), (100000, True))
+        self.assertFalse(any('COUNT(' in query['sql'].upper() for query in ctx.captured_queries))
+        # 마지막 페이지에서는 실제 개수로 보정
+        self.assertEqual((last['count'], last['count_is_approximate'], last['next']), (25, False, None))
+
+    def test_underestimate_still_reaches_real_last_page(self):
+        with mock.patch.object(ApproximateCountPaginator, 'estimate_count', return_value=12):
+            first = self.get_page(1)
+            last = self.get_page(2)
+        self.assertEqual(first['count'], 12)
+        self.assertIsNotNone(first['next'])
+        self.assertEqual(len(last['results']), 5)
+
+    def test_small_estimate_uses_exact_count(self):
+        with mock.patch.object(ApproximateCountPaginator, 'estimate_count', return_value=5):
+            body = self.get_page(1)
+        self.assertEqual((body['count'], body['count_is_approximate']), (25, False))
+        self.assertEqual(self.client.get('/api/board/posts/', {'page': 3}).status_code, 404)
+
+
+class BoardSearchTest(TestCase):
+    def setUp(self):
+        # 프로세스 내 역색인(SQLite 대체 경로)은 테스트 간 롤백을 모르므로 매번 초기화
+        board_post_search.index.reset()
+        alice = User.objects.create_user(username='alice', email='alice@example.com', password='pass1234')
+        bob = User.objects.create_user(username='bob', email='bob@example.com', password='pass1234')
+        free = BoardCategory.objects.create(name='자유', slug='free')
+        movie = BoardCategory.objects.create(name='영화', slug='movie')
+        self.review = BoardPost.objects.create(
+            category=free, user=alice, title='기생충 후기',
+            content='<p>봉준호 감독의 <b>명작</b> 기생충을 드디어 봤습니다</p>',
+        )
+        self.chat = BoardPost.objects.create(category=movie, user=bob, title='오늘의 잡담', content='기생충 이야기 좀 하자')
+        self.english = BoardPost.objects.create(category=free, user=bob, title='Parasite review', content='great movie')
+
+    def search(self, **params):
+        response = self.client.get('/api/board/posts/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['results']
+
+    def ids(self, **params):
+        return [post['id'] for post in self.search(**params)]
+
+    def test_search_types_rank_and_filter_by_category(self):
+        self.assertEqual(self.ids(search_type='title', search='기생충'), [self.review.id])
+        # 제목 일치(가중치 A)가 본문 일치보다 먼저
+        self.assertEqual(self.ids(search_type='title_content', search='기생충'), [self.review.id, self.chat.id])
+        self.assertEqual(self.ids(search_type='title_content', search='기생충', category='movie'), [self.chat.id])
+        self.assertEqual(self.ids(search_type='user', search='ali'), [self.review.id])
+        self.assertEqual(self.ids(search_type='title_content', search='명작'), [self.review.id])
+        self.assertEqual(self.ids(search_type='title', search='parasite'), [self.english.id])
+
+    def test_highlight_snippets(self):
+        post = self.search(search_type='title_content', search='기생충')[0]
+        self.assertEqual(post['search_highlight']['title'], '<mark>기생충</mark> 후기')
+        self.assertIn('<mark>기생충</mark>을 드디어', post['search_highlight']['content'])
+        self.assertNotIn('<p>', post['search_highlight']['content'])
+        self.assertIsNone(self.search()[0]['search_highlight'])
+
+    def test_matches_outside_rank_window_follow_newest_first(self):
+        newest = BoardPost.objects.create(category=self.chat.category, user=self.chat.user, title='기생충 또 봄', content='')
+        params = {'search_type': 'title_content', 'search': '기생충'}
+        # 최신 일치 1개만 순위 계산 → 나머지 일치 글은 결과 / 개수에서 빠지지 않고 그 뒤에 최신순
+        with mock.patch('board.search.RANK_WINDOW', 1):
+            body = self.client.get('/api/board/posts/', params).json()
+        self.assertEqual([post['id'] for post in body['results']], [newest.id, self.chat.id, self.review.id])
+        self.assertEqual(body['count'], 3)
+
+        # 순위 범위 안이면 관련도 순 (제목 + 본문 일치 > 제목 일치 > 본문 일치)
+        self.assertEqual(self.ids(**params), [self.review.id, newest.id, self.chat.id])
+        # 커서 페이지네이션은 최신순
+        self.assertEqual(self.ids(cursor='', **params), [newest.id, self.chat.id, self.review.id])
+
+    def test_search_vector_follows_edits(self):
+        self.chat.title = '괴물 잡담'
+        self.chat.save(update_fields=['title'])
+        self.assertEqual(self.ids(search_type='title', search='괴물'), [self.chat.id])
+        self.assertEqual(self.ids(search_type='title', search='잡담'), [self.chat.id])
+
+@override_settings(BOARD_VIEW_COUNT_BUFFER={'FLUSH_INTERVAL': 0, 'FLUSH_THRESHOLD': 1000, 'DEDUPE_WINDOW': 60})
+class BoardViewCountBufferTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        view_count_buffer.flush()
+        self.user = User.objects.create_user(username='viewer', email='viewer@example.com', password='pass1234')
+        category = BoardCategory.objects.create(name='자유', slug='free')
+        self.post = BoardPost.objects.create(category=category, user=self.user, title='제목', content='내용')
+        self.url = f'/api/board/posts/{self.post.id}/increment-view/'
+
+    def test_repeat_views_are_deduplicated_and_flushed_in_batch(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        self.assertEqual(client.post(self.url).json()['view_count'], 1)
+        self.assertEqual(client.post(self.url).json()['view_count'], 1)
+        APIClient(REMOTE_ADDR='10.0.0.1').post(self.url)
+        APIClient(REMOTE_ADDR='10.0.0.2').post(self.url)
+
+        # 요청 경로에서는 DB에 쓰지 않음
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.view_count, 0)
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(view_count_buffer.flush(), 1)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.view_count, 3)
+
+    def test_missing_post_returns_404(self):
+        self.assertEqual(APIClient().post('/api/board/posts/999999/increment-view/').status_code, 404)
+
+    def test_spoofed_forwarded_for_does_not_bypass_dedupe(self):
+        # 프록시 설정이 없으면 X-Forwarded-For를 무시하고 REMOTE_ADDR 기준
+        for spoofed in ('1.1.1.1', '2.2.2.2', '3.3.3.3'):
+            APIClient(REMOTE_ADDR='10.0.0.1', HTTP_X_FORWARDED_FOR=spoofed).post(self.url)
+        self.assertEqual(view_count_buffer.pending(self.post.id), 1)
+
+    @override_settings(BOARD_VIEW_COUNT_BUFFER={'FLUSH_INTERVAL': 0, 'FLUSH_THRESHOLD': 1000, 'NUM_PROXIES': 1})
+    def test_trusted_proxy_uses_address_it_appended(self):
+        # 프록시가 덧붙인 마지막 항목만 신뢰하므로 클라이언트가 앞에 끼워 넣은 값은 무시됨
+        for spoofed in ('1.1.1.1', '2.2.2.2'):
+            APIClient(REMOTE_ADDR='172.16.0.2', HTTP_X_FORWARDED_FOR=f'{spoofed}, 203.0.113.7').post(self.url)
+        APIClient(REMOTE_ADDR='172.16.0.2', HTTP_X_FORWARDED_FOR='203.0.113.8').post(self.url)
+        self.assertEqual(view_count_buffer.pending(self.post.id), 2)
+
+    def test_workers_share_dedupe_and_add_their_own_deltas(self):
+        # 워커 두 개를 흉내: 같은 조회자는 한 번만, 나머지는 각자 증가분을 더함
+        worker_a, worker_b = ViewCountBuffer(), ViewCountBuffer()
+        self.assertTrue(worker_a.record(self.post.id, 'ip:1'))
+        self.assertFalse(worker_b.record(self.post.id, 'ip:1'))
+        worker_b.record(self.post.id, 'ip:2')
+        worker_b.record(self.post.id, 'ip:3')
+        worker_a.flush()
+        worker_b.flush()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.view_count, 3)
+
+    @override_settings(BOARD_VIEW_COUNT_BUFFER={'FLUSH_INTERVAL': 0, 'FLUSH_THRESHOLD': 2, 'DEDUPE_WINDOW': 60})
+    def test_threshold_triggers_flush(self):
+        buffer = ViewCountBuffer()
+        buffer.record(self.post.id, 'ip:1')
+        buffer.record(self.post.id, 'ip:2')
+        self.assertEqual(buffer.pending(self.post.id), 0)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.view_count, 2)
+
+    def test_process_local_cache_is_reported_at_startup(self):
+        self.assertNotIn('config.W001', [error.id for error in check_shared_cache(None)])
+        with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+            self.assertIn('config.W001', [error.id for error in check_shared_cache(None)])
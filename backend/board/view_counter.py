@@ -0,0 +1,146 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import close_old_connections, connection
+from django.db.models import F
+from django.db.models.functions import Now
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG = {
+    'FLUSH_INTERVAL': 5,        # 주기적 flush 간격(초), 0이면 주기 flush 없음
+    'FLUSH_THRESHOLD': 500,     # 버퍼에 쌓인 조회 수가 이 값을 넘으면 즉시 flush
+    'DEDUPE_WINDOW': 60 * 30,   # 같은 사용자/IP의 재조회를 무시할 시간(초)
+    'CACHE_ALIAS': 'default',   # 중복 조회 판별에 사용할 캐시 (여러 워커가 공유하는 백엔드 권장)
+    'NUM_PROXIES': 0,           # 앞단의 신뢰하는 프록시 수, 0이면 X-Forwarded-For를 무시하고 REMOTE_ADDR만 사용
+}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'BOARD_VIEW_COUNT_BUFFER', {})}
+
+
+def get_client_ip(request, num_proxies):
+    """
+    X-Forwarded-For는 클라이언트가 마음대로 보낼 수 있으므로 신뢰하는 프록시(num_proxies개)가
+    덧붙인 마지막 항목들만 사용합니다. 맨 앞 항목을 쓰면 헤더를 바꿔 보내는 것만으로 중복 판별을 우회할 수 있음
+    """
+    forwarded = request.META.get('HTTP_X_FORWARDED_FOR')
+    if num_proxies and forwarded:
+        addrs = [addr.strip() for addr in forwarded.split(',')]
+        return addrs[-min(num_proxies, len(addrs))]
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def get_viewer_key(request):
+    """로그인 사용자는 id, 비로그인 사용자는 IP 기준으로 조회자를 구분"""
+    if request.user and request.user.is_authenticated:
+        return f"user:{request.user.id}"
+    return f"ip:{get_client_ip(request, get_config()['NUM_PROXIES'])}"
+
+
+class ViewCountBuffer:
+    """
+    게시글 조회수 증가분을 프로세스 메모리에 모았다가
+    UPDATE ... SET view_count = view_count + n 으로 묶어서 반영하는 버퍼.
+
+    - 중복 조회는 공유 캐시의 add()로 판별하므로 여러 워커 프로세스 사이에서도 한 번만 집계됨
+      (CACHE_ALIAS가 LocMem 같은 프로세스별 캐시면 시작 시 config.W001 경고)
+    - 각 워커는 자신이 받은 증가분만 더하므로(덮어쓰기 없음) 프로세스가 여러 개여도 이중 집계되지 않음
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._pending = Counter()
+        self._timer = None
+
+    def _ensure_process(self):
+        # fork된 워커는 부모의 버퍼/락/타이머 스레드를 물려받지 않도록 새로 초기화
+        if self._pid != os.getpid():
+            self._reset()
+
+    def record(self, post_id, viewer_key):
+        """
+        조회 1건을 기록합니다. 중복 조회 기간 내 재조회면 False를 반환합니다.
+        """
+        self._ensure_process()
+        config = get_config()
+        cache = caches[config['CACHE_ALIAS']]
+        if not cache.add(f"board:view:{post_id}:{viewer_key}", 1, timeout=config['DEDUPE_WINDOW']):
+            return False
+
+        with self._lock:
+            self._pending[post_id] += 1
+            should_flush = sum(self._pending.values()) >= config['FLUSH_THRESHOLD']
+        if should_flush:
+            self.flush()
+        else:
+            self._start_timer(config['FLUSH_INTERVAL'])
+        return True
+
+    def pending(self, post_id):
+        """아직 DB에 반영되지 않은 게시글의 조회수 증가분"""
+        self._ensure_process()
+        with self._lock:
+            return self._pending.get(post_id, 0)
+
+    def flush(self):
+        """
+        버퍼를 비우고 증가분이 같은 게시글끼리 묶어 UPDATE 합니다.
+        반영한 게시글 수를 반환하며, 실패 시 증가분을 버퍼에 되돌립니다.
+        """
+        from .models import BoardPost
+
+        self._ensure_process()
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+        if not pending:
+            return 0
+
+        by_increment = defaultdict(list)
+        for post_id, increment in pending.items():
+            by_increment[increment].append(post_id)
+        try:
+            for increment, post_ids in by_increment.items():
+                BoardPost.objects.filter(pk__in=post_ids).update(
+                    view_count=F('view_count') + increment, updated_at=Now()
+                )
+        except Exception:
+            logger.exception("게시글 조회수 flush 실패, 증가분을 버퍼에 되돌립니다.")
+            with self._lock:
+                self._pending.update(pending)
+            return 0
+        return len(pending)
+
+    def _start_timer(self, interval):
+        if not interval or self._timer is not None:
+            return
+        with self._lock:
+            if self._timer is not None:
+                return
+            self._timer = threading.Thread(target=self._run_timer, args=(interval,), daemon=True)
+            self._timer.start()
+
+    def _run_timer(self, interval):
+        while True:
+            time.sleep(interval)
+            close_old_connections()
+            try:
+                self.flush()
+            finally:
+                # 백그라운드 스레드 전용 DB 연결 정리
+                connection.close()
+
+
+view_count_buffer = ViewCountBuffer()
+atexit.register(view_count_buffer.flush)
@@ -4,8 +4,11 @@ from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.parsers import MultiPartParser, FormParser
-from django.shortcuts import get_object_or_404
-from django.db.models import Count, Q
+from django.http import Http404
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Now
+from rest_framework import serializers
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
@@ -14,28 +17,75 @@ from .models import (
     BoardCategory, BoardAttachment
 )
 from .serializers import (
-    BoardPostSerializer, BoardCommentSerializer,
+    BoardPostSerializer, BoardCommentSerializer, PublicBoardPostSerializer,
     BoardPostUpdateSerializer, BoardCategorySerializer
 )
+from config.conditional import ConditionalGetMixin
+from config.pagination import ApproximateCountPagination
 from reviews.permissions import IsOwnerOrReadOnly
+from .search import SEARCH_TYPE_WEIGHTS, SEARCH_TYPES, rank_posts, search_posts
+from .view_counter import get_viewer_key, view_count_buffer
+
+
+def set_like_state(target_model, like_model, target_field, user, target_id, is_like, extra_updates=None):
+    """
+    대상(게시글/댓글) 행을 잠근 뒤 사용자의 추천/비추천 상태를 반영하고,
+    이전 상태 기준의 증감만 like_count / dislike_count에 F()로 반영합니다.
+    extra_updates(like_expr, dislike_expr)가 주어지면 갱신 후 카운터 기준의 추가 컬럼도 같은 UPDATE로 갱신합니다.
+    """
+    with transaction.atomic():
+        if not target_model.objects.select_for_update().filter(pk=target_id).exists():
+            raise target_model.DoesNotExist
+
+        lookup = {'user': user, f'{target_field}_id': target_id}
+        previous = like_model.objects.filter(**lookup).values_list('is_like', flat=True).first()
+        if previous == is_like:
+            return
+
+        deltas = {'like_count': 0, 'dislike_count': 0}
+        if previous is None:
+            like_model.objects.create(is_like=is_like, **lookup)
+        else:
+            like_model.objects.filter(**lookup).update(is_like=is_like)
+            deltas['like_count' if previous else 'dislike_count'] -= 1
+        deltas['like_count' if is_like else 'dislike_count'] += 1
+
+        updates = {field: F(field) + delta for field, delta in deltas.items()}
+        if extra_updates:
+            # UPDATE의 SET 우변은 갱신 전 값을 참조하므로 증감을 더한 표현식을 넘김
+            updates.update(extra_updates(updates['like_count'], updates['dislike_count']))
+        target_model.objects.filter(pk=target_id).update(**updates)
 
 
 # ✅ 게시글 목록 조회 + 작성
 class BoardPostListCreateView(generics.ListCreateAPIView):
-    queryset = BoardPost.objects.all().order_by('-created_at').prefetch_related('attachments')
-    serializer_class = BoardPostSerializer
+    queryset = (
+        BoardPost.objects.all().order_by('-created_at')
+        .defer('search_vector')
+        .select_related('user', 'category')
+        .prefetch_related('attachments')
+    )
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    # 게시글이 많으면 전체 개수(count)는 근사치 (count_is_approximate로 구분)
+    pagination_class = ApproximateCountPagination
+
+    def get_serializer_class(self):
+        # 목록은 사용자와 무관한 본문 (내 추천 여부는 /api/me/reactions/), 작성 응답은 상세와 같은 형태
+        if self.request.method == 'GET':
+            return PublicBoardPostSerializer
+        return BoardPostSerializer
 
     @swagger_auto_schema(
         operation_summary="게시글 목록 조회",
         operation_description="전체 커뮤니티 게시글 목록을 최신순으로 반환합니다. 카테고리별로 게시글을 필터링할 수 있습니다.",
         manual_parameters=[
-            openapi.Parameter('category', openapi.IN_QUERY, description="카테고리 필터링 (예: '영화', '드라마', 'hot')", type=openapi.TYPE_STRING),
+            openapi.Parameter('category', openapi.IN_QUERY, description="카테고리 필터링 (예: '영화', '드라마', 'hot', 'trending')", type=openapi.TYPE_STRING),
             openapi.Parameter('search_type', openapi.IN_QUERY, description="검색 타입 (title, title_content, user)", type=openapi.TYPE_STRING),
-            openapi.Parameter('search', openapi.IN_QUERY, description="검색어", type=openapi.TYPE_STRING),
+            openapi.Parameter('search', openapi.IN_QUERY, description="검색어 (관련도 순 정렬, cursor 사용 시 최신순 / 응답의 search_highlight에 <mark> 하이라이트)", type=openapi.TYPE_STRING),
             openapi.Parameter('page', openapi.IN_QUERY, description="페이지 번호", type=openapi.TYPE_INTEGER),
+            openapi.Parameter('cursor', openapi.IN_QUERY, description="커서 (값이 있으면 page 대신 키셋 페이지네이션, 빈 값이면 첫 페이지)", type=openapi.TYPE_STRING),
         ],
-        responses={200: BoardPostSerializer(many=True)}
+        responses={200: PublicBoardPostSerializer(many=True)}
     )
     def get(self, request, *args, **kwargs):
         category_slug = self.request.query_params.get('category')
@@ -44,27 +94,40 @@ class BoardPostListCreateView(generics.ListCreateAPIView):
 
         if category_slug:
             if category_slug == 'hot':
-                queryset = queryset.annotate(
-                    like_count=Count('likes', filter=Q(likes__is_like=True))
-                ).filter(
+                queryset = queryset.filter(
                     like_count__gte=min_like_count
                 ).order_by('-like_count', '-created_at')
+            elif category_slug == 'trending':
+                # 시간 감쇠 핫 점수 순 (board_post_hot_score_idx 인덱스 스캔)
+                queryset = queryset.order_by('-hot_score')
             else:
-                queryset = queryset.filter(category__slug=category_slug)
-
+                # 슬러그를 먼저 id로 바꿔서 필터 (카테고리 조인이면 플래너가 글 수를 몰라
+                # (category_id, created_at) 인덱스 대신 전체 스캔 + 정렬을 고를 수 있음, 검색 시 100만 건에서 약 3초)
+                category_id = BoardCategory.objects.filter(slug=category_slug).values_list('id', flat=True).first()
+                queryset = queryset.filter(category_id=category_id) if category_id else queryset.none()
+
+        # 전문 검색 (search_vector GIN 인덱스) - 카테고리 필터와 같은 쿼리에서 처리
+        # hot/trending이 아니면 관련도 순(최신 일치 글 안에서 순위, 나머지는 그 뒤에 최신순)으로 정렬하고,
+        # 응답에 하이라이트 스니펫을 포함 / 커서 페이지네이션은 관련도 위치를 키로 쓸 수 없으므로 최신순
         search_type = self.request.query_params.get("search_type")
-        search = self.request.query_params.get("search")
-        if search_type and search:
-            if search_type == "title":
-                queryset = queryset.filter(title__icontains=search)
-            elif search_type == "title_content":
-                queryset = queryset.filter(Q(title__icontains=search) | Q(content__icontains=search))
-            elif search_type == "user":
-                queryset = queryset.filter(user__username__icontains=search)
+        search = (self.request.query_params.get("search") or '').strip()
+        self.search_query = None
+        if search_type in SEARCH_TYPES and search:
+            cursor_mode = self.paginator.cursor_pagination_class.cursor_query_param in self.request.query_params
+            if search_type in SEARCH_TYPE_WEIGHTS and category_slug not in ('hot', 'trending') and not cursor_mode:
+                queryset = rank_posts(queryset, search, search_type)
+            else:
+                queryset = search_posts(queryset, search, search_type)
+            self.search_query = search
 
         self.queryset = queryset
         return super().get(request, *args, **kwargs)
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['search_query'] = getattr(self, 'search_query', None)
+        return context
+
     def perform_create(self, serializer):
         post = serializer.save(user=self.request.user)
         for file in self.request.FILES.getlist('media'):
@@ -72,7 +135,7 @@ class BoardPostListCreateView(generics.ListCreateAPIView):
 
 
 # ✅ 게시글 상세 조회 / 수정 / 삭제
-class BoardPostDetailView(generics.RetrieveUpdateDestroyAPIView):
+class BoardPostDetailView(ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = BoardPost.objects.all()
     parser_classes = [MultiPartParser, FormParser]
 
@@ -122,13 +185,16 @@ class BoardPostDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 
 # ✅ 게시글 조회수 증가 전용 API
+# - 같은 사용자/IP의 반복 조회는 일정 시간 동안 한 번만 집계
+# - 증가분은 프로세스 버퍼에 모았다가 주기적으로/임계치 도달 시 묶어서 DB에 반영
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def increment_post_view_count(request, pk):
-    post = get_object_or_404(BoardPost, pk=pk)
-    post.view_count = (post.view_count or 0) + 1
-    post.save(update_fields=["view_count"])
-    return Response({"status": "ok", "view_count": post.view_count})
+    view_count = BoardPost.objects.filter(pk=pk).values_list('view_count', flat=True).first()
+    if view_count is None:
+        raise Http404
+    view_count_buffer.record(pk, get_viewer_key(request))
+    return Response({"status": "ok", "view_count": view_count + view_count_buffer.pending(pk)})
 
 
 # ✅ 댓글 목록 조회 + 작성
@@ -137,14 +203,7 @@ class BoardCommentListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
     def get_queryset(self):
-        post_id = self.kwargs['post_id']
-        top_comments = BoardComment.objects.filter(post_id=post_id).annotate(
-            like_count=Count('likes', filter=Q(likes__is_like=True))
-        ).filter(like_count__gte=10).order_by('-like_count')[:3]
-
-        other_comments = BoardComment.objects.filter(post_id=post_id).exclude(id__in=top_comments).order_by('created_at')
-
-        return top_comments | other_comments
+        return BoardComment.get_sorted_comments(self.kwargs['post_id']).select_related('user')
 
     @swagger_auto_schema(
         operation_summary="댓글 목록 조회",
@@ -156,7 +215,9 @@ class BoardCommentListCreateView(generics.ListCreateAPIView):
 
     def perform_create(self, serializer):
         post_id = self.kwargs['post_id']
-        serializer.save(user=self.request.user, post_id=post_id)
+        with transaction.atomic():
+            serializer.save(user=self.request.user, post_id=post_id)
+            BoardPost.objects.filter(pk=post_id).update(comment_count=F('comment_count') + 1, updated_at=Now())
 
 
 # ✅ 댓글 삭제
@@ -169,19 +230,26 @@ class BoardCommentDestroyView(generics.DestroyAPIView):
     def delete(self, request, *args, **kwargs):
         return super().delete(request, *args, **kwargs)
 
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            post_id = instance.post_id
+            instance.delete()
+            BoardPost.objects.filter(pk=post_id).update(comment_count=F('comment_count') - 1, updated_at=Now())
+
 
 # ✅ 게시글 추천/비추천
 class BoardPostLikeToggleView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, pk):
-        post = get_object_or_404(BoardPost, pk=pk)
-        is_like = request.data.get('is_like')
-
-        BoardPostLike.objects.update_or_create(
-            user=request.user, post=post,
-            defaults={'is_like': is_like}
-        )
+        is_like = serializers.BooleanField().run_validation(request.data.get('is_like'))
+        try:
+            set_like_state(
+                BoardPost, BoardPostLike, 'post', request.user, pk, is_like,
+                extra_updates=BoardPost.like_toggle_updates,
+            )
+        except BoardPost.DoesNotExist:
+            raise Http404
         return Response({'status': 'updated', 'is_like': is_like})
 
 
@@ -195,13 +263,11 @@ class BoardCommentLikeToggleView(APIView):
         responses={200: openapi.Response(description="추천/비추천 상태 업데이트됨", examples={"application/json": {"status": "updated", "is_like": True}})}
     )
     def post(self, request, pk):
-        comment = get_object_or_404(BoardComment, pk=pk)
-        is_like = request.data.get('is_like')
-
-        BoardCommentLike.objects.update_or_create(
-            user=request.user, comment=comment,
-            defaults={'is_like': is_like}
-        )
+        is_like = serializers.BooleanField().run_validation(request.data.get('is_like'))
+        try:
+            set_like_state(BoardComment, BoardCommentLike, 'comment', request.user, pk, is_like)
+        except BoardComment.DoesNotExist:
+            raise Http404
         return Response({'status': 'updated', 'is_like': is_like})
 
 
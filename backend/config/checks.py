@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+# ---------------------------------------------------------------------
+# ✅ 공유 캐시 점검 (시작 시 시스템 체크)
+# 아래 기능은 캐시를 워커 프로세스 사이의 조정 수단으로 사용하므로
+# 프로세스별 캐시(LocMem/Dummy)에 두면 워커마다 따로 동작함
+# ---------------------------------------------------------------------
+PROCESS_LOCAL_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+# 설정 이름 → (기능, 공유되지 않을 때 생기는 문제)
+SHARED_CACHE_FEATURES = {
+    'BOARD_VIEW_COUNT_BUFFER': ('게시글 조회수 버퍼', '같은 조회자가 워커마다 한 번씩 집계됨'),
+    'RESPONSE_CACHE': ('응답 캐시', '쓰기를 처리한 워커의 버전 카운터만 올라가 다른 워커는 TIMEOUT 동안 이전 응답을 보냄'),
+    'MOVIE_NEIGHBORS': ('유사 영화 계산 잠금', '여러 워커와 build_movie_neighbors가 같은 종류를 동시에 계산해 movie_neighbor_unique_rank 충돌이 남'),
+    'STALE_RESPONSE_CACHE': ('상세 응답 캐시', '재생성 잠금이 워커마다 따로 잡혀 같은 상세 응답을 워커 수만큼 동시에 다시 만듦'),
+}
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    errors = []
+    for setting_name, (feature, problem) in SHARED_CACHE_FEATURES.items():
+        config = getattr(settings, setting_name, {})
+        if not config.get('ENABLED', True):
+            continue
+        alias = config.get('CACHE_ALIAS', 'default')
+        backend = settings.CACHES.get(alias, {}).get('BACKEND')
+        if backend in PROCESS_LOCAL_BACKENDS:
+            errors.append(Warning(
+                f"{feature}({setting_name})가 프로세스별 캐시 '{alias}'({backend})를 사용합니다.",
+                hint=f"여러 워커 프로세스로 운영하면 {problem}. Redis나 DB 캐시처럼 공유되는 캐시 별칭을 지정하세요.",
+                id='config.W001',
+            ))
+    return errors
@@ -0,0 +1,95 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlencode
+
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+
+# ---------------------------------------------------------------------
+# ✅ 상세 조회 조건부 GET (ETag / Last-Modified → 304)
+# - 검증값: 응답에 보이는 값이 바뀔 때마다 갱신되는 updated_at
+# - If-None-Match / If-Modified-Since가 있을 때만 직렬화 전에 PK 조회 한 번으로 검증값을 읽어 304 판단
+#   (조건 헤더가 없는 요청은 본 조회에서 함께 읽은 값을 쓰므로 쿼리가 늘지 않음)
+# - ETag: W/"<updated_at 마이크로초>-<사용자 id>" (my_vote / is_owner / my_like 등 사용자별 필드가 있으면 사용자 포함,
+#   vary_on_user = False인 뷰는 누가 요청해도 같은 응답이므로 사용자 0,
+#   쿼리 파라미터가 있으면 정렬한 파라미터의 해시를 덧붙여 파라미터가 다른 응답끼리 ETag가 겹치지 않도록)
+# - Last-Modified는 초 단위라 같은 초 안의 변경을 놓칠 수 있음 → If-None-Match가 있으면 그것만 비교 (RFC 9110)
+# - 작성자 이름 / 카테고리 이름처럼 다른 테이블에서 가져오는 값의 변경은 검증값에 반영되지 않음
+# ---------------------------------------------------------------------
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+CONDITIONAL_HEADERS = ('HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE')
+
+
+def normalized_query(request):
+    """쿼리 파라미터를 이름 / 값 순으로 정렬한 문자열 (순서만 다른 요청은 같은 값)"""
+    return urlencode(sorted((key, value) for key, values in request.GET.lists() for value in values))
+
+
+def make_etag(last_modified, user_id=None, query=''):
+    tag = f"{(last_modified - EPOCH) // timedelta(microseconds=1)}-{user_id or 0}"
+    if query:
+        tag += f"-{hashlib.sha1(query.encode()).hexdigest()[:12]}"
+    return f'W/"{tag}"'
+
+
+class ConditionalGetMixin:
+    """
+    상세 조회 APIView 믹스인 (뷰의 get()이 super().get()을 호출하면 동작)
+
+    - last_modified_field: get_queryset()의 필드 / 별칭 이름 (없는 객체면 원래 흐름으로 404)
+    - vary_on_user: 응답에 사용자별 필드가 있는지 (ETag에 사용자 포함 + Vary: Cookie, Authorization)
+    - 304는 get_object()의 객체 권한 확인 / 직렬화 전에 반환하므로, 객체 권한이 있는 뷰는
+      get_last_modified_queryset()을 같은 조건으로 좁혀야 함 (조회 못 하는 객체는 원래 흐름으로 403/404)
+    """
+    last_modified_field = 'updated_at'
+    vary_on_user = True
+
+    def get_last_modified_queryset(self):
+        return self.get_queryset()
+
+    def get_last_modified(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        return (
+            self.get_last_modified_queryset()
+            .filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+            .values_list(self.last_modified_field, flat=True)
+            .first()
+        )
+
+    def get_object(self):
+        obj = super().get_object()
+        self.last_modified = getattr(obj, self.last_modified_field)
+        return obj
+
+    def get(self, request, *args, **kwargs):
+        # 미리 읽은 검증값은 뒤의 믹스인(config/stale_cache.py)도 재사용
+        self.last_modified = None
+        if any(header in request.META for header in CONDITIONAL_HEADERS):
+            self.last_modified = last_modified = self.get_last_modified()
+            if last_modified is not None:
+                response = get_conditional_response(
+                    request,
+                    etag=self.get_etag(last_modified),
+                    last_modified=int(last_modified.timestamp()),
+                )
+                if response is not None:
+                    return self.set_validators(response, last_modified)
+
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200 and self.last_modified is not None:
+            self.set_validators(response, self.last_modified)
+        return response
+
+    def get_etag(self, last_modified):
+        return make_etag(
+            last_modified,
+            self.request.user.pk if self.vary_on_user else None,
+            normalized_query(self.request),
+        )
+
+    def set_validators(self, response, last_modified):
+        response['ETag'] = self.get_etag(last_modified)
+        response['Last-Modified'] = http_date(int(last_modified.timestamp()))
+        if self.vary_on_user:
+            patch_vary_headers(response, ('Cookie', 'Authorization'))
+        return response
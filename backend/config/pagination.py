@@ -0,0 +1,280 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+
+
+# ---------------------------------------------------------------------
+# ✅ 키셋(커서) 페이지네이션
+# - 커서에 마지막 행의 정렬 키 값 전체(+ id)를 담아 WHERE (정렬키, id) < (..) 로 다음 페이지를 조회
+# - OFFSET을 쓰지 않으므로 몇 번째 페이지든 첫 페이지와 같은 인덱스 범위 스캔 비용
+# - DRF CursorPagination은 첫 정렬 필드만 위치로 쓰고 동률은 OFFSET으로 건너뛰므로
+#   like_count=0처럼 동률이 많은 정렬에서는 다시 느려짐 → 모든 정렬 키를 위치로 사용
+# ---------------------------------------------------------------------
+class KeysetCursorPagination(CursorPagination):
+    ordering = ('-pk',)     # 정렬이 없는 쿼리셋용 (전역 기본 페이지네이션이므로 모든 모델에 있는 필드만)
+    tiebreaker = 'id'
+
+    def get_ordering(self, request, queryset, view):
+        """
+        필터 백엔드(OrderingFilter, 검색 관련도 정렬 등)가 적용된 쿼리셋의 order_by → 모델 Meta.ordering →
+        기본 ordering 순으로 정렬을 정하고, 마지막에 id를 붙여 정렬 키가 항상 유일하도록 만듭니다.
+        """
+        ordering = queryset.query.order_by or self._model_ordering(queryset) or self.ordering
+        if isinstance(ordering, str):
+            ordering = (ordering,)
+
+        ordering = tuple(ordering)
+        if not any(field.lstrip('-') in (self.tiebreaker, 'pk') for field in ordering):
+            descending = ordering and ordering[0].startswith('-')
+            ordering += (f"-{self.tiebreaker}" if descending else self.tiebreaker,)
+        return ordering
+
+    @staticmethod
+    def _model_ordering(queryset):
+        # 커서 위치로 쓸 수 있는 필드 이름 정렬만 (F() / 표현식 정렬은 기본 ordering으로)
+        ordering = queryset.query.get_meta().ordering if queryset.query.default_ordering else ()
+        return ordering if all(isinstance(field, str) for field in ordering) else ()
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse = bool(self.cursor and self.cursor.reverse)
+
+        if reverse:
+            queryset = queryset.order_by(*[_invert(field) for field in self.ordering])
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if self.cursor is not None:
+            values = self._decode_position(queryset, self.cursor.position)
+            queryset = queryset.filter(self._keyset_filter(values, reverse))
+
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_more = len(results) > self.page_size
+
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.cursor is not None
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=self._encode_position(self.page[-1])))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=self._encode_position(self.page[0])))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        cursor = super().decode_cursor(request)
+        if cursor.position is None:
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    # --- 정렬 키 <-> 커서 위치 변환 ---------------------------------------
+
+    def _encode_position(self, instance):
+        values = []
+        for field in self.ordering:
+            name = field.lstrip('-')
+            value = getattr(instance, 'pk' if name == 'pk' else name)
+            values.append(value.isoformat() if hasattr(value, 'isoformat') else value)
+        return json.dumps(values, separators=(',', ':'), ensure_ascii=False)
+
+    def _decode_position(self, queryset, position):
+        try:
+            values = json.loads(position)
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                self._field_for(queryset, field.lstrip('-')).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+    @staticmethod
+    def _field_for(queryset, name):
+        annotation = queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        if name == 'pk':
+            return queryset.model._meta.pk
+        return queryset.model._meta.get_field(name)
+
+    def _keyset_filter(self, values, reverse):
+        """
+        (a, b, id) 다음 위치 조건을 정렬 방향별로 펼칩니다.
+          a < va OR (a = va AND (b < vb OR (b = vb AND id < vid)))
+        첫 필드에는 a <= va 조건을 중복으로 붙여 DB가 인덱스 범위 스캔을 시작할 수 있도록 합니다.
+        """
+        condition = None
+        for field, value in reversed(list(zip(self.ordering, values))):
+            descending = field.startswith('-') != reverse
+            name = field.lstrip('-')
+            after = Q(**{f"{name}__{'lt' if descending else 'gt'}": value})
+            condition = after if condition is None else after | (Q(**{name: value}) & condition)
+
+        first, first_value = self.ordering[0], values[0]
+        first_descending = first.startswith('-') != reverse
+        bound = Q(**{f"{first.lstrip('-')}__{'lte' if first_descending else 'gte'}": first_value})
+        return bound & condition
+
+
+def _invert(field):
+    return field[1:] if field.startswith('-') else f"-{field}"
+
+
+# ---------------------------------------------------------------------
+# ✅ 페이지 번호 / 커서 겸용 페이지네이션
+# - cursor 파라미터가 있으면 키셋 커서 기반 (빈 값이면 첫 페이지부터)
+# - 없으면 기존 페이지 번호 기반 (page/count를 쓰는 기존 화면 호환)
+# ---------------------------------------------------------------------
+class CursorOrPageNumberPagination(PageNumberPagination):
+    cursor_pagination_class = KeysetCursorPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+        if self.cursor_pagination_class.cursor_query_param in request.query_params:
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+# ---------------------------------------------------------------------
+# ✅ 근사 전체 개수 페이지네이션 (옵트인)
+# - 실행 계획 추정치(EXPLAIN)가 임계치 미만이면 정확한 COUNT(*) (작은 목록은 항상 정확)
+# - 임계치 이상이면 추정치를 잠시 캐시해 사용 → 큰 목록에서 매 요청 전체 스캔을 하지 않음
+# - 다음 페이지 여부는 개수가 아닌 page_size + 1 조회로 판단하므로 추정치가 틀려도 끝까지 이동 가능
+# ---------------------------------------------------------------------
+DEFAULT_APPROXIMATE_COUNT = {
+    'EXACT_THRESHOLD': 10000,   # 추정치가 이 값 미만이면 정확한 COUNT(*) 실행
+    'CACHE_TIMEOUT': 60,        # 추정치 캐시 시간(초)
+    'CACHE_ALIAS': 'default',
+}
+
+
+def get_approximate_count_config():
+    return {**DEFAULT_APPROXIMATE_COUNT, **getattr(settings, 'APPROXIMATE_COUNT', {})}
+
+
+class ApproximateCountPage(Page):
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+    def next_page_number(self):
+        return self.number + 1
+
+
+class ApproximateCountPaginator(Paginator):
+    is_approximate = False
+
+    @property
+    def count(self):
+        if '_count' not in self.__dict__:
+            self._count = self.compute_count()
+        return self._count
+
+    def compute_count(self):
+        config = get_approximate_count_config()
+        estimate = self.estimate_count()
+        if estimate is None or estimate < config['EXACT_THRESHOLD']:
+            return super().count
+
+        cache = caches[config['CACHE_ALIAS']]
+        key = self.cache_key()
+        count = cache.get(key)
+        if count is None:
+            count = estimate
+            cache.set(key, count, config['CACHE_TIMEOUT'])
+        self.is_approximate = True
+        return count
+
+    def estimate_count(self):
+        """PostgreSQL 실행 계획의 예상 행 수 (다른 DB는 None → 정확한 COUNT)"""
+        queryset = self.object_list
+        if connections[queryset.db].vendor != 'postgresql':
+            return None
+        plan = json.loads(queryset.order_by().values('pk').explain(format='json'))
+        return int(plan[0]['Plan']['Plan Rows'])
+
+    def cache_key(self):
+        sql, params = self.object_list.order_by().values('pk').query.sql_with_params()
+        digest = hashlib.sha1(f"{sql}|{params}".encode()).hexdigest()
+        return f"pagination:count:{digest}"
+
+    def validate_number(self, number):
+        # 추정 개수가 실제보다 작을 수 있으므로 마지막 페이지 초과 여부는 검사하지 않음
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_('That page number is not an integer'))
+        if number < 1:
+            raise EmptyPage(_('That page number is less than 1'))
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        has_next = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if not rows and number > 1:
+            raise EmptyPage(_('That page contains no results'))
+        if not has_next:
+            # 마지막 페이지에 도달했다면 정확한 개수를 알 수 있음
+            self._count = bottom + len(rows)
+            self.is_approximate = False
+        return ApproximateCountPage(rows, number, self, has_next)
+
+
+class ApproximateCountPagination(CursorOrPageNumberPagination):
+    django_paginator_class = ApproximateCountPaginator
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return Response({
+            'count': self.page.paginator.count,
+            'count_is_approximate': self.page.paginator.is_approximate,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['count_is_approximate'] = {'type': 'boolean'}
+        return response_schema
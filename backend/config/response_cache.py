@@ -0,0 +1,192 @@
+import hashlib
+import threading
+import time
+from collections import defaultdict, deque
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+# ---------------------------------------------------------------------
+# ✅ 비로그인 GET 응답 캐시 (버전 카운터 기반 무효화)
+# - 키: 뷰 이름 + 호스트 + 정규화한 쿼리 (뷰가 쓰는 파라미터만, 앞뒤 공백 제거, ID 목록은 정렬/중복 제거)
+# - 값: 직렬화된 응답 데이터 + 의존하는 버전 카운터 이름/값
+#   → 조회 때 카운터들을 한 번에 읽어 저장 당시와 다르면 미스 (쓰기 쪽은 카운터만 올리고 키를 찾아 지우지 않음)
+# - 목록 전체가 의존하는 카운터는 DB 조회 전에 읽어 두므로, 조회 도중 커밋된 변경은 다음 요청에서 미스
+#   (결과에 포함된 항목별 카운터는 조회 후에 읽으므로 그 사이 커밋된 변경은 TIMEOUT 동안 보일 수 있음)
+# - 카운터는 쓰기 직후와 커밋 직후 두 번 올림 (같은 트랜잭션 안의 조회 + 커밋 전 옛 데이터를 저장하는 경쟁 모두 처리)
+# - 카운터가 캐시에서 밀려나면 현재 시각(ns)으로 다시 시작 → 이전 값으로 저장된 항목이 되살아나지 않음
+# - 버전 카운터는 모든 워커가 같은 값을 봐야 하므로 CACHE_ALIAS는 공유 캐시(Redis/DB 캐시, settings.CACHES)
+#   프로세스별 캐시(LocMem 등)로 지정하면 시작 시 config.W001 경고
+# ---------------------------------------------------------------------
+DEFAULT_CONFIG = {
+    'ENABLED': True,
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 300,             # 응답 항목 유지 시간(초), 버전 카운터는 만료 없음
+    'LATENCY_SAMPLES': 1000,    # 지연 시간 백분위 계산에 쓰는 최근 표본 수 (워커별, 결과 종류별)
+}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'RESPONSE_CACHE', {})}
+
+
+def get_cache():
+    return caches[get_config()['CACHE_ALIAS']]
+
+
+def version_key(name):
+    return f"response_cache:version:{name}"
+
+
+def get_versions(names):
+    """버전 카운터 값들을 이름 순서대로 튜플로 (없는 카운터는 현재 시각으로 시작)"""
+    if not names:
+        return ()
+    cache = get_cache()
+    keys = [version_key(name) for name in names]
+    values = cache.get_many(keys)
+    for key in keys:
+        if key not in values:
+            cache.add(key, time.time_ns(), None)
+            values[key] = cache.get(key)
+    return tuple(values[key] for key in keys)
+
+
+def _increment(names):
+    cache = get_cache()
+    for name in names:
+        try:
+            cache.incr(version_key(name))
+        except ValueError:
+            cache.add(version_key(name), time.time_ns(), None)
+
+
+def bump_versions(*names):
+    """버전 카운터를 지금 한 번, 커밋 후 한 번 올려 이 카운터에 의존하는 캐시 항목을 무효화"""
+    _increment(names)
+    transaction.on_commit(lambda: _increment(names))
+
+
+class ResponseCacheStats:
+    """워커별 캐시 결과 수 / 지연 시간 표본 (X-Cache 헤더와 /api/cache-stats/로 노출)"""
+
+    OUTCOMES = ('hit', 'miss', 'stale', 'bypass')
+    CACHED_OUTCOMES = ('hit',)      # 적중률 분자 (분모는 bypass를 뺀 전체)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counts = defaultdict(lambda: dict.fromkeys(self.OUTCOMES, 0))
+            self._samples = defaultdict(lambda: deque(maxlen=get_config()['LATENCY_SAMPLES']))
+
+    def record(self, namespace, outcome, elapsed_ms):
+        with self._lock:
+            self._counts[namespace][outcome] += 1
+            self._samples[(namespace, outcome)].append(elapsed_ms)
+
+    def snapshot(self):
+        with self._lock:
+            counts = {namespace: dict(values) for namespace, values in self._counts.items()}
+            samples = {key: sorted(values) for key, values in self._samples.items()}
+        result = {}
+        for namespace, values in counts.items():
+            lookups = sum(count for outcome, count in values.items() if outcome != 'bypass')
+            cached = sum(values[outcome] for outcome in self.CACHED_OUTCOMES)
+            latency = {}
+            for outcome in self.OUTCOMES:
+                data = samples.get((namespace, outcome))
+                if data:
+                    latency[outcome] = {
+                        'p50': round(data[len(data) // 2], 2),
+                        'p95': round(data[min(int(len(data) * 0.95), len(data) - 1)], 2),
+                        'samples': len(data),
+                    }
+            result[namespace] = {
+                **values,
+                'hit_ratio': round(cached / lookups, 4) if lookups else None,
+                'latency_ms': latency,
+            }
+        return result
+
+
+response_cache_stats = ResponseCacheStats()
+
+
+class AnonymousResponseCacheMixin:
+    """
+    비로그인 GET 응답을 캐시하는 APIView 믹스인 (뷰의 get()이 super().get()을 호출하면 동작)
+
+    - cache_namespace: 키 / 통계 이름
+    - cache_query_params: 응답에 영향을 주는 쿼리 파라미터 (그 외 파라미터는 키에서 제외)
+    - cache_list_params: 쉼표로 구분된 ID 목록 파라미터 (순서/중복과 무관하게 같은 키)
+    - get_cache_dependencies(): 조회 전에 읽을 버전 카운터 (목록 구성/정렬이 의존하는 것)
+    - get_cache_item_dependencies(): 응답에 포함된 항목별 버전 카운터
+    """
+    cache_namespace = None
+    cache_query_params = ()
+    cache_list_params = ()
+
+    def get_cache_dependencies(self, request):
+        return []
+
+    def get_cache_item_dependencies(self, request, data):
+        return []
+
+    def get_cache_key(self, request):
+        params = []
+        for name in self.cache_query_params:
+            if name not in request.query_params:
+                continue
+            value = request.query_params.get(name, '').strip()
+            if name in self.cache_list_params:
+                value = ','.join(sorted({part.strip() for part in value.split(',') if part.strip()}))
+            params.append((name, value))
+        digest = hashlib.sha1(f"{request.get_host()}?{urlencode(params)}".encode()).hexdigest()
+        return f"response_cache:{self.cache_namespace}:{digest}"
+
+    def get(self, request, *args, **kwargs):
+        started = time.perf_counter()
+        config = get_config()
+        if not config['ENABLED'] or request.user.is_authenticated:
+            return self._finish_cached(super().get(request, *args, **kwargs), 'bypass', started)
+
+        cache = get_cache()
+        key = self.get_cache_key(request)
+        entry = cache.get(key)
+        if entry is not None and get_versions(entry['dependencies']) == entry['versions']:
+            return self._finish_cached(Response(entry['data']), 'hit', started)
+
+        dependencies = list(self.get_cache_dependencies(request))
+        versions = get_versions(dependencies)
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200:
+            items = list(self.get_cache_item_dependencies(request, response.data))
+            cache.set(key, {
+                'dependencies': dependencies + items,
+                'versions': versions + get_versions(items),
+                'data': response.data,
+            }, config['TIMEOUT'])
+        return self._finish_cached(response, 'miss' if entry is None else 'stale', started)
+
+    def _finish_cached(self, response, outcome, started):
+        response['X-Cache'] = outcome.upper()
+        response_cache_stats.record(self.cache_namespace, outcome, (time.perf_counter() - started) * 1000)
+        return response
+
+
+# ✅ 응답 캐시 통계 (관리자 전용, 요청을 처리한 워커의 값, 상세 응답 캐시(config/stale_cache.py) 포함)
+class ResponseCacheStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        from .stale_cache import stale_cache_stats
+
+        return Response({**response_cache_stats.snapshot(), **stale_cache_stats.snapshot()})
@@ -0,0 +1,485 @@
+import math
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+
+from django.contrib.postgres.search import SearchVectorField
+from django.db import connections
+from django.db.models import BooleanField, Case, F, FloatField, Func, Value, When
+from django.db.models.functions import Coalesce
+from django.utils.html import escape
+
+# ---------------------------------------------------------------------
+# ✅ 한국어 n-gram 토크나이저
+# - 한글 어절은 2-gram으로 쪼개고 마지막 음절을 1-gram으로 추가
+#   ("기생충은" → 기생, 생충, 충은, 은) → 조사가 붙어도, 한 글자 검색어도 매칭
+# - 영문/숫자 등은 단어 단위 (검색 시에는 접두어 매칭)
+# ---------------------------------------------------------------------
+HANGUL_RUN_RE = re.compile(r'[가-힣]+|[^\W_가-힣]+')
+MAX_WORD_LENGTH = 64  # 긴 URL/난수 문자열이 색인을 부풀리지 않도록 단어 길이 제한
+
+
+def normalize(text):
+    return unicodedata.normalize('NFKC', text or '').lower()
+
+
+def is_hangul(word):
+    return '가' <= word[0] <= '힣'
+
+
+def document_terms(text):
+    """문서(제목/본문)를 색인할 검색어 목록"""
+    terms = []
+    for word in HANGUL_RUN_RE.findall(normalize(text)):
+        if is_hangul(word):
+            terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+            terms.append(word[-1])
+        else:
+            terms.append(word[:MAX_WORD_LENGTH])
+    return terms
+
+
+def query_terms(text):
+    """
+    검색어를 (검색어, 접두어 매칭 여부) 목록으로 변환합니다.
+    한글 두 글자 이상은 2-gram 전부 일치, 한 글자나 영문/숫자는 접두어 매칭
+    """
+    terms = []
+    for word in HANGUL_RUN_RE.findall(normalize(text)):
+        if is_hangul(word) and len(word) > 1:
+            terms.extend((word[i:i + 2], False) for i in range(len(word) - 1))
+        else:
+            terms.append((word[:MAX_WORD_LENGTH], True))
+    return list(dict.fromkeys(terms))
+
+
+# ---------------------------------------------------------------------
+# ✅ PostgreSQL tsvector / tsquery 표현식
+# - to_tsvector/to_tsquery 파서는 DB 로케일(C 등)에 따라 한글을 버리므로
+#   토큰화는 파이썬에서 하고 tsvector/tsquery 리터럴로 직접 캐스팅
+# ---------------------------------------------------------------------
+def _quote(term):
+    return "'" + term.replace("'", "''").replace('\\', '\\\\') + "'"
+
+
+def tsvector_literal(weighted_texts, qualified_weights=''):
+    """
+    [(텍스트, 'A'), (텍스트, 'B')] → "'기생':1A '생충':2A ..."
+    qualified_weights에 속한 가중치의 단어는 'A:기생'처럼 가중치를 앞에 붙인 단어로 한 번 더 넣음
+    """
+    lexemes, position = defaultdict(list), 0
+    for text, weight in weighted_texts:
+        for term in document_terms(text):
+            position = min(position + 1, 16383)
+            lexemes[term].append(f"{position}{weight}")
+            if weight in qualified_weights:
+                lexemes[f"{weight}:{term}"].append(f"{position}{weight}")
+    return ' '.join(f"{_quote(term)}:{','.join(positions)}" for term, positions in lexemes.items())
+
+
+def tsquery_literal(text, weights='', qualifier=''):
+    """
+    검색어 → "'기생' & '생충' & 'inter':*" (검색어가 없으면 None)
+    qualifier를 주면 'A:기생'처럼 가중치를 앞에 붙인 단어로 검색
+    """
+    terms = query_terms(text)
+    if not terms:
+        return None
+    return ' & '.join(
+        f"{_quote(qualifier + ':' + term if qualifier else term)}"
+        f"{':' if prefix or weights else ''}{'*' if prefix else ''}{weights}"
+        for term, prefix in terms
+    )
+
+
+class TSVector(Func):
+    template = '%(expressions)s::tsvector'
+    output_field = SearchVectorField()
+
+    def __init__(self, weighted_texts, qualified_weights=''):
+        super().__init__(Value(tsvector_literal(weighted_texts, qualified_weights)))
+
+
+class TSQuery(Func):
+    template = '%(expressions)s::tsquery'
+
+    def __init__(self, literal):
+        super().__init__(Value(literal))
+
+
+class TSMatch(Func):
+    template = '%(expressions)s'
+    arg_joiner = ' @@ '
+    output_field = BooleanField()
+
+
+class TSRank(Func):
+    function = 'ts_rank'
+    output_field = FloatField()
+
+
+# ---------------------------------------------------------------------
+# ✅ 프로세스 내 역색인 (PostgreSQL이 아닐 때의 대체 검색 엔진)
+# - 필드별 (검색어 → {문서 id: 가중 빈도}) 포스팅 + 접두어 검색용 정렬된 검색어 목록
+# - 점수는 ts_rank와 비슷하게 필드 가중치 × 로그 빈도의 합
+# ---------------------------------------------------------------------
+class InvertedIndex:
+    def __init__(self, field_weights):
+        self.field_weights = field_weights
+        self._lock = threading.RLock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._postings = defaultdict(dict)   # (field, term) → {doc_id: tf}
+            self._doc_keys = {}                  # doc_id → [(field, term)]
+            self._sorted_terms = None
+            self.loaded = False
+
+    def add(self, doc_id, field_texts):
+        with self._lock:
+            self.remove(doc_id)
+            keys = []
+            for field, text in field_texts.items():
+                counts = defaultdict(int)
+                for term in document_terms(text):
+                    counts[term] += 1
+                for term, tf in counts.items():
+                    self._postings[(field, term)][doc_id] = tf
+                    keys.append((field, term))
+            self._doc_keys[doc_id] = keys
+            self._sorted_terms = None
+
+    def remove(self, doc_id):
+        with self._lock:
+            for key in self._doc_keys.pop(doc_id, ()):
+                postings = self._postings.get(key)
+                if postings is not None:
+                    postings.pop(doc_id, None)
+                    if not postings:
+                        del self._postings[key]
+            self._sorted_terms = None
+
+    def _expand(self, term, prefix):
+        if not prefix:
+            return [term]
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted({term for _, term in self._postings})
+        expanded = []
+        index = bisect_left(self._sorted_terms, term)
+        while index < len(self._sorted_terms) and self._sorted_terms[index].startswith(term):
+            expanded.append(self._sorted_terms[index])
+            index += 1
+        return expanded
+
+    def search(self, text, fields=None):
+        """모든 검색어를 포함하는 문서의 {문서 id: 점수}"""
+        fields = fields or tuple(self.field_weights)
+        terms = query_terms(text)
+        if not terms:
+            return {}
+        with self._lock:
+            scores = None
+            for term, prefix in terms:
+                term_scores = defaultdict(float)
+                for expanded in self._expand(term, prefix):
+                    for field in fields:
+                        weight = self.field_weights[field]
+                        for doc_id, tf in self._postings.get((field, expanded), {}).items():
+                            term_scores[doc_id] += weight * (1 + math.log(tf))
+                if scores is None:
+                    scores = dict(term_scores)
+                else:
+                    scores = {doc_id: score + term_scores[doc_id] for doc_id, score in scores.items() if doc_id in term_scores}
+                if not scores:
+                    return {}
+            return scores
+
+
+# ---------------------------------------------------------------------
+# ✅ 한글 자모 분해 (초성 검색/자동완성용)
+# - 겹모음/겹받침은 입력 순서대로 풀어서 "과" 입력 중간 상태("고")도 접두어로 일치
+# ---------------------------------------------------------------------
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = (
+    'ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅗㅏ', 'ㅗㅐ', 'ㅗㅣ', 'ㅛ', 'ㅜ',
+    'ㅜㅓ', 'ㅜㅔ', 'ㅜㅣ', 'ㅠ', 'ㅡ', 'ㅡㅣ', 'ㅣ',
+)
+JONGSEONG = (
+    '', 'ㄱ', 'ㄲ', 'ㄱㅅ', 'ㄴ', 'ㄴㅈ', 'ㄴㅎ', 'ㄷ', 'ㄹ', 'ㄹㄱ', 'ㄹㅁ', 'ㄹㅂ', 'ㄹㅅ', 'ㄹㅌ',
+    'ㄹㅍ', 'ㄹㅎ', 'ㅁ', 'ㅂ', 'ㅂㅅ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+)
+# 단독으로 입력된 겹자모 (ㄳ, ㅘ 등)
+COMPOUND_JAMO = {
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ', 'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ',
+    'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+}
+
+
+def normalize_typed(text):
+    """입력 중인 검색어 정규화 (NFKC는 호환 자모를 조합형 자모로 바꾸므로 NFC 사용, 공백 제거)"""
+    return ''.join(unicodedata.normalize('NFC', text or '').lower().split())
+
+
+def decompose_jamo(text):
+    """'기생충' → 'ㄱㅣㅅㅐㅇㅊㅜㅇ' (한글 이외 문자는 그대로)"""
+    result = []
+    for char in text:
+        if '가' <= char <= '힣':
+            code = ord(char) - 0xAC00
+            result.append(CHOSEONG[code // 588] + JUNGSEONG[code % 588 // 28] + JONGSEONG[code % 28])
+        else:
+            result.append(COMPOUND_JAMO.get(char, char))
+    return ''.join(result)
+
+
+def choseong(text):
+    """'기생충' → 'ㄱㅅㅊ' (한글 이외 문자는 그대로)"""
+    return ''.join(
+        CHOSEONG[(ord(char) - 0xAC00) // 588] if '가' <= char <= '힣' else char
+        for char in text
+    )
+
+
+
+# ---------------------------------------------------------------------
+# ✅ 모델 단위 전문 검색
+# - PostgreSQL: 모델의 search_vector(tsvector) 컬럼 + GIN 인덱스로 @@ 일치 / ts_rank 점수
+# - 그 외(SQLite 테스트 등): 프로세스 내 역색인으로 같은 결과 형태(search_score annotate)를 제공
+#   (같은 프로세스에서 저장된 변경만 반영되므로 개발/테스트용)
+# ---------------------------------------------------------------------
+FALLBACK_WEIGHTS = {'A': 1.0, 'B': 0.4, 'C': 0.2, 'D': 0.1}  # ts_rank 기본 가중치
+
+
+def uses_postgres(using='default'):
+    return connections[using].vendor == 'postgresql'
+
+
+class DocumentSearch:
+    def __init__(self, fields, vector_field='search_vector', preprocess=None, fallback_limit=1000,
+                 qualified_weights=''):
+        """
+        fields: {'title': 'A', 'content': 'B', 'user__username': 'C'} (필드 경로 → tsvector 가중치)
+        preprocess: 색인 전 텍스트 변환 (예: HTML 태그 제거)
+        qualified_weights: 이 가중치의 필드만 검색하는 경우가 잦으면 지정 (예: 'A' → 제목 검색)
+                           'A:기생'처럼 가중치를 붙인 단어를 함께 색인해 GIN 인덱스만으로 찾음
+        """
+        self.fields = fields
+        self.vector_field = vector_field
+        self.preprocess = preprocess or (lambda text: text)
+        self.fallback_limit = fallback_limit
+        self.qualified_weights = qualified_weights
+        self.index = InvertedIndex({field: FALLBACK_WEIGHTS[weight] for field, weight in fields.items()})
+
+    def vector(self, values):
+        """{필드 경로: 텍스트} → tsvector 표현식"""
+        return TSVector([
+            (self.preprocess(values.get(field) or ''), weight) for field, weight in self.fields.items()
+        ], self.qualified_weights)
+
+    def values_of(self, instance):
+        values = {}
+        for path in self.fields:
+            value = instance
+            for attr in path.split('__'):
+                value = getattr(value, attr, None) if value is not None else None
+            values[path] = value or ''
+        return values
+
+    def update_document(self, instance):
+        """인스턴스 저장 후 검색 문서를 갱신합니다."""
+        using = instance._state.db or 'default'
+        values = self.values_of(instance)
+        if uses_postgres(using):
+            type(instance)._default_manager.using(using).filter(pk=instance.pk).update(
+                **{self.vector_field: self.vector(values)}
+            )
+        elif self.index.loaded:
+            self.index.add(instance.pk, {field: self.preprocess(text) for field, text in values.items()})
+
+    def _load_fallback_index(self, queryset):
+        with self.index._lock:
+            if self.index.loaded:
+                return
+            rows = queryset.model._default_manager.using(queryset.db).values_list('pk', *self.fields)
+            for pk, *texts in rows.iterator():
+                self.index.add(pk, {
+                    field: self.preprocess(text or '') for field, text in zip(self.fields, texts)
+                })
+            self.index.loaded = True
+
+    def _window(self, queryset, matched, match, ordering, size, recent_scan):
+        """
+        일치하는 행 중 ordering으로 앞선 size개의 pk와, 그 뒤 행을 읽을 정렬 (흔한 단어 / 드문 단어에 따라 두 경로)
+        - 최근 recent_scan행을 정렬 인덱스로 읽으며 일치 여부만 계산 → size개 이상이면 그대로 사용
+          (WHERE가 아닌 SELECT에서 계산하므로 플래너가 수십만 건의 GIN 결과를 정렬하는 계획을 고르지 않음)
+        - 부족하면 덜 흔한 단어이므로 GIN 인덱스로 전체 일치를 찾아 정렬
+          (정렬 키를 COALESCE로 감싸 플래너가 LIMIT만 보고 정렬 인덱스를 따라 테이블 전체를 훑는 계획을 막음)
+        """
+        recent = queryset.order_by(*ordering).annotate(search_hit=match).values_list('pk', 'search_hit')
+        hits = [pk for pk, hit in recent[:recent_scan] if hit]
+        if len(hits) >= size:
+            return hits[:size], ordering
+        unindexed = []
+        for field in ordering:
+            key = Coalesce(F(field.lstrip('-')), F(field.lstrip('-')))
+            unindexed.append(key.desc() if field.startswith('-') else key.asc())
+        return list(matched.order_by(*unindexed).values_list('pk', flat=True)[:size]), unindexed
+
+    def _tsquery_literal(self, text, weights):
+        # 가중치가 붙은 검색어('기생':A)는 GIN 인덱스가 가중치를 모르므로 후보 행마다 tsvector를 다시 읽어 확인
+        # → 모든 필드를 허용하면 가중치를 빼고, 가중치를 붙여 색인한 필드만 찾을 때는 'A:기생'으로 검색
+        query_weights, qualifier = weights, ''
+        if set(weights) >= set(self.fields.values()):
+            query_weights = ''
+        elif len(weights) == 1 and weights in self.qualified_weights:
+            query_weights, qualifier = '', weights
+        return tsquery_literal(text, query_weights, qualifier)
+
+    def _fallback_scores(self, queryset, text, weights):
+        self._load_fallback_index(queryset)
+        fields = [field for field, weight in self.fields.items() if not weights or weight in weights]
+        return self.index.search(text, fields=fields)
+
+    def match(self, queryset, text, weights=''):
+        """
+        모든 검색어를 포함하는 행만 남깁니다 (관련도 계산 없이, 쿼리셋의 정렬은 그대로)
+        weights: 'A', 'AB'처럼 일치를 허용할 가중치 (빈 값이면 전체 필드)
+        """
+        literal = self._tsquery_literal(text, weights)
+        if literal is None:
+            return queryset.none()
+        if uses_postgres(queryset.db):
+            return queryset.filter(TSMatch(F(self.vector_field), TSQuery(literal)))
+        return queryset.filter(pk__in=list(self._fallback_scores(queryset, text, weights)))
+
+    def rank(self, queryset, text, window, weights='', boost=1):
+        """
+        일치하는 모든 행을 RankedMatches로 반환합니다 (앞쪽은 관련도 순, 그 뒤는 window 정렬 순)
+        window: (정렬, N, 최근 스캔 행 수) - 일치하는 행 중 이 정렬로 앞선 N개만 관련도(search_score × boost) 순으로
+                정렬하고, 나머지 일치 행은 search_score 0으로 그 뒤에 같은 정렬 순으로 이어 붙임
+                (큰 테이블에서 흔한 단어가 수십만 행과 일치해도 ts_rank 계산 / 정렬은 N행만)
+        """
+        ordering, size, recent_scan = window
+        literal = self._tsquery_literal(text, weights)
+        if literal is None:
+            return RankedMatches(queryset.none(), queryset.none(), queryset.none(), 0, complete=True)
+
+        if uses_postgres(queryset.db):
+            query = TSQuery(literal)
+            vector = F(self.vector_field)
+            matched = queryset.filter(TSMatch(vector, query))
+            pks, rest_ordering = self._window(queryset, matched, TSMatch(vector, query), ordering, size, recent_scan)
+            score = TSRank(vector, query) * boost
+        else:
+            scores = self._fallback_scores(queryset, text, weights)
+            matched = queryset.filter(pk__in=list(scores))
+            pks, rest_ordering = list(matched.order_by(*ordering).values_list('pk', flat=True)[:size]), ordering
+            score = Case(
+                *[When(pk=pk, then=Value(scores[pk])) for pk in pks],
+                default=Value(0.0), output_field=FloatField(),
+            ) * boost
+
+        ranked = queryset.filter(pk__in=pks).annotate(search_score=score).order_by('-search_score', '-id')
+        rest = (
+            matched.exclude(pk__in=pks)
+            .annotate(search_score=Value(0.0, output_field=FloatField()))
+            .order_by(*rest_ordering)
+        )
+        return RankedMatches(matched, ranked, rest, len(pks), complete=len(pks) < size)
+
+    def filter(self, queryset, text, weights='', boost=1):
+        """
+        모든 검색어를 포함하는 행만 남기고 search_score(관련도 × boost)를 annotate 합니다.
+        weights: 'A', 'AB'처럼 일치를 허용할 가중치 (빈 값이면 전체 필드)
+        큰 테이블에서 관련도 순으로 나열할 때는 rank()
+        """
+        literal = self._tsquery_literal(text, weights)
+        if literal is None:
+            return queryset.none().annotate(search_score=Value(0.0, output_field=FloatField()))
+
+        if uses_postgres(queryset.db):
+            query = TSQuery(literal)
+            vector = F(self.vector_field)
+            return queryset.filter(TSMatch(vector, query)).annotate(search_score=TSRank(vector, query) * boost)
+
+        scores = self._fallback_scores(queryset, text, weights)
+        top = sorted(scores.items(), key=lambda item: -item[1])[:self.fallback_limit]
+        if not top:
+            return queryset.none().annotate(search_score=Value(0.0, output_field=FloatField()))
+        relevance = Case(
+            *[When(pk=pk, then=Value(score)) for pk, score in top],
+            default=Value(0.0), output_field=FloatField(),
+        )
+        return queryset.filter(pk__in=[pk for pk, _ in top]).annotate(search_score=relevance * boost)
+
+
+class RankedMatches:
+    """
+    DocumentSearch.rank() 결과 (관련도 순 N개 + 나머지 일치 행)
+    - Paginator에 그대로 넘길 수 있도록 count() / 슬라이싱 지원, 슬라이스마다 필요한 쪽만 조회
+      (순위 범위 안의 페이지는 N행 안에서, 그 뒤 페이지는 window 정렬 인덱스 순서로 읽음)
+    - order_by(): 전체 일치 행 쿼리셋 (ApproximateCountPaginator의 개수 추정 / 캐시 키용)
+    """
+    ordered = True
+
+    def __init__(self, matched, ranked, rest, ranked_count, complete):
+        self.matched = matched
+        self.ranked = ranked
+        self.rest = rest
+        self.ranked_count = ranked_count
+        self.complete = complete    # 일치 행이 N개 미만이라 모두 순위 범위 안에 있음
+
+    @property
+    def db(self):
+        return self.matched.db
+
+    def order_by(self, *fields):
+        return self.matched.order_by(*fields)
+
+    def count(self):
+        return self.ranked_count if self.complete else self.matched.count()
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice):
+            return self[item:item + 1][0]
+        start, stop = item.start or 0, item.stop
+        rows = []
+        if start < self.ranked_count:
+            rows += self.ranked[start:self.ranked_count if stop is None else min(stop, self.ranked_count)]
+        if not self.complete and (stop is None or stop > self.ranked_count):
+            offset = max(start - self.ranked_count, 0)
+            rows += self.rest[offset:None if stop is None else stop - self.ranked_count]
+        return rows
+
+
+# ---------------------------------------------------------------------
+# ✅ 검색 결과 하이라이트 스니펫
+# - 첫 일치 위치 주변 max_length 글자를 잘라 일치 부분을 <mark>로 감쌈 (나머지는 HTML 이스케이프)
+# ---------------------------------------------------------------------
+def highlight(text, query, max_length=120):
+    text = ' '.join((text or '').split())
+    words = sorted(
+        {word for word in HANGUL_RUN_RE.findall(normalize(query))}
+        | {term for term, _ in query_terms(query)},
+        key=len, reverse=True,
+    )
+    if not text or not words:
+        return escape(text[:max_length])
+    pattern = re.compile('|'.join(re.escape(word) for word in words), re.IGNORECASE)
+
+    first = pattern.search(text)
+    start = max(0, (first.start() if first else 0) - max_length // 4)
+    end = min(len(text), start + max_length)
+    window = text[start:end]
+
+    parts, position = [], 0
+    for match in pattern.finditer(window):
+        parts.append(escape(window[position:match.start()]))
+        parts.append(f"<mark>{escape(match.group())}</mark>")
+        position = match.end()
+    parts.append(escape(window[position:]))
+    return ('…' if start > 0 else '') + ''.join(parts) + ('…' if end < len(text) else '')
@@ -47,6 +47,8 @@ INSTALLED_APPS = [
     'movies',  # 영화 앱 추가
     'reviews',  # 리뷰 앱 추가
     'board', # 게시판 앱 추가
+    'search',  # 통합 검색 앱 추가
+    'recommendations',  # 유사 영화 / 추천 앱 추가
     'django_filters',  # 필터링을 위한 Django Filter 추가
 ]
 
@@ -96,6 +98,29 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/ref/settings/#caches
+# ✅ 조회수 중복 판별 등 워커 프로세스끼리 같은 값을 봐야 하는 기능이 있으므로 프로세스별 메모리 캐시(LocMem)는 사용하지 않음
+# - REDIS_URL이 있으면 Redis (docker-compose의 redis 서비스)
+# - 없으면 PostgreSQL 테이블 캐시 (createcachetable 필요, 저장할 때마다 COUNT(*)가 있어 Redis보다 느림)
+
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+            'OPTIONS': {'MAX_ENTRIES': 50000},  # 기본값(300)이면 중복 판별 키가 금방 정리됨
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -155,7 +180,8 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
     ),
     # 🔥 [추가] 페이지네이션 설정 (기본값: 1페이지에 20개)
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    # page 파라미터는 기존 페이지 번호 방식, cursor 파라미터를 주면 키셋 커서 방식 (config/pagination.py)
+    'DEFAULT_PAGINATION_CLASS': 'config.pagination.CursorOrPageNumberPagination',
     'PAGE_SIZE': 20,  # 1페이지에 보여줄 게시글 개수(원하는 숫자로 변경 가능)
     
     'DEFAULT_PERMISSION_CLASSES': [
@@ -190,6 +216,57 @@ SIMPLE_JWT = {
     "AUTH_COOKIE_SAMESITE": "Lax",  # 또는 "Strict" / "None"
 }
 
+# ✅ 근사 전체 개수 페이지네이션 설정 (config/pagination.py ApproximateCountPagination)
+APPROXIMATE_COUNT = {
+    'EXACT_THRESHOLD': 10000,   # 실행 계획 추정치가 이 값 미만이면 정확한 COUNT(*)
+    'CACHE_TIMEOUT': 60,        # 추정치 캐시 시간(초)
+    'CACHE_ALIAS': 'default',
+}
+
+# ✅ 게시글 조회수 버퍼 설정 (board/view_counter.py)
+BOARD_VIEW_COUNT_BUFFER = {
+    'FLUSH_INTERVAL': 5,        # 주기적 flush 간격(초)
+    'FLUSH_THRESHOLD': 500,     # 버퍼 누적 조회 수가 이 값 이상이면 즉시 flush
+    'DEDUPE_WINDOW': 60 * 30,   # 같은 사용자/IP 재조회 무시 시간(초)
+    'CACHE_ALIAS': 'default',
+    'NUM_PROXIES': int(os.environ.get('NUM_PROXIES', 0)),   # 리버스 프록시 뒤에서 운영하면 프록시 수 (X-Forwarded-For 신뢰 범위)
+}
+
+# ✅ 통합 검색 색인 설정 (search/indexer.py)
+SEARCH_INDEX = {
+    'ASYNC': True,          # 저장 요청과 분리해 백그라운드 스레드에서 색인
+    'BATCH_DELAY': 1.0,     # 변경을 모으기 위해 기다리는 시간(초)
+    'BATCH_SIZE': 500,      # 한 번에 색인할 원본 수
+}
+
+# ✅ 유사 영화 / 추천 설정 (recommendations/neighbors.py)
+MOVIE_NEIGHBORS = {
+    'TOP_K': 20,            # 영화별 저장할 유사 영화 수
+    'BATCH_SIZE': 256,      # 한 번에 유사도를 계산할 영화 수
+    'CACHE_ALIAS': 'default',   # 계산 잠금을 워커/관리 명령끼리 공유해야 하므로 공유 캐시 별칭 (LocMem이면 config.W001)
+}
+
+# ✅ 비로그인 영화 목록/검색 응답 캐시 (config/response_cache.py, movies/cache.py)
+RESPONSE_CACHE = {
+    'ENABLED': True,
+    'CACHE_ALIAS': 'default',   # 버전 카운터를 워커끼리 공유해야 하므로 공유 캐시 별칭 (LocMem이면 config.W001)
+    'TIMEOUT': 300,             # 응답 항목 유지 시간(초)
+}
+
+# ✅ 상세 응답 stale-while-revalidate 캐시 (config/stale_cache.py, 영화 상세)
+STALE_RESPONSE_CACHE = {
+    'ENABLED': True,
+    'CACHE_ALIAS': 'default',   # 재생성 잠금을 워커끼리 공유해야 하므로 공유 캐시 별칭 (LocMem이면 config.W001)
+    'SOFT_TTL': 60,             # 이후 이전 항목으로 응답하면서 한 요청만 재생성(초)
+    'HARD_TTL': 600,            # 캐시 항목 만료(초)
+}
+
+# ✅ 설명 기반 콘텐츠 유사 영화 (recommendations/content.py)
+MOVIE_CONTENT_NEIGHBORS = {
+    'ASYNC': True,          # 영화 저장 요청과 분리해 백그라운드 스레드에서 증분 갱신 (전체 계산은 build_movie_neighbors만)
+    'UPDATE_DELAY': 5.0,    # 변경을 모으기 위해 기다리는 시간(초)
+}
+
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
@@ -0,0 +1,145 @@
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.response import Response
+
+from .response_cache import ResponseCacheStats
+
+# ---------------------------------------------------------------------
+# ✅ 상세 응답 캐시 (stale-while-revalidate + 키별 single-flight 재생성)
+# - 항목: 직렬화된 응답 + 검증값(updated_at) + 만든 시각, 만든 지 SOFT_TTL 안이면 신선 / 캐시 항목 만료는 HARD_TTL
+# - 검증값이 같고 신선하면 HIT
+# - 검증값이 바뀌었거나 SOFT_TTL이 지났으면 재생성 잠금(cache.add, 원자적)을 잡은 요청 하나만 다시 만들고 (REFRESH)
+#   나머지는 기다리지 않고 이전 항목으로 응답 (STALE)
+# - 항목이 없으면(처음 / HARD_TTL 만료) 잠금을 잡은 요청이 만들고 (MISS), 나머지는 WAIT_TIMEOUT 동안
+#   결과를 기다렸다가 응답 (WAIT), 그래도 없으면 직접 만듦 (WAIT_TIMEOUT, 잠금을 잡은 워커가 죽은 경우 등)
+# - 잠금은 LOCK_TIMEOUT 뒤 자동 해제되므로 재생성 중 워커가 죽어도 다음 요청이 이어받음
+# - 잠금 / 항목 모두 CACHE_ALIAS 캐시에 있으므로 공유 캐시(Redis/DB 캐시, settings.CACHES)에서
+#   프로세스 사이에서도 키마다 한 요청만 재생성 (LocMem 등 프로세스별 캐시면 한 프로세스의 스레드끼리만, 시작 시 config.W001 경고)
+# - 키에는 쿼리 파라미터가 없으므로 파라미터가 있는 요청은 캐시를 읽지도 저장하지도 않음 (BYPASS)
+# ---------------------------------------------------------------------
+DEFAULT_CONFIG = {
+    'ENABLED': True,
+    'CACHE_ALIAS': 'default',
+    'SOFT_TTL': 60,             # 이 시간(초)이 지나면 이전 항목으로 응답하면서 한 요청만 재생성
+    'HARD_TTL': 600,            # 캐시 항목 만료(초), 이후 첫 요청들은 이전 항목 없이 한 요청의 재생성을 기다림
+    'LOCK_TIMEOUT': 10,         # 재생성 잠금 자동 해제(초)
+    'WAIT_TIMEOUT': 2.0,        # 항목이 없을 때 다른 요청의 재생성 결과를 기다리는 최대 시간(초)
+    'POLL_INTERVAL': 0.02,      # 기다리는 동안 캐시를 다시 읽는 간격(초)
+}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'STALE_RESPONSE_CACHE', {})}
+
+
+class StaleCacheStats(ResponseCacheStats):
+    """워커별 결과 수 / 지연 시간 (stampedes_avoided: 재생성 대신 이전 항목 / 다른 요청의 결과로 응답한 수)"""
+
+    OUTCOMES = ('hit', 'stale', 'refresh', 'miss', 'wait', 'wait_timeout', 'bypass')
+    CACHED_OUTCOMES = ('hit', 'stale', 'wait')
+
+    def snapshot(self):
+        result = super().snapshot()
+        for values in result.values():
+            values['stampedes_avoided'] = values['stale'] + values['wait']
+        return result
+
+
+stale_cache_stats = StaleCacheStats()
+
+
+def lock_key(key):
+    return f"{key}:lock"
+
+
+def fetch(key, version, build):
+    """
+    캐시 항목을 찾거나 (필요하면 이 요청이) 다시 만듭니다.
+
+    - build(): (응답, 저장할 데이터 또는 None)을 반환 (None이면 저장하지 않음, 예: 404)
+    - 반환: (만든 응답 또는 None, 응답할 항목 또는 None, 결과 이름)
+    """
+    config = get_config()
+    cache = caches[config['CACHE_ALIAS']]
+    entry = cache.get(key)
+    if entry is not None:
+        if entry['version'] == version and time.time() - entry['created_at'] < config['SOFT_TTL']:
+            return None, entry, 'hit'
+        token = _acquire(cache, key, config)
+        if token is None:
+            return None, entry, 'stale'
+        return _build(cache, key, version, build, config, token, 'refresh')
+
+    token = _acquire(cache, key, config)
+    if token is not None:
+        return _build(cache, key, version, build, config, token, 'miss')
+    deadline = time.monotonic() + config['WAIT_TIMEOUT']
+    while time.monotonic() < deadline:
+        time.sleep(config['POLL_INTERVAL'])
+        entry = cache.get(key)
+        if entry is not None:
+            return None, entry, 'wait'
+    return _build(cache, key, version, build, config, None, 'wait_timeout')
+
+
+def _acquire(cache, key, config):
+    token = uuid.uuid4().hex
+    return token if cache.add(lock_key(key), token, config['LOCK_TIMEOUT']) else None
+
+
+def _build(cache, key, version, build, config, token, outcome):
+    try:
+        response, data = build()
+        entry = None
+        if data is not None:
+            # 검증값은 조회 전에 읽은 값으로 저장 (그 사이 바뀌었으면 다음 요청이 한 번 더 재생성할 뿐 오래된 값이 남지 않음)
+            entry = {'data': data, 'version': version, 'created_at': time.time()}
+            cache.set(key, entry, config['HARD_TTL'])
+        return response, entry, outcome
+    finally:
+        # 잠금이 만료돼 다른 요청이 잡은 경우에는 지우지 않음
+        if token is not None and cache.get(lock_key(key)) == token:
+            cache.delete(lock_key(key))
+
+
+class StaleWhileRevalidateMixin:
+    """
+    사용자와 무관한 상세 응답을 stale-while-revalidate로 캐시하는 APIView 믹스인
+
+    - ConditionalGetMixin 뒤에 두고 그 get_last_modified()를 검증값으로 사용 (PK 조회 한 번)
+    - 캐시한 항목으로 응답할 때는 ETag / Last-Modified도 그 항목의 검증값으로 (last_modified)
+    - stale_cache_namespace: 키 / 통계 이름
+    - 쿼리 파라미터가 있는 요청은 캐시를 거치지 않음 (임의 파라미터로 캐시 항목이 늘거나 다른 응답이 저장되지 않도록)
+    """
+    stale_cache_namespace = None
+
+    def get_stale_cache_key(self, request):
+        lookup = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        # 응답의 링크 / 이미지 URL이 절대 주소이므로 스킴 + 호스트별로
+        return f"stale_cache:{self.stale_cache_namespace}:{request.scheme}://{request.get_host()}:{lookup}"
+
+    def get(self, request, *args, **kwargs):
+        started = time.perf_counter()
+        if not get_config()['ENABLED'] or request.query_params:
+            return self._finish_stale(super().get(request, *args, **kwargs), 'bypass', started)
+        version = self.last_modified if self.last_modified is not None else self.get_last_modified()
+        if version is None:
+            return super().get(request, *args, **kwargs)
+
+        def build():
+            response = super(StaleWhileRevalidateMixin, self).get(request, *args, **kwargs)
+            return response, (response.data if response.status_code == 200 else None)
+
+        response, entry, outcome = fetch(self.get_stale_cache_key(request), version, build)
+        if response is None:
+            self.last_modified = entry['version']
+            response = Response(entry['data'])
+        return self._finish_stale(response, outcome, started)
+
+    def _finish_stale(self, response, outcome, started):
+        response['X-Cache'] = outcome.upper()
+        stale_cache_stats.record(self.stale_cache_namespace, outcome, (time.perf_counter() - started) * 1000)
+        return response
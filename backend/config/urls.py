@@ -3,7 +3,8 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
-from users.views import CookieTokenObtainPairView
+from users.views import CookieTokenObtainPairView, MyReactionsView
+from config.response_cache import ResponseCacheStatsView
 
 # ✅ Django REST Framework 권한 설정
 from rest_framework import permissions
@@ -51,8 +52,14 @@ urlpatterns = [
     path('api/users/', include('users.urls')),       # 사용자 기능
     path('api/ott/', include('ott.urls')),           # OTT 플랫폼
     path('api/movies/', include('movies.urls')),     # 영화 기능
+    path('api/movies/', include('recommendations.urls')),  # 비슷한 영화 / 추천 영화
     path('api/reviews/', include('reviews.urls')),   # 리뷰 / 댓글 / 추천
     path('api/board/', include('board.urls')),       # 커뮤니티 게시판
+    path('api/search/', include('search.urls')),     # 통합 검색
+    path('api/me/reactions/', MyReactionsView.as_view(), name='my-reactions'),  # 목록에 덮어쓸 내 투표 / 작성자 여부
+
+    # 응답 캐시 적중률 / 지연 시간 (관리자 전용)
+    path('api/cache-stats/', ResponseCacheStatsView.as_view(), name='response-cache-stats'),
 ]
 
 # ✅ 개발 환경에서 미디어 파일 서빙 설정
@@ -6,5 +6,6 @@ echo "Waiting for DB to be ready..."
 # 예: nc -z db 5432
 
 python manage.py migrate --noinput
+python manage.py createcachetable  # REDIS_URL이 없을 때 쓰는 DB 캐시 테이블
 python manage.py collectstatic --noinput
 python manage.py runserver 0.0.0.0:8000
\ No newline at end of file
@@ -11,6 +11,6 @@ class MovieAdmin(admin.ModelAdmin):
     filter_horizontal = ('ott_services',)  # ★ 여기 추가! ★
 
     def display_average_rating(self, obj):
-        return round(obj.calculate_average_rating(), 1)
+        return round(obj.average_rating_cache, 1)
 
     display_average_rating.short_description = "평균 평점"
\ No newline at end of file
@@ -1,6 +1,17 @@
 from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete
 
 
 class MoviesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'movies'
+
+    def ready(self):
+        from ott.models import OTT
+        from .models import Movie, handle_ott_deleted, handle_ott_services_changed
+
+        # ✅ 제공 OTT가 바뀌면 Movie.ott_mask 비트마스크 갱신
+        m2m_changed.connect(
+            handle_ott_services_changed, sender=Movie.ott_services.through, dispatch_uid='movies:ott_mask',
+        )
+        post_delete.connect(handle_ott_deleted, sender=OTT, dispatch_uid='movies:ott_mask_delete')
@@ -0,0 +1,40 @@
+from config.response_cache import AnonymousResponseCacheMixin, bump_versions
+
+# ---------------------------------------------------------------------
+# ✅ 영화 목록/검색 응답 캐시의 버전 카운터
+# - catalog: 영화 등록/수정/삭제, 제공 OTT 변경 → 모든 목록/검색 응답 무효화
+# - ratings: 리뷰로 평점/리뷰 수가 바뀜 → 평점·리뷰 수·관련도(평점 가중) 순 응답만 무효화
+# - movie:<id>: 리뷰로 그 영화의 평점/리뷰 수가 바뀜 → 그 영화가 들어 있는 응답만 무효화
+#   (개봉일/제목 순 목록은 리뷰가 달려도 순서가 그대로이므로 해당 영화가 있는 페이지만 다시 만듦)
+# ---------------------------------------------------------------------
+CATALOG_VERSION = 'movies:catalog'
+RATINGS_VERSION = 'movies:ratings'
+
+# 리뷰(평점 집계)와 무관하게 순서가 정해지는 정렬
+RATING_INDEPENDENT_ORDERINGS = {'release_date', '-release_date', 'title', '-title'}
+
+
+def movie_version(movie_id):
+    return f"movies:movie:{movie_id}"
+
+
+def bump_catalog_version():
+    bump_versions(CATALOG_VERSION)
+
+
+def bump_movie_rating_version(movie_id):
+    bump_versions(RATINGS_VERSION, movie_version(movie_id))
+
+
+class MovieListCacheMixin(AnonymousResponseCacheMixin):
+    """영화 목록/검색 뷰 공통: 카탈로그(+ 정렬에 따라 평점) 카운터와 응답에 포함된 영화별 카운터에 의존"""
+
+    def get_cache_dependencies(self, request):
+        dependencies = [CATALOG_VERSION]
+        if request.query_params.get('ordering', '').strip() not in RATING_INDEPENDENT_ORDERINGS:
+            dependencies.append(RATINGS_VERSION)
+        return dependencies
+
+    def get_cache_item_dependencies(self, request, data):
+        results = data.get('results', []) if isinstance(data, dict) else data
+        return [movie_version(movie['id']) for movie in results]
@@ -1,17 +1,98 @@
 import django_filters
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+from django.db.models import Exists, F, OuterRef, Q
+
+from .fuzzy import fuzzy_search_movies
 from .models import Movie
-from ott.models import OTT
+from .search import search_movies
+from ott.models import MAX_BITMASK_OTT_ID, matching_ott_masks, ott_bitmask
 
 class NumberInFilter(django_filters.BaseInFilter, django_filters.NumberFilter):
     pass
 
+# ✅ 제공 OTT 필터 (Movie.ott_mask 한 컬럼 조회, 연결 테이블 JOIN/DISTINCT 없음)
+# - ott_services: 하나라도 제공 (ANY) / ott_all: 모두 제공 (ALL) / ott_none: 어느 것도 제공하지 않음 (NONE)
+# - 조건을 만족하는 비트마스크 값을 나열해 ott_mask IN (...) → movie_ott_mask_idx 인덱스와 값별 통계 사용
 class MovieFilter(django_filters.FilterSet):
-    ott_services = NumberInFilter(
-        field_name="ott_services__id", 
-        lookup_expr='in'
-    )
-    title = django_filters.CharFilter(field_name='title', lookup_expr='icontains')
+    ott_services = NumberInFilter(method='filter_ott_any')
+    ott_all = NumberInFilter(method='filter_ott_all')
+    ott_none = NumberInFilter(method='filter_ott_none')
+    title = django_filters.CharFilter(method='filter_title')
 
     class Meta:
         model = Movie
-        fields = ['ott_services', 'title']
\ No newline at end of file
+        fields = ['ott_services', 'ott_all', 'ott_none', 'title']
+
+    def filter_title(self, queryset, name, value):
+        # 제목만 대상으로 하는 전문 검색 (ILIKE '%…%' 순차 스캔 대신 색인 사용)
+        return search_movies(queryset, value, title_only=True)
+
+    def filter_ott_any(self, queryset, name, value):
+        mask, overflow_ids = split_ott_ids(value)
+        if not mask:
+            return queryset.filter(has_any_ott(overflow_ids)) if overflow_ids else queryset.none()
+        combine = (lambda condition: condition | has_any_ott(overflow_ids)) if overflow_ids else None
+        return filter_ott_mask(queryset, matching_ott_masks(any_of=mask), Q(ott_hit__gt=0), mask, combine)
+
+    def filter_ott_all(self, queryset, name, value):
+        if any(ott_id < 1 for ott_id in value):
+            return queryset.none()
+        mask, overflow_ids = split_ott_ids(value)
+        for ott_id in overflow_ids:
+            queryset = queryset.filter(has_any_ott([ott_id]))
+        if not mask:
+            return queryset
+        return filter_ott_mask(queryset, matching_ott_masks(all_of=mask), Q(ott_hit=mask), mask)
+
+    def filter_ott_none(self, queryset, name, value):
+        mask, overflow_ids = split_ott_ids(value)
+        if overflow_ids:
+            queryset = queryset.exclude(has_any_ott(overflow_ids))
+        if not mask:
+            return queryset
+        return filter_ott_mask(queryset, matching_ott_masks(none_of=mask), Q(ott_hit=0), mask)
+
+
+def split_ott_ids(ott_ids):
+    """OTT id 목록 → (비트마스크, 비트가 없어 연결 테이블로 확인할 id 목록), 존재할 수 없는 id(0 이하)는 무시"""
+    overflow_ids = [ott_id for ott_id in ott_ids if ott_id > MAX_BITMASK_OTT_ID]
+    return ott_bitmask(ott_id for ott_id in ott_ids if 1 <= ott_id <= MAX_BITMASK_OTT_ID), overflow_ids
+
+
+def has_any_ott(ott_ids):
+    """id가 MAX_BITMASK_OTT_ID보다 큰 OTT는 ott_mask에 비트가 없으므로 연결 테이블 EXISTS로 확인"""
+    through = Movie.ott_services.through
+    return Exists(through.objects.filter(movie_id=OuterRef('pk'), ott_id__in=ott_ids))
+
+
+def filter_ott_mask(queryset, masks, bitwise, mask, combine=None):
+    """
+    나열한 값이 있으면 ott_mask IN (...), 조합이 너무 많으면 (ott_mask & mask) 비트 연산 조건
+    (combine이 있으면 비트마스크 조건을 받아 연결 테이블 조건과 합친 조건으로 필터)
+    """
+    if masks is not None:
+        condition = Q(ott_mask__in=masks)
+    else:
+        queryset = queryset.alias(ott_hit=F('ott_mask').bitand(mask))
+        condition = bitwise
+    return queryset.filter(combine(condition) if combine else condition)
+
+
+# ✅ 영화 전문 검색 필터 (제목 + 설명, 한국어 n-gram 색인)
+# - ordering 파라미터가 없으면 관련도(평점 가중) 순으로 정렬
+# - fuzzy=1이면 제목 트라이그램 유사도로 오타를 허용해 검색 (유사도 순 정렬)
+class MovieSearchFilter(BaseFilterBackend):
+    search_param = 'search'
+    fuzzy_param = 'fuzzy'
+
+    def filter_queryset(self, request, queryset, view):
+        text = request.query_params.get(self.search_param, '').strip()
+        if not text:
+            return queryset
+        if request.query_params.get(self.fuzzy_param, '').lower() in ('1', 'true'):
+            queryset = fuzzy_search_movies(queryset, text)
+        else:
+            queryset = search_movies(queryset, text)
+        if OrderingFilter.ordering_param not in request.query_params:
+            queryset = queryset.order_by('-search_score', '-id')
+        return queryset
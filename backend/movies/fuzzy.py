@@ -0,0 +1,198 @@
+import math
+import threading
+import time
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+
+from django.conf import settings
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connections
+from django.db.models import BooleanField, Case, F, FloatField, Func, Value, When
+
+from config.search import HANGUL_RUN_RE, normalize, uses_postgres
+
+# ---------------------------------------------------------------------
+# ✅ 오타 허용 영화 제목 검색 (트라이그램 유사도)
+# - pg_trgm과 같은 방식으로 단어마다 앞에 공백 2칸, 뒤에 1칸을 붙여 3글자씩 자름
+#   ("기생춘" → "  기", " 기생", "기생춘", "생춘 ") → 유사도 = 공통 트라이그램 / 전체 트라이그램
+# - PostgreSQL에 pg_trgm이 있으면 title % 검색어 (GIN 트라이그램 인덱스, movies 마이그레이션 0005)
+# - 없으면(SQLite 테스트, 확장 미설치 DB) 워커 메모리의 트라이그램 역색인으로 같은 유사도를 계산
+# ---------------------------------------------------------------------
+DEFAULT_CONFIG = {
+    'THRESHOLD': 0.3,           # 최소 유사도 (pg_trgm.similarity_threshold 기본값과 같음)
+    'FALLBACK_LIMIT': 500,      # 메모리 색인에서 고를 최대 후보 수
+    'STOP_RATIO': 0.05,         # 메모리 색인에서 이보다 흔한 트라이그램은 후보 생성에 쓰지 않음
+    'REBUILD_INTERVAL': 600,    # 다른 워커의 수정을 반영하기 위한 전체 재구성 주기(초)
+}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'MOVIE_FUZZY_SEARCH', {})}
+
+
+def trigrams(text):
+    grams = set()
+    for word in HANGUL_RUN_RE.findall(normalize(text)):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+# 이보다 짧은 목록은 흔한 트라이그램이어도 훑는 비용이 작으므로 제외하지 않음 (작은 카탈로그에서 재현율 유지)
+STOP_MIN_POSTINGS = 1000
+
+
+def contains(ids, movie_id):
+    position = bisect_left(ids, movie_id)
+    return position < len(ids) and ids[position] == movie_id
+
+
+class TrigramIndex:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._movies = {}       # 영화 id → (리뷰 수, 트라이그램 수, 제목)
+            self._postings = {}     # 트라이그램 → 정렬된 영화 id 배열 (set보다 메모리가 적음)
+            self.loaded_at = None
+
+    def rebuild(self, rows):
+        """rows: (id, 제목, 리뷰 수) 목록으로 전체를 다시 구성합니다."""
+        movies, postings = {}, {}
+        for movie_id, title, rating_count in rows:
+            movie_grams = trigrams(title)
+            movies[movie_id] = (rating_count, len(movie_grams), title)
+            for gram in movie_grams:
+                postings.setdefault(gram, []).append(movie_id)
+        postings = {gram: array('q', sorted(ids)) for gram, ids in postings.items()}
+        with self._lock:
+            self._movies, self._postings = movies, postings
+            self.loaded_at = time.monotonic()
+
+    def add(self, movie):
+        with self._lock:
+            self.remove(movie.pk)
+            movie_grams = trigrams(movie.title)
+            self._movies[movie.pk] = (movie.rating_count, len(movie_grams), movie.title)
+            for gram in movie_grams:
+                insort(self._postings.setdefault(gram, array('q')), movie.pk)
+
+    def remove(self, movie_id):
+        with self._lock:
+            entry = self._movies.pop(movie_id, None)
+            for gram in trigrams(entry[2]) if entry else ():
+                postings = self._postings.get(gram)
+                if postings is not None and contains(postings, movie_id):
+                    del postings[bisect_left(postings, movie_id)]
+                    if not postings:
+                        del self._postings[gram]
+
+    def is_stale(self, interval):
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > interval
+
+    def search(self, text, threshold, limit, stop_ratio=None):
+        """
+        유사도가 threshold 이상인 영화를 [(id, 유사도)]로 유사도 → 리뷰 수 순 반환합니다.
+        유사도 t 이상이려면 검색어 트라이그램 Q 중 최소 ceil(t·|Q|)개를 공유해야 하므로
+        가장 드문 |Q| - ceil(t·|Q|) + 1개 트라이그램 중 하나는 반드시 포함 → 그 목록만 후보로 검사
+        stop_ratio: 전체 제목의 이 비율보다 많이 나오는 트라이그램("  the" 같은 흔한 단어)은 후보를 만들 때 제외
+                    (흔한 단어만 겹치는 제목은 놓칠 수 있음, 유사도 자체는 모든 트라이그램으로 계산)
+        """
+        query = trigrams(text)
+        if not query:
+            return []
+        with self._lock:
+            postings = [(gram, self._postings.get(gram, ())) for gram in query]
+            postings.sort(key=lambda item: len(item[1]))
+            required = max(math.ceil(threshold * len(query)), 1)
+            prefix = postings[:len(query) - required + 1]
+            if stop_ratio is not None:
+                cutoff = max(stop_ratio * len(self._movies), STOP_MIN_POSTINGS)
+                prefix = [item for item in prefix if len(item[1]) <= cutoff] or prefix[:1]
+
+            prefix_grams = {gram for gram, _ in prefix}
+            rest = [ids for gram, ids in postings if gram not in prefix_grams]
+            candidates = Counter()
+            for _, ids in prefix:
+                candidates.update(ids)
+            scored = []
+            for movie_id, shared in candidates.items():
+                rating_count, size, _ = self._movies[movie_id]
+                # 나머지 트라이그램을 모두 공유해도 기준에 못 미치면 확인하지 않음
+                best = shared + len(rest)
+                if best < threshold * (len(query) + size - best):
+                    continue
+                shared += sum(contains(ids, movie_id) for ids in rest)
+                similarity = shared / (len(query) + size - shared)
+                if similarity >= threshold:
+                    scored.append((similarity, rating_count, movie_id))
+        scored.sort(key=lambda item: (-item[0], -item[1], item[2]))
+        return [(movie_id, similarity) for similarity, _, movie_id in scored[:limit]]
+
+
+movie_trigram_index = TrigramIndex()
+
+
+def get_movie_trigram_index():
+    """처음 사용할 때, 그리고 REBUILD_INTERVAL마다 DB에서 전체를 다시 읽어 구성합니다."""
+    from .models import Movie
+
+    if movie_trigram_index.is_stale(get_config()['REBUILD_INTERVAL']):
+        movie_trigram_index.rebuild(Movie.objects.values_list('id', 'title', 'rating_count').iterator())
+    return movie_trigram_index
+
+
+def update_fuzzy_index(movie):
+    """영화 저장 후 이 워커의 트라이그램 색인을 증분 갱신"""
+    if movie_trigram_index.loaded_at is not None:
+        movie_trigram_index.add(movie)
+
+
+_trgm_installed = {}
+
+
+def has_pg_trgm(using='default'):
+    if not uses_postgres(using):
+        return False
+    if using not in _trgm_installed:
+        with connections[using].cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            _trgm_installed[using] = cursor.fetchone() is not None
+    return _trgm_installed[using]
+
+
+class TrigramMatch(Func):
+    """title % 검색어 (GIN gin_trgm_ops 인덱스 사용)"""
+    template = '%(expressions)s'
+    arg_joiner = ' %% '
+    output_field = BooleanField()
+
+
+def fuzzy_search_movies(queryset, text):
+    """
+    제목이 검색어와 비슷한 영화만 남기고 search_score(트라이그램 유사도)를 annotate 합니다.
+    정렬은 호출하는 쪽에서 결정합니다.
+    """
+    text = (text or '').strip()
+    if not text:
+        return queryset
+    config = get_config()
+
+    if has_pg_trgm(queryset.db):
+        return queryset.filter(TrigramMatch(F('title'), Value(text))).annotate(
+            search_score=TrigramSimilarity('title', text)
+        ).filter(search_score__gte=config['THRESHOLD'])
+
+    matches = get_movie_trigram_index().search(
+        text, config['THRESHOLD'], config['FALLBACK_LIMIT'], config['STOP_RATIO'],
+    )
+    if not matches:
+        return queryset.none().annotate(search_score=Value(0.0, output_field=FloatField()))
+    similarity = Case(
+        *[When(pk=movie_id, then=Value(score)) for movie_id, score in matches],
+        default=Value(0.0), output_field=FloatField(),
+    )
+    return queryset.filter(pk__in=[movie_id for movie_id, _ in matches]).annotate(search_score=similarity)
@@ -0,0 +1,114 @@
+import random
+import statistics
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+
+from movies.fuzzy import TrigramIndex, fuzzy_search_movies, get_config, has_pg_trgm, movie_trigram_index
+from movies.models import Movie
+from movies.search import search_movies
+
+BENCHMARK_PREFIX = '퍼지벤치'
+SYLLABLES = '가나다라마바사아자차카타파하기니디리미비시이지치키티피히고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후'
+LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+
+
+class Command(BaseCommand):
+    help = (
+        "오타 허용 영화 제목 검색 벤치마크: 대량의 영화 제목에 오타(치환/삭제/삽입/순서 바꿈)를 낸 검색어로 "
+        "기존 전문 검색과 fuzzy 검색의 적중률(recall@1/@5)과 p50/p95 지연 시간을 비교합니다. "
+        "(운영 DB가 아닌 별도 벤치마크 DB에서 실행하세요)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--movies', type=int, default=100_000, help='카탈로그 영화 수 (부족하면 생성, 기본값: 100,000)')
+        parser.add_argument('--queries', type=int, default=200, help='오타 검색어 수 (기본값: 200)')
+        parser.add_argument('--batch-size', type=int, default=5000, help='bulk_create 배치 크기')
+        parser.add_argument('--cleanup', action='store_true', help='측정 후 생성한 영화를 삭제')
+
+    def handle(self, *args, **options):
+        rng = random.Random(17)
+        missing = options['movies'] - Movie.objects.count()
+        if missing > 0:
+            self.seed(rng, missing, options['batch_size'])
+
+        rows = list(Movie.objects.values_list('id', 'title', 'rating_count'))
+        self.stdout.write(f"카탈로그: 영화 {len(rows):,}개, pg_trgm {'사용' if has_pg_trgm() else '없음 (메모리 색인)'}")
+
+        started = time.perf_counter()
+        TrigramIndex().rebuild(rows)
+        build_ms = (time.perf_counter() - started) * 1000
+        tracemalloc.start()
+        index = TrigramIndex()
+        index.rebuild(rows)
+        memory_mb = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+        tracemalloc.stop()
+        self.stdout.write(f"메모리 색인 구성 {build_ms:,.0f}ms, 약 {memory_mb:,.1f}MB")
+        movie_trigram_index.rebuild(rows)
+
+        targets = rng.sample(rows, min(options['queries'], len(rows)))
+        queries = [(movie_id, self.misspell(rng, title)) for movie_id, title, _ in targets]
+        base = Movie.objects.defer('search_vector')
+
+        def legacy(text):
+            return list(search_movies(base, text).order_by('-search_score', '-id').values_list('id', flat=True)[:5])
+
+        def fuzzy(text):
+            return list(fuzzy_search_movies(base, text).order_by('-search_score', '-id').values_list('id', flat=True)[:5])
+
+        for label, search in (('legacy', legacy), ('fuzzy', fuzzy)):
+            timings, top1, top5 = [], 0, 0
+            for movie_id, text in queries:
+                started = time.perf_counter()
+                found = search(text)
+                timings.append((time.perf_counter() - started) * 1000)
+                top1 += found[:1] == [movie_id]
+                top5 += movie_id in found
+            timings.sort()
+            self.stdout.write(
+                f"{label:<7} recall@1 {top1 / len(queries):6.1%}  recall@5 {top5 / len(queries):6.1%}  "
+                f"p50 {statistics.median(timings):7.2f}ms  p95 {timings[int(len(timings) * 0.95) - 1]:7.2f}ms"
+            )
+        self.stdout.write(f"(유사도 기준 {get_config()['THRESHOLD']}, 검색어 예: {queries[0][1]!r})")
+
+        if options['cleanup']:
+            deleted, _ = Movie.objects.filter(title__startswith=BENCHMARK_PREFIX).delete()
+            self.stdout.write(f"벤치마크 영화 {deleted:,}개 삭제")
+
+    def seed(self, rng, count, batch_size):
+        """한글 2~4음절 / 영어 4~8글자 단어 1~3개로 된 제목 (검색 벡터는 rebuild 없이 비워 둠)"""
+        def word():
+            if rng.random() < 0.6:
+                return ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+            return ''.join(rng.choice(LETTERS) for _ in range(rng.randint(4, 8))).capitalize()
+
+        for start in range(0, count, batch_size):
+            Movie.objects.bulk_create([
+                Movie(
+                    title=f"{BENCHMARK_PREFIX} " + ' '.join(word() for _ in range(rng.randint(1, 3))),
+                    description='', release_date='2000-01-01',
+                )
+                for _ in range(min(batch_size, count - start))
+            ])
+        self.stdout.write(f"영화 {count:,}개 생성")
+
+    def misspell(self, rng, title):
+        """제목의 가장 긴 단어 한 곳에 오타 하나 (치환/삭제/삽입/인접 글자 순서 바꿈)"""
+        words = title.split()
+        i = max(range(len(words)), key=lambda k: len(words[k]))
+        chars = list(words[i])
+        alphabet = LETTERS if chars[0].isascii() else SYLLABLES
+        pos = rng.randrange(len(chars))
+        kind = rng.choice(('replace', 'delete', 'insert', 'swap') if len(chars) > 2 else ('replace', 'insert'))
+        if kind == 'replace':
+            chars[pos] = rng.choice(alphabet)
+        elif kind == 'delete':
+            del chars[pos]
+        elif kind == 'insert':
+            chars.insert(pos, rng.choice(alphabet))
+        else:
+            pos = min(pos, len(chars) - 2)
+            chars[pos], chars[pos + 1] = chars[pos + 1], chars[pos]
+        words[i] = ''.join(chars)
+        return ' '.join(words)
@@ -0,0 +1,103 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from movies.filters import MovieFilter
+from movies.models import Movie
+from ott.models import MAX_BITMASK_OTT_ID, OTT, ott_bitmask
+
+BENCHMARK_OTT_PREFIX = '벤치OTT'
+# 플랫폼별 제공 비율 (인기 플랫폼일수록 많은 영화를 제공)
+OTT_SHARES = (0.45, 0.3, 0.2, 0.15, 0.1, 0.05, 0.02, 0.01)
+
+
+class Command(BaseCommand):
+    help = (
+        "OTT 필터 성능 벤치마크: 영화마다 임의의 OTT 조합을 연결한 뒤 "
+        "연결 테이블 JOIN 필터와 Movie.ott_mask 비트 연산 필터의 p50/p95 지연 시간을 비교합니다. "
+        "(운영 DB가 아닌 별도 벤치마크 DB에서 실행하세요)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=20, help='조건별 반복 측정 횟수 (기본값: 20)')
+        parser.add_argument('--skip-seed', action='store_true', help='이미 연결된 OTT 데이터를 재사용')
+        parser.add_argument('--cleanup', action='store_true', help='측정 후 벤치마크 OTT와 연결을 삭제')
+
+    def handle(self, *args, **options):
+        rng = random.Random(18)
+        otts = list(OTT.objects.filter(name__startswith=BENCHMARK_OTT_PREFIX).order_by('id'))
+        if not options['skip_seed']:
+            otts = self.seed(rng)
+        popular, rare = [ott.pk for ott in otts[:2]], [ott.pk for ott in otts[-2:]]
+        self.stdout.write(f"측정 대상: 영화 {Movie.objects.count():,}개, OTT 연결 {Movie.ott_services.through.objects.count():,}개")
+
+        base = Movie.objects.defer('search_vector').order_by('-average_rating_cache', '-id')
+        joins = {
+            'any': lambda ids: base.filter(ott_services__id__in=ids).distinct(),
+            'all': lambda ids: self.join_all(base, ids),
+            'none': lambda ids: base.exclude(ott_services__id__in=ids),
+        }
+        movie_filter = MovieFilter()
+        masks = {
+            'any': lambda ids: movie_filter.filter_ott_any(base, 'ott_services', ids),
+            'all': lambda ids: movie_filter.filter_ott_all(base, 'ott_all', ids),
+            'none': lambda ids: movie_filter.filter_ott_none(base, 'ott_none', ids),
+        }
+        for mode in ('any', 'all', 'none'):
+            for label, ids in (('popular', popular), ('rare', rare)):
+                for kind, build in (('join', joins[mode]), ('mask', masks[mode])):
+                    queryset = build(ids)
+                    page = self.p95(lambda: list(queryset.all()[:20]), options['runs'])
+                    count = self.p95(lambda: queryset.count(), options['runs'])
+                    self.stdout.write(
+                        f"{mode:<5} {label:<8} {kind:<5} page p50 {page[0]:8.2f}ms p95 {page[1]:8.2f}ms   "
+                        f"count p50 {count[0]:8.2f}ms p95 {count[1]:8.2f}ms   ({queryset.count():,}개)"
+                    )
+
+        if options['cleanup']:
+            OTT.objects.filter(name__startswith=BENCHMARK_OTT_PREFIX).delete()
+            self.stdout.write("벤치마크 OTT 삭제")
+
+    def seed(self, rng):
+        """벤치마크 OTT를 다시 만들고 영화마다 OTT_SHARES 비율로 연결 (ott_mask도 한 번에 계산)"""
+        OTT.objects.filter(name__startswith=BENCHMARK_OTT_PREFIX).delete()
+        otts = [OTT.objects.create(name=f'{BENCHMARK_OTT_PREFIX}{i}') for i in range(len(OTT_SHARES))]
+        through = Movie.ott_services.through
+        movie_ids = list(Movie.objects.values_list('id', flat=True))
+        links, masks = [], {}
+        for movie_id in movie_ids:
+            chosen = [ott.pk for ott, share in zip(otts, OTT_SHARES) if rng.random() < share]
+            links.extend(through(movie_id=movie_id, ott_id=ott_id) for ott_id in chosen)
+            masks.setdefault(ott_bitmask(ott_id for ott_id in chosen if ott_id <= MAX_BITMASK_OTT_ID), []).append(movie_id)
+        through.objects.bulk_create(links, batch_size=5000)
+        # 연결 테이블을 직접 채웠으므로 비트마스크도 조합별 UPDATE로 직접 맞춤
+        Movie.objects.update(ott_mask=0)
+        for mask, ids in masks.items():
+            if mask:
+                for start in range(0, len(ids), 5000):
+                    Movie.objects.filter(pk__in=ids[start:start + 5000]).update(ott_mask=mask)
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {Movie._meta.db_table}')
+            cursor.execute(f'ANALYZE {through._meta.db_table}')
+        self.stdout.write(f"OTT {len(otts)}개, 연결 {len(links):,}개 생성")
+        return otts
+
+    @staticmethod
+    def join_all(queryset, ids):
+        for ott_id in ids:
+            queryset = queryset.filter(ott_services__id=ott_id)
+        return queryset
+
+    @staticmethod
+    def p95(func, runs):
+        func()
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        return statistics.median(timings), timings[max(int(len(timings) * 0.95) - 1, 0)]
@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import (
+    Case, Count, F, FloatField, IntegerField, OuterRef, Subquery, Sum, Value, When
+)
+from django.db.models.functions import Coalesce
+
+from movies.models import Movie
+from reviews.models import Review
+
+
+class Command(BaseCommand):
+    help = '리뷰 테이블을 기준으로 영화의 평점 집계(rating_sum / rating_count / average_rating_cache)를 일괄 재계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='한 번의 UPDATE로 처리할 영화 id 범위 크기 (기본값: 1000)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(options['batch_size'], 1)
+
+        # 영화별 리뷰 합계/개수를 상관 서브쿼리로 계산 (영화 단위 GROUP BY)
+        reviews = Review.objects.filter(movie_id=OuterRef('pk')).order_by().values('movie_id')
+        rating_sum = Subquery(reviews.annotate(total=Sum('rating')).values('total'), output_field=FloatField())
+        rating_count = Subquery(reviews.annotate(count=Count('id')).values('count'), output_field=IntegerField())
+
+        ids = Movie.objects.order_by('pk').values_list('pk', flat=True)
+        first_id, last_id = ids.first(), ids.last()
+        if first_id is None:
+            self.stdout.write('재계산할 영화가 없습니다.')
+            return
+
+        updated = 0
+        for start in range(first_id, last_id + 1, batch_size):
+            with transaction.atomic():
+                batch = Movie.objects.filter(pk__gte=start, pk__lt=start + batch_size)
+                updated += batch.update(
+                    rating_sum=Coalesce(rating_sum, Value(0.0)),
+                    rating_count=Coalesce(rating_count, Value(0)),
+                )
+                # 위 UPDATE로 확정된 합계/개수로 평균 캐시를 다시 계산
+                batch.update(
+                    average_rating_cache=Case(
+                        When(rating_count__gt=0, then=F('rating_sum') / F('rating_count')),
+                        default=Value(0.0),
+                        output_field=FloatField(),
+                    )
+                )
+
+        self.stdout.write(self.style.SUCCESS(f'총 {updated}개 영화의 평점 집계를 재계산했습니다.'))
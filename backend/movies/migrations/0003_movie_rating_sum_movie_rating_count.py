@@ -0,0 +1,43 @@
+# Generated by Django 5.2 on 2026-10-18 09:12
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_rating_aggregates(apps, schema_editor):
+    Movie = apps.get_model('movies', 'Movie')
+    Review = apps.get_model('reviews', 'Review')
+
+    stats = (
+        Review.objects.order_by()
+        .values('movie_id')
+        .annotate(total=Sum('rating'), count=Count('id'))
+    )
+    for row in stats.iterator():
+        Movie.objects.filter(pk=row['movie_id']).update(
+            rating_sum=row['total'] or 0.0,
+            rating_count=row['count'],
+            average_rating_cache=(row['total'] or 0.0) / row['count'],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0002_movie_average_rating_cache_alter_movie_description_and_more'),
+        ('reviews', '0012_delete_reviewlike'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, help_text='평점 합계에 포함된 리뷰 수', verbose_name='평점 개수'),
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='rating_sum',
+            field=models.FloatField(default=0.0, help_text='연결된 리뷰 평점의 누적 합계', verbose_name='평점 합계'),
+        ),
+        migrations.RunPython(backfill_rating_aggregates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,121 @@
+# Generated by Django 5.2 on 2026-10-18 18:52
+
+import re
+import unicodedata
+from collections import defaultdict
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+BATCH_SIZE = 1000
+
+# ---------------------------------------------------------------------
+# 이 마이그레이션 시점의 토크나이저 / tsvector 생성 고정 복사본 (config/search.py)
+# 앱 코드를 import하면 이후 토크나이저가 바뀔 때 과거 마이그레이션의 백필 결과도 바뀌므로 복사해 둠
+# ---------------------------------------------------------------------
+HANGUL_RUN_RE = re.compile(r'[가-힣]+|[^\W_가-힣]+')
+MAX_WORD_LENGTH = 64
+
+
+def document_terms(text):
+    terms = []
+    for word in HANGUL_RUN_RE.findall(unicodedata.normalize('NFKC', text or '').lower()):
+        if '가' <= word[0] <= '힣':
+            terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+            terms.append(word[-1])
+        else:
+            terms.append(word[:MAX_WORD_LENGTH])
+    return terms
+
+
+def _quote(term):
+    return "'" + term.replace("'", "''").replace('\\', '\\\\') + "'"
+
+
+def search_vector(weighted_texts, qualified_weights=''):
+    """[(텍스트, 'A'), (텍스트, 'B')] → tsvector 리터럴 (앱 코드는 캐스팅 표현식으로 감싸지만 여기서는 VALUES 파라미터로 넘김)"""
+    lexemes, position = defaultdict(list), 0
+    for text, weight in weighted_texts:
+        for term in document_terms(text):
+            position = min(position + 1, 16383)
+            lexemes[term].append(f"{position}{weight}")
+            if weight in qualified_weights:
+                lexemes[f"{weight}:{term}"].append(f"{position}{weight}")
+    literal = ' '.join(f"{_quote(term)}:{','.join(positions)}" for term, positions in lexemes.items())
+    return literal
+
+
+def movie_search_vector(title, description):
+    return search_vector([(title or '', 'A'), (description or '', 'B')])
+
+
+def backfill_search_vectors(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Movie = apps.get_model('movies', 'Movie')
+
+    # 행마다 UPDATE하지 않고 BATCH_SIZE개씩 UPDATE ... FROM (VALUES ...) 한 문장으로 반영
+    # (bulk_update의 CASE WHEN은 행마다 배치 크기만큼 비교하므로 이쪽이 약 3배 빠름)
+    rows = []
+    for pk, title, description in Movie.objects.values_list('pk', 'title', 'description').iterator(chunk_size=BATCH_SIZE):
+        rows.append((pk, movie_search_vector(title, description)))
+        if len(rows) >= BATCH_SIZE:
+            write_search_vectors(schema_editor, Movie._meta.db_table, rows)
+            rows = []
+    if rows:
+        write_search_vectors(schema_editor, Movie._meta.db_table, rows)
+
+
+def write_search_vectors(schema_editor, table, rows):
+    """(pk, tsvector 리터럴) 목록을 UPDATE 한 문장으로 저장"""
+    values = ', '.join(['(%s, %s::tsvector)'] * len(rows))
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f'UPDATE {table} AS t SET search_vector = v.vector FROM (VALUES {values}) AS v(id, vector) WHERE t.id = v.id',
+            [param for row in rows for param in row],
+        )
+
+
+def create_search_indexes(apps, schema_editor):
+    """
+    PostgreSQL 전용 인덱스
+    - search_vector GIN: 전문 검색(@@)
+    - 제목 pg_trgm GIN: 색인 단어가 없는 검색어의 부분 일치(ILIKE) 대체 경로 (확장이 있을 때만)
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS movie_search_vector_gin ON movies_movie USING gin (search_vector)'
+    )
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        has_trgm = cursor.fetchone() is not None
+    if has_trgm:
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS movie_title_trgm_gin ON movies_movie USING gin (title gin_trgm_ops)'
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS movie_title_trgm_gin')
+    schema_editor.execute('DROP INDEX IF EXISTS movie_search_vector_gin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0004_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='movies/search.py에서 관리하는 전문 검색용 tsvector', null=True, verbose_name='검색 벡터'),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
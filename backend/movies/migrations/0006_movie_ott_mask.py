@@ -0,0 +1,51 @@
+# Generated by Django 5.2 on 2026-10-18 20:58
+
+from django.db import migrations, models
+
+# ott.models.ott_bitmask 고정 복사본 (이후 앱 코드가 바뀌어도 이 마이그레이션 결과는 그대로)
+# - BIGINT 부호 비트를 피하기 위해 id 1~63만 비트로 표현하고, 그보다 큰 id는 건너뜀
+MAX_BITMASK_OTT_ID = 63
+
+
+def ott_bitmask(ott_ids):
+    mask = 0
+    for ott_id in ott_ids:
+        if 1 <= ott_id <= MAX_BITMASK_OTT_ID:
+            mask |= 1 << (ott_id - 1)
+    return mask
+
+
+def backfill_ott_masks(apps, schema_editor):
+    """기존 연결 테이블에서 영화별 비트마스크를 계산해 같은 조합끼리 한 번에 UPDATE"""
+    Movie = apps.get_model('movies', 'Movie')
+    ott_ids = {}
+    for movie_id, ott_id in Movie.ott_services.through.objects.values_list('movie_id', 'ott_id').iterator():
+        ott_ids.setdefault(movie_id, []).append(ott_id)
+    movie_ids_by_mask = {}
+    for movie_id, ids in ott_ids.items():
+        movie_ids_by_mask.setdefault(ott_bitmask(ids), []).append(movie_id)
+    for mask, movie_ids in movie_ids_by_mask.items():
+        if not mask:
+            continue
+        for start in range(0, len(movie_ids), 5000):
+            Movie.objects.filter(pk__in=movie_ids[start:start + 5000]).update(ott_mask=mask)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0005_movie_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='ott_mask',
+            field=models.BigIntegerField(default=0, editable=False, help_text='ott_services의 OTT id 비트 합 (ott.models.ott_bitmask)', verbose_name='제공 OTT 비트마스크'),
+        ),
+        migrations.RunPython(backfill_ott_masks, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['ott_mask'], name='movie_ott_mask_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 21:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0006_movie_ott_mask'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, help_text='F() 갱신(평점 집계, OTT 비트마스크) 때도 함께 갱신됩니다.', verbose_name='수정 일시'),
+        ),
+    ]
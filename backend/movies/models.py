@@ -1,6 +1,13 @@
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
-from ott.models import OTT
-from django.db.models import Avg
+from ott.models import MAX_BITMASK_OTT_ID, OTT, ott_bitmask
+from django.db.models import Avg, Case, Count, F, FloatField, Sum, Value, When
+from django.db.models.functions import Now
+
+from .cache import bump_catalog_version, bump_movie_rating_version
+from .fuzzy import movie_trigram_index, update_fuzzy_index
+from .search import update_search_document
+from .typeahead import movie_typeahead, update_typeahead
 
 # ✅ 영화 모델 정의
 class Movie(models.Model):
@@ -17,6 +24,12 @@ class Movie(models.Model):
         verbose_name="개봉일",
         help_text="영화의 공식 개봉일입니다."
     )
+    # ✅ 응답에 보이는 값(정보/제공 OTT/평점 집계)이 바뀐 시각 (상세 조회 ETag / Last-Modified 검증값)
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="수정 일시",
+        help_text="F() 갱신(평점 집계, OTT 비트마스크) 때도 함께 갱신됩니다."
+    )
     thumbnail_url = models.URLField(
         blank=True,
         null=True,
@@ -31,6 +44,16 @@ class Movie(models.Model):
         verbose_name="제공 OTT"
     )
 
+    # ✅ 제공 OTT 비트마스크 (ott_services 비정규화, 다중 OTT 필터를 JOIN 없이 한 컬럼 비트 연산으로)
+    # - OTT id n → 비트 1 << (n - 1), ott_services 변경 시 m2m_changed 신호로 갱신
+    # - id가 MAX_BITMASK_OTT_ID(63)보다 큰 OTT는 비트가 없음 (movies/filters.py에서 연결 테이블로 확인)
+    ott_mask = models.BigIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="제공 OTT 비트마스크",
+        help_text="ott_services의 OTT id 비트 합 (ott.models.ott_bitmask)"
+    )
+
     # ✅ 저장된 평균 평점 필드 (API 정렬용 캐싱)
     average_rating_cache = models.FloatField(
         default=0.0,
@@ -38,6 +61,76 @@ class Movie(models.Model):
         help_text="DB에 저장된 평균 평점 (성능 개선용)"
     )
 
+    # ✅ 평점 누적 합계 / 리뷰 수 (리뷰 테이블을 다시 읽지 않고 평균을 갱신하기 위한 집계 컬럼)
+    rating_sum = models.FloatField(
+        default=0.0,
+        verbose_name="평점 합계",
+        help_text="연결된 리뷰 평점의 누적 합계"
+    )
+    rating_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="평점 개수",
+        help_text="평점 합계에 포함된 리뷰 수"
+    )
+
+    # ✅ 검색 문서 (제목 A / 설명 B 가중치 n-gram tsvector, PostgreSQL에서만 채워짐)
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        verbose_name="검색 벡터",
+        help_text="movies/search.py에서 관리하는 전문 검색용 tsvector"
+    )
+
+    def save(self, *args, **kwargs):
+        """
+        제목/설명이 저장될 때만 검색 문서/자동완성/오타 허용 색인을 갱신 (평점 집계 등 다른 필드 저장 시에는 건너뜀)
+        """
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'updated_at' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'updated_at']
+        super().save(*args, **kwargs)
+        bump_catalog_version()
+        if update_fields is None or {'title', 'description'} & set(update_fields):
+            update_search_document(self)
+            update_typeahead(self)
+            update_fuzzy_index(self)
+
+    def delete(self, *args, **kwargs):
+        movie_id = self.pk
+        result = super().delete(*args, **kwargs)
+        bump_catalog_version()
+        movie_typeahead.remove(movie_id)
+        movie_trigram_index.remove(movie_id)
+        return result
+
+    def refresh_ott_mask(self):
+        """ott_services 연결 테이블에서 비트마스크를 다시 계산해 이 컬럼만 저장"""
+        ott_ids = self.ott_services.values_list('id', flat=True)
+        self.ott_mask = ott_bitmask(ott_id for ott_id in ott_ids if ott_id <= MAX_BITMASK_OTT_ID)
+        Movie.objects.filter(pk=self.pk).update(ott_mask=self.ott_mask, updated_at=Now())
+
+    @classmethod
+    def apply_rating_delta(cls, movie_id, sum_delta=0.0, count_delta=0):
+        """
+        리뷰 작성/평점 변경/삭제 시 집계 컬럼을 F() 표현식으로 원자적으로 갱신합니다.
+        average_rating_cache도 같은 UPDATE 문에서 합계/개수로부터 계산합니다.
+        """
+        new_sum = F('rating_sum') + sum_delta
+        new_count = F('rating_count') + count_delta
+        updated = cls.objects.filter(pk=movie_id).update(
+            rating_sum=new_sum,
+            rating_count=new_count,
+            updated_at=Now(),
+            average_rating_cache=Case(
+                When(rating_count__gt=-count_delta, then=new_sum / new_count),
+                default=Value(0.0),
+                output_field=FloatField(),
+            ),
+        )
+        # 쓰기 후에 올려야 autocommit에서도 (on_commit이 바로 실행) 옛 데이터가 새 버전으로 캐시되지 않음
+        bump_movie_rating_version(movie_id)
+        return updated
+
     def calculate_average_rating(self):
         """
         연결된 리뷰의 평균 평점을 계산하여 반환합니다.
@@ -47,11 +140,63 @@ class Movie(models.Model):
     
     def update_average_rating(self):
         """
-        영화의 평점 캐시를 업데이트합니다.
-        리뷰가 추가/수정될 때마다 호출됩니다.
+        리뷰 테이블을 전체 집계하여 평점 캐시를 다시 계산합니다.
+        (평소에는 apply_rating_delta로 증분 갱신되며, 보정용으로만 사용)
         """
-        self.average_rating_cache = self.calculate_average_rating()
-        self.save()
+        stats = self.reviews.aggregate(total=Sum('rating'), count=Count('id'))
+        self.rating_sum = stats['total'] or 0.0
+        self.rating_count = stats['count']
+        self.average_rating_cache = (
+            self.rating_sum / self.rating_count if self.rating_count else 0.0
+        )
+        self.save(update_fields=['rating_sum', 'rating_count', 'average_rating_cache'])
+
+    class Meta:
+        indexes = [
+            # 영화 목록 정렬(평점순/리뷰 많은 순/개봉일순) 키셋 페이지네이션용 (정렬 키 + id)
+            models.Index(fields=['-average_rating_cache', '-id'], name='movie_rating_id_idx'),
+            models.Index(fields=['-rating_count', '-id'], name='movie_review_count_id_idx'),
+            models.Index(fields=['release_date', 'id'], name='movie_release_id_idx'),
+            # OTT 필터 (ott_mask IN (조건을 만족하는 조합들), 건수 집계는 인덱스만 읽음)
+            models.Index(fields=['ott_mask'], name='movie_ott_mask_idx'),
+            # search_vector GIN / 제목 pg_trgm 인덱스는 PostgreSQL 전용이라 마이그레이션(0005)에서 생성
+        ]
 
     def __str__(self):
-        return self.title
\ No newline at end of file
+        return self.title
+
+
+# ✅ ott_mask 동기화 (영화 등록/수정의 ott_services.set(), 관리자 화면, OTT 쪽 역방향 변경 모두 처리)
+def handle_ott_services_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        # 같은 인스턴스를 이후에 save()해도 오래된 값으로 덮어쓰지 않도록 메모리 값도 갱신
+        instance.refresh_ott_mask()
+        bump_catalog_version()
+        return
+    if instance.pk > MAX_BITMASK_OTT_ID:
+        # 비트가 없는 OTT는 응답(제공 OTT 목록)만 바뀌므로 수정 시각만 갱신
+        if pk_set:
+            Movie.objects.filter(pk__in=pk_set).update(updated_at=Now())
+        bump_catalog_version()
+        return
+    bit = ott_bitmask([instance.pk])
+    movies = Movie.objects.alias(ott_hit=F('ott_mask').bitand(bit))
+    if action == 'post_add':
+        movies.filter(pk__in=pk_set).update(ott_mask=F('ott_mask').bitor(bit), updated_at=Now())
+    elif action == 'post_remove':
+        movies.filter(pk__in=pk_set).update(ott_mask=F('ott_mask').bitand(~bit), updated_at=Now())
+    else:
+        movies.filter(ott_hit__gt=0).update(ott_mask=F('ott_mask').bitand(~bit), updated_at=Now())
+    bump_catalog_version()
+
+
+def handle_ott_deleted(sender, instance, **kwargs):
+    """OTT 삭제 시 연결 행은 CASCADE로 지워지며 m2m_changed가 발생하지 않으므로 직접 비트 제거"""
+    if instance.pk <= MAX_BITMASK_OTT_ID:
+        bit = ott_bitmask([instance.pk])
+        Movie.objects.alias(ott_hit=F('ott_mask').bitand(bit)).filter(ott_hit__gt=0).update(
+            ott_mask=F('ott_mask').bitand(~bit), updated_at=Now()
+        )
+    bump_catalog_version()
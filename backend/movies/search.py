@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.db.models import F, FloatField, Value
+
+from config.search import DocumentSearch, query_terms
+
+# ---------------------------------------------------------------------
+# ✅ 영화 검색 엔진
+# - PostgreSQL: Movie.search_vector(제목 A / 설명 B 가중치 tsvector) + GIN 인덱스
+# - 그 외(SQLite 테스트 등): 프로세스 내 역색인으로 같은 API 제공
+# - 점수 = 관련도 × (1 + RATING_WEIGHT × 평균 평점 / 5)
+# ---------------------------------------------------------------------
+DEFAULT_CONFIG = {
+    'RATING_WEIGHT': 0.5,       # 관련도에 평균 평점을 섞는 비율
+}
+
+movie_document_search = DocumentSearch({'title': 'A', 'description': 'B'})
+movie_index = movie_document_search.index
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'MOVIE_SEARCH', {})}
+
+
+def movie_search_vector(title, description):
+    return movie_document_search.vector({'title': title, 'description': description})
+
+
+def update_search_document(movie):
+    """영화 저장 후 검색 문서를 갱신합니다."""
+    movie_document_search.update_document(movie)
+
+
+def search_movies(queryset, text, title_only=False):
+    """
+    검색어에 맞는 영화만 남기고 search_score(관련도 × 평점 가중치)를 annotate 합니다.
+    정렬은 호출하는 쪽에서 결정합니다.
+    """
+    text = (text or '').strip()
+    if not text:
+        return queryset
+
+    rating_boost = 1 + get_config()['RATING_WEIGHT'] * F('average_rating_cache') / 5
+    if not query_terms(text):
+        # 기호만으로 된 검색어 등 색인 단어가 없으면 제목 부분 일치 (pg_trgm 인덱스가 있으면 사용)
+        return queryset.filter(title__icontains=text).annotate(
+            search_score=Value(0.0, output_field=FloatField()) * rating_boost
+        )
+    return movie_document_search.filter(queryset, text, weights='A' if title_only else '', boost=rating_boost)
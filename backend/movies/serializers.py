@@ -1,7 +1,9 @@
 from rest_framework import serializers
 from .models import Movie
 from ott.models import OTT
-from reviews.serializers import ReviewSerializer
+from reviews.models import Review
+from reviews.pagination import paginate_movie_reviews
+from reviews.serializers import PublicReviewSerializer
 
 # ✅ OTT 플랫폼 정보 (중복 방지용 ref_name 사용)
 class OTTSerializer(serializers.ModelSerializer):
@@ -10,6 +12,38 @@ class OTTSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'logo_url']
         ref_name = 'MovieApp_OTT'  # Swagger에서 ott.serializers.OTTSerializer와 충돌 방지
 
+# ✅ 영화 목록용 경량 직렬화 (중첩 리뷰 없이 캐시된 평균 평점 / 주석된 리뷰 수 사용)
+class MovieListSerializer(serializers.ModelSerializer):
+    ott_services = serializers.PrimaryKeyRelatedField(
+        many=True,
+        read_only=True,
+        help_text="이 영화를 제공하는 OTT ID 리스트 (예: [1, 2])"
+    )
+    average_rating = serializers.SerializerMethodField(
+        help_text="영화의 평균 평점 (소수점 첫째자리까지, 캐시 값)"
+    )
+    review_count = serializers.IntegerField(
+        read_only=True,
+        help_text="리뷰 참여 인원(리뷰 개수)"
+    )
+
+    class Meta:
+        model = Movie
+        fields = [
+            'id',
+            'title',
+            'description',
+            'release_date',
+            'thumbnail_url',
+            'ott_services',
+            'average_rating',
+            'review_count',
+        ]
+
+    def get_average_rating(self, obj):
+        return round(obj.average_rating_cache, 1)
+
+
 # ✅ 영화 정보 직렬화
 class MovieSerializer(serializers.ModelSerializer):
     ott_services = serializers.PrimaryKeyRelatedField(
@@ -18,8 +52,12 @@ class MovieSerializer(serializers.ModelSerializer):
         help_text="이 영화를 제공하는 OTT ID 리스트 (예: [1, 2])"
     )
 
-    # [변경] 리뷰는 반드시 context와 함께 ReviewSerializer에 넘겨야 함!
+    # [변경] 리뷰는 반드시 context와 함께 PublicReviewSerializer에 넘겨야 함! (이미지 URL, 사용자별 필드 없음)
+    # 첫 페이지(최신순)만 포함하고, 나머지는 reviews_next 커서 링크로 이어서 조회
     reviews = serializers.SerializerMethodField()
+    reviews_next = serializers.SerializerMethodField(
+        help_text="다음 리뷰 페이지 조회 링크 (/api/reviews/?movie=<id>&cursor=...), 없으면 null"
+    )
 
     average_rating = serializers.SerializerMethodField(
         help_text="영화의 평균 평점 (소수점 첫째자리까지)"
@@ -37,17 +75,45 @@ class MovieSerializer(serializers.ModelSerializer):
             'thumbnail_url',
             'ott_services',
             'reviews',
+            'reviews_next',
             'average_rating',
             'review_count',
         ]
 
+    def _get_review_page(self, obj):
+        """
+        첫 페이지 리뷰와 다음 페이지 링크를 영화별로 한 번만 계산합니다.
+        """
+        pages = self.__dict__.setdefault('_review_pages', {})
+        if obj.pk not in pages:
+            queryset = PublicReviewSerializer.setup_eager_loading(Review.objects.filter(movie=obj))
+            pages[obj.pk] = paginate_movie_reviews(obj, queryset, self.context.get('request'))
+        return pages[obj.pk]
+
     def get_average_rating(self, obj):
-        return round(obj.calculate_average_rating(), 1)
+        return round(obj.average_rating_cache, 1)
 
     def get_reviews(self, obj):
         request = self.context.get('request')
-        reviews_qs = obj.reviews.all()
-        return ReviewSerializer(reviews_qs, many=True, context={'request': request}).data
-    
+        reviews, _ = self._get_review_page(obj)
+        return PublicReviewSerializer(reviews, many=True, context={'request': request}).data
+
+    def get_reviews_next(self, obj):
+        _, next_link = self._get_review_page(obj)
+        return next_link
+
     def get_review_count(self, obj):
-        return obj.reviews.count()  # ← 리뷰 개수 반환
\ No newline at end of file
+        return obj.rating_count  # ← 증분 집계 컬럼 (리뷰 개수)
+
+    def update(self, instance, validated_data):
+        """
+        수정한 필드만 저장합니다.
+        (전체 행을 저장하면 요청이 읽어 둔 평점 집계 값으로 그 사이 작성/삭제된 리뷰의 반영을 덮어씀)
+        """
+        ott_services = validated_data.pop('ott_services', None)
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=list(validated_data))  # updated_at은 Movie.save에서 추가
+        if ott_services is not None:
+            instance.ott_services.set(ott_services)
+        return instance
@@ -1,3 +1,717 @@
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+
+from config import stale_cache
+from config.checks import check_shared_cache
+from config.response_cache import response_cache_stats
+from movies.fuzzy import movie_trigram_index
+from movies.models import Movie
+from movies.search import movie_index
+from movies.typeahead import movie_typeahead
+from movies.views import MovieDetailEditDeleteView
+from ott.models import OTT
+from reviews.models import Review
+from reviews.pagination import ReviewCursorPagination
+
+User = get_user_model()
+
+# 쿼리 수 검증 테스트는 캐시 조회(기본 DB 캐시)가 쿼리 수에 섞이지 않도록 프로세스 메모리 캐시로
+LOCAL_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+class ReconcileMovieRatingsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='reconciler',
+            email='reconciler@example.com',
+            password='pass1234'
+        )
+        self.movie = Movie.objects.create(title='집계 영화', description='설명', release_date='2024-01-01')
+        self.empty_movie = Movie.objects.create(title='리뷰 없는 영화', description='설명', release_date='2024-01-01')
+
+    def test_reconcile_recomputes_drifted_aggregates(self):
+        # bulk_create는 save()를 거치지 않으므로 집계 컬럼이 어긋난 상태가 됨
+        Review.objects.bulk_create([
+            Review(user=self.user, movie=self.movie, rating=rating) for rating in (5, 4, 3)
+        ])
+        Movie.objects.filter(pk=self.empty_movie.pk).update(rating_sum=9, rating_count=2, average_rating_cache=4.5)
+
+        call_command('reconcile_movie_ratings', batch_size=1, stdout=StringIO())
+
+        self.movie.refresh_from_db()
+        self.empty_movie.refresh_from_db()
+        self.assertEqual((self.movie.rating_sum, self.movie.rating_count), (12.0, 3))
+        self.assertEqual(self.movie.average_rating_cache, 4.0)
+        self.assertEqual((self.empty_movie.rating_sum, self.empty_movie.rating_count), (0.0, 0))
+        self.assertEqual(self.empty_movie.average_rating_cache, 0.0)
+
+
+class MovieWriteRatingAggregateTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='editor', email='editor@example.com', password='pass1234')
+        self.ott = OTT.objects.create(name='N')
+        self.movie = Movie.objects.create(title='수정 전', description='설명', release_date='2024-01-01')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_edit_keeps_reviews_written_after_the_row_was_loaded(self):
+        get_object = MovieDetailEditDeleteView.get_object
+
+        def get_object_then_review(view):
+            movie = get_object(view)
+            # 수정 요청이 영화 행을 읽은 뒤 다른 요청이 리뷰를 작성
+            Review.objects.create(user=self.user, movie=self.movie, rating=4)
+            return movie
+
+        with mock.patch.object(MovieDetailEditDeleteView, 'get_object', get_object_then_review):
+            response = self.client.put(f'/api/movies/{self.movie.pk}/edit/', {
+                'title': '수정 후', 'description': '설명', 'release_date': '2024-01-01', 'ott_services': [self.ott.pk],
+            }, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.movie.refresh_from_db()
+        self.assertEqual(self.movie.title, '수정 후')
+        self.assertEqual((self.movie.rating_sum, self.movie.rating_count, self.movie.average_rating_cache), (4.0, 1, 4.0))
+        self.assertEqual(self.movie.ott_mask, 1 << (self.ott.pk - 1))
+
+    def test_create_does_not_write_rating_aggregates_twice(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post('/api/movies/create/', {
+                'title': '새 영화', 'description': '설명', 'release_date': '2024-01-01',
+                'thumbnail_url': 'https://example.com/a.jpg', 'ott_services': [self.ott.pk],
+            }, format='json')
+        self.assertEqual(response.status_code, 201)
+        rewrites = [
+            query['sql'] for query in ctx.captured_queries
+            if query['sql'].startswith('UPDATE') and 'rating_sum' in query['sql']
+        ]
+        self.assertEqual(rewrites, [])
+        movie = Movie.objects.get(pk=response.data['id'])
+        self.assertEqual((movie.average_rating_cache, movie.ott_mask), (0.0, 1 << (self.ott.pk - 1)))
+
+
+@override_settings(CACHES=LOCAL_CACHES)
+class MovieListSerializerTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='lister',
+            email='lister@example.com',
+            password='pass1234'
+        )
+        for i in range(3):
+            movie = Movie.objects.create(title=f'목록 영화 {i}', description='설명', release_date='2024-01-01')
+            Review.objects.create(user=self.user, movie=movie, rating=4)
+            Review.objects.create(user=self.user, movie=movie, rating=3)
+
+    def test_list_uses_cached_aggregates_without_nested_reviews(self):
+        # 페이지네이션 COUNT + 영화 목록 + OTT prefetch
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/movies/')
+        self.assertEqual(response.status_code, 200)
+        first = response.json()['results'][0]
+        self.assertNotIn('reviews', first)
+        self.assertEqual(first['average_rating'], 3.5)
+        self.assertEqual(first['review_count'], 2)
+
+    def test_search_orders_by_review_count(self):
+        response = self.client.get('/api/movies/search/', {'search': '목록', 'ordering': '-review_count'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['count'], 3)
+
+
+@override_settings(CACHES=LOCAL_CACHES)
+class MovieDetailQueryBudgetTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='budget',
+            email='budget@example.com',
+            password='pass1234'
+        )
+        cache.clear()
+        self.small_movie = Movie.objects.create(title='리뷰 1개 영화', description='설명', release_date='2024-01-01')
+        self.big_movie = Movie.objects.create(title='리뷰 5000개 영화', description='설명', release_date='2024-01-01')
+        Review.objects.create(user=self.user, movie=self.small_movie, rating=4)
+        Review.objects.bulk_create([
+            Review(user=self.user, movie=self.big_movie, rating=(i % 10 + 1) / 2)
+            for i in range(5000)
+        ])
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def count_detail_queries(self, movie):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f'/api/movies/{movie.id}/')
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response.json()
+
+    def test_detail_query_count_is_independent_of_review_count(self):
+        small_queries, _ = self.count_detail_queries(self.small_movie)
+        big_queries, data = self.count_detail_queries(self.big_movie)
+
+        # 영화 + OTT + 리뷰 첫 페이지 + 이미지 + 내 투표
+        self.assertLessEqual(big_queries, 5)
+        self.assertEqual(big_queries, small_queries)
+        self.assertEqual(len(data['reviews']), ReviewCursorPagination.page_size)
+        self.assertIsNotNone(data['reviews_next'])
+
+    def test_reviews_next_cursor_continues_listing(self):
+        _, data = self.count_detail_queries(self.big_movie)
+        response = self.client.get(data['reviews_next'])
+        self.assertEqual(response.status_code, 200)
+        next_ids = [review['id'] for review in response.json()['results']]
+        first_ids = [review['id'] for review in data['reviews']]
+        self.assertEqual(len(next_ids), ReviewCursorPagination.page_size)
+        self.assertFalse(set(first_ids) & set(next_ids))
+
+    @override_settings(STALE_RESPONSE_CACHE={'ENABLED': False})
+    def test_detail_ignores_cursor_param_for_embedded_reviews(self):
+        _, data = self.count_detail_queries(self.big_movie)
+        cursor = parse_qs(urlparse(data['reviews_next']).query)['cursor'][0]
+        response = self.client.get(f'/api/movies/{self.big_movie.id}/', {'cursor': cursor})
+        self.assertEqual(response.json()['reviews'], data['reviews'])
+        self.assertEqual(response.json()['reviews_next'], data['reviews_next'])
+
+
+class MovieConditionalGetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='etag', email='etag@example.com', password='pass1234')
+        self.movie = Movie.objects.create(title='조건부 영화', description='설명', release_date='2024-01-01')
+        self.review = Review.objects.create(user=self.user, movie=self.movie, rating=4)
+        self.url = f'/api/movies/{self.movie.id}/'
+        self.client = APIClient()
+
+    def get(self, client=None, **headers):
+        return (client or self.client).get(self.url, headers=headers)
+
+    def test_unchanged_movie_returns_304_with_single_query(self):
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.get(if_none_match=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(self.get(if_modified_since=response['Last-Modified']).status_code, 304)
+        self.assertEqual(self.client.get('/api/movies/999999/', headers={'If-None-Match': etag}).status_code, 404)
+
+        # 응답에 사용자별 필드가 없으므로 로그인 사용자도 같은 ETag
+        member = APIClient()
+        member.force_authenticate(self.user)
+        self.assertEqual(self.get(member, if_none_match=etag).status_code, 304)
+        self.assertNotIn('my_vote', self.get(member).json()['reviews'][0])
+
+    def test_movie_and_review_changes_invalidate_etag(self):
+        etags = [self.get()['ETag']]
+
+        # 리뷰 좋아요 (영화 행은 바뀌지 않지만 응답의 리뷰 좋아요 수가 바뀜)
+        voter = User.objects.create_user(username='voter', email='voter@example.com', password='pass1234')
+        client = APIClient()
+        client.force_authenticate(voter)
+        client.post(f'/api/reviews/{self.review.id}/like/')
+        etags.append(self.get()['ETag'])
+
+        # 새 리뷰 (평점 집계)
+        Review.objects.create(user=voter, movie=self.movie, rating=2)
+        etags.append(self.get()['ETag'])
+
+        # 영화 정보 수정
+        self.movie.title = '바뀐 제목'
+        self.movie.save(update_fields=['title'])
+        response = self.get(if_none_match=etags[-1])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], '바뀐 제목')
+        etags.append(response['ETag'])
+        self.assertEqual(len(set(etags)), 4)
+
+    def test_etag_depends_on_query_params(self):
+        etag = self.get()['ETag']
+        response = self.client.get(self.url, {'cursor': 'abc', 'format': 'json'}, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+        # 순서만 다른 파라미터는 같은 ETag
+        reordered = self.client.get(self.url, {'format': 'json', 'cursor': 'abc'}, headers={'If-None-Match': response['ETag']})
+        self.assertEqual(reordered.status_code, 304)
+
+
+@override_settings(CACHES=LOCAL_CACHES)
+class MovieDetailStaleCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        stale_cache.stale_cache_stats.reset()
+        self.movie = Movie.objects.create(title='인기 영화', description='설명', release_date='2024-01-01')
+        self.url = f'/api/movies/{self.movie.id}/'
+        self.key = f'stale_cache:movies:detail:http://testserver:{self.movie.id}'
+        self.client = APIClient()
+
+    def get(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_serves_stale_entry_while_another_worker_regenerates(self):
+        first = self.get()
+        self.assertEqual(first['X-Cache'], 'MISS')
+        with self.assertNumQueries(1):
+            self.assertEqual(self.get()['X-Cache'], 'HIT')
+
+        self.movie.title = '바뀐 제목'
+        self.movie.save(update_fields=['title'])
+        # 다른 워커가 재생성 중 → 이전 항목과 그 ETag로 바로 응답
+        cache.add(stale_cache.lock_key(self.key), 'other-worker', 10)
+        with self.assertNumQueries(1):
+            response = self.get()
+        self.assertEqual((response['X-Cache'], response.json()['title']), ('STALE', '인기 영화'))
+        self.assertEqual(response['ETag'], first['ETag'])
+
+        cache.delete(stale_cache.lock_key(self.key))
+        response = self.get()
+        self.assertEqual((response['X-Cache'], response.json()['title']), ('REFRESH', '바뀐 제목'))
+        self.assertEqual(self.get()['X-Cache'], 'HIT')
+        self.assertIsNone(cache.get(stale_cache.lock_key(self.key)))
+
+        with override_settings(STALE_RESPONSE_CACHE={'SOFT_TTL': 0}):
+            self.assertEqual(self.get()['X-Cache'], 'REFRESH')
+        stats = stale_cache.stale_cache_stats.snapshot()['movies:detail']
+        self.assertEqual((stats['hit'], stats['stale'], stats['refresh'], stats['stampedes_avoided']), (2, 1, 2, 1))
+
+    def test_requests_with_query_params_bypass_cache(self):
+        response = self.client.get(self.url, {'cursor': 'abc'})
+        self.assertEqual(response['X-Cache'], 'BYPASS')
+        self.assertIsNone(cache.get(self.key))
+
+        self.assertEqual(self.get()['X-Cache'], 'MISS')
+        self.movie.title = '바뀐 제목'
+        self.movie.save(update_fields=['title'])
+        cache.add(stale_cache.lock_key(self.key), 'other-worker', 10)
+        # 이전 항목이 있어도 파라미터가 있는 요청은 직접 만든 응답
+        response = self.client.get(self.url, {'format': 'json'})
+        self.assertEqual((response['X-Cache'], response.json()['title']), ('BYPASS', '바뀐 제목'))
+
+    def test_process_local_cache_is_reported_at_startup(self):
+        # 이 테스트 클래스는 LocMem 캐시 → 재생성 잠금이 워커끼리 공유되지 않는다는 경고
+        warnings = [error.msg for error in check_shared_cache(None) if error.id == 'config.W001']
+        self.assertTrue(any('STALE_RESPONSE_CACHE' in msg for msg in warnings))
+
+    def test_single_flight_across_threads(self):
+        builds = []
+
+        def build():
+            builds.append(threading.get_ident())
+            time.sleep(0.2)
+            return None, {'title': f'build {len(builds)}'}
+
+        def stampede(version):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(lambda _: stale_cache.fetch('stampede', version, build), range(8)))
+            return Counter(outcome for _, _, outcome in results), {entry['data']['title'] for _, entry, _ in results}
+
+        # 항목 없음: 한 스레드만 만들고 나머지는 그 결과를 기다림
+        self.assertEqual(stampede(1), (Counter({'wait': 7, 'miss': 1}), {'build 1'}))
+        # 검증값 변경: 한 스레드만 다시 만들고 나머지는 기다리지 않고 이전 항목
+        outcomes, titles = stampede(2)
+        self.assertEqual(outcomes, Counter({'stale': 7, 'refresh': 1}))
+        self.assertEqual(titles, {'build 1', 'build 2'})
+        self.assertEqual(len(builds), 2)
+
+        # 잠금을 잡은 워커가 결과를 남기지 못하면 기다리다가 직접 만듦
+        cache.add(stale_cache.lock_key('orphan'), 'dead-worker', 10)
+        with override_settings(STALE_RESPONSE_CACHE={'WAIT_TIMEOUT': 0.05}):
+            self.assertEqual(stale_cache.fetch('orphan', 1, build)[2], 'wait_timeout')
+
+
+@override_settings(CACHES=LOCAL_CACHES)
+class MovieKeysetPaginationTest(TestCase):
+    def setUp(self):
+        # 응답 캐시(LocMemCache)는 테스트 간 롤백을 모르고, bulk_create는 버전 카운터를 올리지 않으므로 매번 초기화
+        cache.clear()
+        # 평점/개봉일 동률이 많은 데이터 (정렬 키만으로는 순서가 정해지지 않음)
+        Movie.objects.bulk_create([
+            Movie(
+                title=f'커서 영화 {i}', description='설명',
+                release_date=f'2024-01-{i % 3 + 1:02d}', average_rating_cache=float(i % 2),
+            )
+            for i in range(45)
+        ])
+
+    def walk(self, ordering):
+        ids, pages = [], []
+        url, params = '/api/movies/', {'cursor': '', 'ordering': ordering}
+        while url:
+            with CaptureQueriesContext(connection) as ctx:
+                body = self.client.get(url, params).json()
+            pages.append((body, len(ctx.captured_queries)))
+            ids += [movie['id'] for movie in body['results']]
+            url, params = body['next'], None
+        return ids, pages
+
+    def test_cursor_walk_is_complete_and_stable(self):
+        for ordering, order_by in [
+            ('-average_rating_cache', ('-average_rating_cache', '-id')),
+            ('release_date', ('release_date', 'id')),
+        ]:
+            ids, pages = self.walk(ordering)
+            self.assertEqual(ids, list(Movie.objects.order_by(*order_by).values_list('id', flat=True)))
+            # COUNT/OFFSET 없이 마지막 페이지도 첫 페이지와 같은 쿼리 수
+            self.assertEqual({queries for _, queries in pages}, {2})
+            self.assertNotIn('count', pages[0][0])
+
+    def test_previous_link_returns_previous_page(self):
+        _, pages = self.walk('-average_rating_cache')
+        previous = self.client.get(pages[1][0]['previous']).json()
+        self.assertEqual(
+            [movie['id'] for movie in previous['results']],
+            [movie['id'] for movie in pages[0][0]['results']],
+        )
+
+    def test_invalid_cursor_returns_404(self):
+        self.assertEqual(self.client.get('/api/movies/', {'cursor': 'bogus'}).status_code, 404)
+
+
+class MovieSearchTest(TestCase):
+    def setUp(self):
+        # 프로세스 내 역색인(SQLite 대체 경로)은 테스트 간 롤백을 모르므로 매번 초기화
+        movie_index.reset()
+        cache.clear()
+        self.parasite = Movie.objects.create(title='기생충', description='봉준호 감독의 가족 희비극', release_date='2019-05-30')
+        self.memories = Movie.objects.create(title='살인의 추억', description='봉준호 감독의 연쇄살인 수사극', release_date='2003-04-25')
+        self.interstellar = Movie.objects.create(title='Interstellar', description='우주 탐사 SF', release_date='2014-11-06')
+        Movie.objects.filter(pk=self.memories.pk).update(average_rating_cache=4.5)
+
+    def search(self, **params):
+        response = self.client.get('/api/movies/search/', params)
+        self.assertEqual(response.status_code, 200)
+        return [movie['title'] for movie in response.json()['results']]
+
+    def test_korean_ngram_and_prefix_matching(self):
+        self.assertEqual(self.search(search='기생충'), ['기생충'])
+        self.assertEqual(self.search(search='생충'), ['기생충'])
+        self.assertEqual(self.search(search='충'), ['기생충'])
+        self.assertEqual(self.search(search='inter'), ['Interstellar'])
+        self.assertEqual(self.search(search='우주 탐사'), ['Interstellar'])
+        self.assertEqual(self.search(search='없는영화'), [])
+
+    def test_relevance_blends_rating_and_title_weight(self):
+        # 설명에서만 일치하는 두 영화 → 평점 높은 쪽이 먼저
+        self.assertEqual(self.search(search='봉준호'), ['살인의 추억', '기생충'])
+        # 제목 일치(가중치 A)가 설명 일치보다 우선
+        Movie.objects.create(title='봉준호 특별전', description='기획전', release_date='2020-01-01')
+        self.assertEqual(self.search(search='봉준호')[0], '봉준호 특별전')
+        # ordering을 지정하면 그 정렬을 따름
+        self.assertEqual(self.search(search='봉준호', ordering='release_date')[0], '살인의 추억')
+
+    def test_title_filter_and_index_updates(self):
+        self.assertEqual(self.search(title='봉준호'), [])
+        self.parasite.title = '괴물'
+        self.parasite.save()
+        self.assertEqual(self.search(title='괴물'), ['괴물'])
+        self.assertEqual(self.search(search='기생충'), [])
+
+
+class MovieTypeaheadTest(TestCase):
+    def setUp(self):
+        movie_typeahead.reset()
+        self.parasite = Movie.objects.create(title='기생충', description='설명', release_date='2019-05-30')
+        Movie.objects.create(title='살인의 추억', description='설명', release_date='2003-04-25')
+        Movie.objects.create(title='Interstellar', description='설명', release_date='2014-11-06')
+        popular = Movie.objects.create(title='기억의 밤', description='설명', release_date='2017-11-29')
+        Movie.objects.filter(pk=popular.pk).update(rating_count=10)
+
+    def suggest(self, q):
+        response = self.client.get('/api/movies/suggest/', {'q': q})
+        self.assertEqual(response.status_code, 200)
+        return [movie['title'] for movie in response.json()]
+
+    def test_choseong_jamo_and_syllable_prefixes(self):
+        self.assertEqual(self.suggest('ㄱㅅㅊ'), ['기생충'])
+        self.assertEqual(self.suggest('기새'), ['기생충'])
+        self.assertEqual(self.suggest('기생ㅊ'), ['기생충'])
+        self.assertEqual(self.suggest('추억'), ['살인의 추억'])
+        self.assertEqual(self.suggest('ㅅㅇㅇ ㅊ'), ['살인의 추억'])
+        self.assertEqual(self.suggest('INTER'), ['Interstellar'])
+        # 리뷰 수가 많은 영화가 먼저
+        self.assertEqual(self.suggest('ㄱ'), ['기억의 밤', '기생충'])
+        self.assertEqual(self.suggest(''), [])
+
+    def test_answers_from_memory_and_updates_incrementally(self):
+        self.suggest('ㄱ')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.suggest('ㄱㅅ'), ['기생충'])
+
+        self.parasite.title = '괴물'
+        self.parasite.save()
+        Movie.objects.create(title='곡성', description='설명', release_date='2016-05-12')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.suggest('ㄱㅅㅊ'), [])
+            self.assertEqual(self.suggest('고'), ['괴물', '곡성'])
+
+
+class MovieFuzzySearchTest(TestCase):
+    def setUp(self):
+        movie_trigram_index.reset()
+        cache.clear()
+        self.interstellar = Movie.objects.create(title='인터스텔라', description='우주', release_date='2014-11-06')
+        Movie.objects.create(title='Interstellar', description='space', release_date='2014-11-06')
+        Movie.objects.create(title='기생충', description='가족', release_date='2019-05-30')
+        Movie.objects.create(title='살인의 추억', description='형사', release_date='2003-04-25')
+
+    def search(self, q, **params):
+        response = self.client.get('/api/movies/search/', {'search': q, 'fuzzy': 1, **params})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        return [movie['title'] for movie in data.get('results', data)]
+
+    def test_misspelled_titles_match_by_similarity(self):
+        # 부분 일치 검색으로는 찾지 못하는 오타
+        response = self.client.get('/api/movies/search/', {'search': '인터스텔러'})
+        self.assertEqual(response.json().get('results', response.json()), [])
+
+        self.assertEqual(self.search('인터스텔러'), ['인터스텔라'])
+        self.assertEqual(self.search('intersteller'), ['Interstellar'])
+        self.assertEqual(self.search('기생춘'), ['기생충'])
+        self.assertEqual(self.search('살인의 추억들'), ['살인의 추억'])
+        self.assertEqual(self.search('전혀 다른 제목'), [])
+
+    def test_index_follows_title_changes(self):
+        self.search('기생충')
+        self.interstellar.title = '괴물'
+        self.interstellar.save()
+        Movie.objects.create(title='곡성', description='마을', release_date='2016-05-12')
+        self.assertEqual(self.search('인터스텔러'), [])
+        self.assertEqual(self.search('괴물이'), ['괴물'])
+        self.assertEqual(self.search('곡성이'), ['곡성'])
+        self.interstellar.delete()
+        self.assertEqual(self.search('괴물이'), [])
+
+
+class MovieOttMaskTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='ott', email='ott@example.com', password='pass1234')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.netflix, self.watcha, self.disney = (OTT.objects.create(name=name) for name in ('N', 'W', 'D'))
+
+    def create_movie(self, title, otts):
+        response = self.client.post('/api/movies/create/', {
+            'title': title, 'description': '설명', 'release_date': '2020-01-01',
+            'thumbnail_url': 'https://example.com/a.jpg', 'ott_services': [ott.pk for ott in otts],
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        return Movie.objects.get(pk=response.data['id'])
+
+    def search(self, **params):
+        response = self.client.get('/api/movies/search/', {
+            key: ','.join(str(ott.pk) for ott in otts) for key, otts in params.items()
+        })
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        return sorted(movie['title'] for movie in data.get('results', data))
+
+    def test_mask_follows_ott_services(self):
+        movie = self.create_movie('둘 다', [self.netflix, self.watcha])
+        self.assertEqual(movie.ott_mask, 1 << (self.netflix.pk - 1) | 1 << (self.watcha.pk - 1))
+
+        response = self.client.put(f'/api/movies/{movie.pk}/edit/', {
+            'title': '둘 다', 'description': '설명', 'release_date': '2020-01-01', 'ott_services': [self.disney.pk],
+        }, format='json')
+        self.assertEqual(response.status_code, 200)
+        movie.refresh_from_db()
+        self.assertEqual(movie.ott_mask, 1 << (self.disney.pk - 1))
+
+        # OTT 쪽에서 바꾸거나 OTT를 삭제해도 비트가 맞춰짐
+        self.netflix.movies.add(movie)
+        movie.refresh_from_db()
+        self.assertEqual(movie.ott_mask, 1 << (self.netflix.pk - 1) | 1 << (self.disney.pk - 1))
+        self.disney.delete()
+        movie.refresh_from_db()
+        self.assertEqual(movie.ott_mask, 1 << (self.netflix.pk - 1))
+
+    def test_any_all_none_filters(self):
+        self.create_movie('넷플릭스', [self.netflix])
+        self.create_movie('둘 다', [self.netflix, self.watcha])
+        self.create_movie('디즈니', [self.disney])
+        self.create_movie('없음', [])
+
+        # JOIN이 없으므로 두 OTT에 모두 있는 영화도 한 번만
+        self.assertEqual(self.search(ott_services=[self.netflix, self.watcha]), ['넷플릭스', '둘 다'])
+        self.assertEqual(self.search(ott_all=[self.netflix, self.watcha]), ['둘 다'])
+        self.assertEqual(self.search(ott_none=[self.netflix]), ['디즈니', '없음'])
+        self.assertEqual(self.search(ott_services=[self.disney], ott_none=[self.netflix]), ['디즈니'])
+        response = self.client.get('/api/movies/search/', {'ott_all': f'{self.netflix.pk},999'})
+        self.assertEqual(response.json().get('results', response.json()), [])
+
+        # OTT가 많아 조합을 나열하지 않는 경우의 비트 연산 조건도 같은 결과
+        with mock.patch('ott.models.MAX_ENUMERATED_MASKS', 2):
+            self.assertEqual(self.search(ott_services=[self.netflix, self.watcha]), ['넷플릭스', '둘 다'])
+            self.assertEqual(self.search(ott_all=[self.netflix, self.watcha]), ['둘 다'])
+            self.assertEqual(self.search(ott_none=[self.netflix]), ['디즈니', '없음'])
+
+    def test_ott_id_above_bitmask_range(self):
+        # 비트로 표현할 수 없는 id(64 이상)는 비트마스크에서 빠지고 필터는 연결 테이블로 확인
+        wavve = OTT.objects.create(id=64, name='WV')
+        movie = self.create_movie('웨이브', [self.netflix, wavve])
+        self.assertEqual(movie.ott_mask, 1 << (self.netflix.pk - 1))
+        self.create_movie('웨이브만', [wavve])
+        self.create_movie('넷플릭스', [self.netflix])
+        self.create_movie('없음', [])
+
+        self.assertEqual(self.search(ott_services=[wavve]), ['웨이브', '웨이브만'])
+        self.assertEqual(self.search(ott_services=[self.watcha, wavve]), ['웨이브', '웨이브만'])
+        self.assertEqual(self.search(ott_all=[self.netflix, wavve]), ['웨이브'])
+        self.assertEqual(self.search(ott_all=[wavve]), ['웨이브', '웨이브만'])
+        self.assertEqual(self.search(ott_none=[wavve]), ['넷플릭스', '없음'])
+        self.assertEqual(self.search(ott_none=[self.netflix, wavve]), ['없음'])
+
+        wavve.movies.remove(movie)
+        self.assertEqual(self.search(ott_services=[wavve]), ['웨이브만'])
+        wavve.delete()
+        movie.refresh_from_db()
+        self.assertEqual(movie.ott_mask, 1 << (self.netflix.pk - 1))
+        self.assertEqual(self.search(ott_none=[self.watcha]), ['넷플릭스', '없음', '웨이브', '웨이브만'])
+
+
+class MovieForMeTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='forme', email='forme@example.com', password='pass1234')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.netflix, self.watcha, self.disney = (OTT.objects.create(name=name) for name in ('N', 'W', 'D'))
+        for title, otts, release_date, rating in (
+            ('넷플릭스 명작', [self.netflix], '2010-01-01', 4.5),
+            ('왓챠 신작', [self.watcha], '2024-01-01', 3.0),
+            ('둘 다', [self.netflix, self.watcha], '2018-01-01', 4.0),
+            ('디즈니', [self.disney], '2023-01-01', 5.0),
+        ):
+            movie = Movie.objects.create(title=title, description='설명', release_date=release_date)
+            movie.ott_services.set(otts)
+            Movie.objects.filter(pk=movie.pk).update(average_rating_cache=rating)
+
+    def for_me(self, **params):
+        response = self.client.get('/api/movies/for-me/', params)
+        self.assertEqual(response.status_code, 200)
+        return [movie['title'] for movie in response.json()['results']]
+
+    def subscribe(self, *otts):
+        response = self.client.post('/api/users/subscribe/', {'ott_ids': [ott.pk for ott in otts]}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+    def test_only_movies_on_subscribed_otts(self):
+        self.assertEqual(self.for_me(), [])
+        self.subscribe(self.netflix, self.watcha)
+        self.assertEqual(self.for_me(), ['넷플릭스 명작', '둘 다', '왓챠 신작'])
+        self.assertEqual(self.for_me(ordering='-release_date'), ['왓챠 신작', '둘 다', '넷플릭스 명작'])
+
+        self.client.force_authenticate(None)
+        self.assertIn(self.client.get('/api/movies/for-me/').status_code, (401, 403))
+
+    def test_subscription_set_is_cached_until_subscribe(self):
+        self.subscribe(self.disney)
+        self.for_me()
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.for_me(), ['디즈니'])
+        self.assertFalse(any('users_user_subscribed_ott' in query['sql'] for query in queries))
+
+        self.subscribe(self.watcha)
+        self.assertEqual(self.for_me(), ['둘 다', '왓챠 신작'])
+        # OTT 쪽에서 구독자를 바꿔도 캐시가 지워짐
+        self.netflix.subscribers.add(self.user)
+        self.assertEqual(self.for_me(), ['넷플릭스 명작', '둘 다', '왓챠 신작'])
+
+
+@override_settings(CACHES=LOCAL_CACHES)
+class MovieResponseCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        response_cache_stats.reset()
+        self.user = User.objects.create_user(username='cacher', email='cacher@example.com', password='pass1234')
+        self.netflix = OTT.objects.create(name='넷플릭스')
+        self.watcha = OTT.objects.create(name='왓챠')
+        self.movies = [
+            Movie.objects.create(title=f'캐시 영화 {i}', description='설명', release_date=f'2024-01-{i + 1:02d}')
+            for i in range(25)
+        ]
+        self.movies[0].ott_services.set([self.netflix, self.watcha])
+
+    def get(self, url, params=None):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response['X-Cache'], response.json()
+
+    def review(self, movie):
+        Review.objects.create(user=self.user, movie=movie, rating=5)
+
+    def test_anonymous_hits_until_related_write(self):
+        self.assertEqual(self.get('/api/movies/')[0], 'MISS')
+        with self.assertNumQueries(0):
+            status, body = self.get('/api/movies/')
+        self.assertEqual(status, 'HIT')
+
+        # 평점순 목록은 어떤 영화의 리뷰든 순서를 바꿀 수 있으므로 무효화
+        self.review(self.movies[24])
+        status, body = self.get('/api/movies/')
+        self.assertEqual(status, 'STALE')
+        self.assertEqual(body['results'][0]['id'], self.movies[24].pk)
+
+        # 영화 수정(저장)은 모든 목록 무효화
+        self.movies[3].title = '제목 변경'
+        self.movies[3].save()
+        self.assertEqual(self.get('/api/movies/')[0], 'STALE')
+
+    def test_rating_independent_ordering_tracks_listed_movies_only(self):
+        params = {'ordering': 'release_date'}
+        self.get('/api/movies/', params)
+        self.review(self.movies[24])  # 첫 페이지(개봉일 순 1~20번)에 없는 영화
+        self.assertEqual(self.get('/api/movies/', params)[0], 'HIT')
+        self.review(self.movies[0])
+        status, body = self.get('/api/movies/', params)
+        self.assertEqual(status, 'STALE')
+        self.assertEqual(body['results'][0]['review_count'], 1)
+
+    def test_search_key_is_normalized(self):
+        ids = f'{self.netflix.pk},{self.watcha.pk}'
+        reversed_ids = f' {self.watcha.pk},{self.netflix.pk},{self.netflix.pk}'
+        self.assertEqual(self.get('/api/movies/search/', {'ott_all': ids, 'utm_source': 'a'})[0], 'MISS')
+        status, body = self.get('/api/movies/search/', {'ott_all': reversed_ids})
+        self.assertEqual((status, [movie['id'] for movie in body['results']]), ('HIT', [self.movies[0].pk]))
+
+        # 제공 OTT 변경은 카탈로그 무효화
+        self.movies[1].ott_services.set([self.netflix, self.watcha])
+        self.assertEqual(len(self.get('/api/movies/search/', {'ott_all': ids})[1]['results']), 2)
+
+    def test_authenticated_requests_bypass_and_stats_are_exposed(self):
+        self.get('/api/movies/')
+        self.get('/api/movies/')
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.get('/api/movies/')
+        self.assertEqual(response['X-Cache'], 'BYPASS')
+        self.assertEqual(client.get('/api/cache-stats/').status_code, 403)
+
+        self.user.is_staff = True
+        self.user.save()
+        stats = client.get('/api/cache-stats/').json()['movies:list']
+        self.assertEqual((stats['hit'], stats['miss'], stats['bypass']), (1, 1, 1))
+        self.assertEqual(stats['hit_ratio'], 0.5)
+        self.assertIn('p95', stats['latency_ms']['hit'])
 
-# Create your tests here.
+    def test_process_local_cache_is_reported_at_startup(self):
+        # 이 테스트 클래스는 LocMem 캐시 → 버전 카운터가 워커끼리 공유되지 않는다는 경고
+        warnings = [error.msg for error in check_shared_cache(None) if error.id == 'config.W001']
+        self.assertTrue(any('RESPONSE_CACHE' in msg for msg in warnings))
@@ -0,0 +1,142 @@
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+
+from django.conf import settings
+
+from config.search import choseong, decompose_jamo, normalize_typed
+
+# ---------------------------------------------------------------------
+# ✅ 영화 제목 자동완성 (초성/자모/완성형 접두어)
+# - 제목의 각 어절부터 끝까지를 키로 삼아 자모 분해형과 초성형을 색인
+#   ("살인의 추억" → ㅅㅏㄹㅇㅣㄴㅇㅡㅣ…, ㅅㅇㅇㅊㅇ, ㅊㅜㅇㅓㄱ, ㅊㅇ)
+# - 검색어도 자모로 분해해 비교하므로 완성형("기생"), 입력 중("기새"), 초성("ㄱㅅㅊ") 모두 접두어 일치
+# - 트라이를 정렬된 (키, 영화 id) 배열로 평탄화해 노드 객체 없이 워커 메모리에 보관
+#   접두어 검색 = 이분 탐색 두 번으로 범위를 찾고 인기순 상위 N개 선택
+# ---------------------------------------------------------------------
+DEFAULT_CONFIG = {
+    'LIMIT': 10,                # 기본 추천 개수
+    'MAX_LIMIT': 20,
+    'REBUILD_INTERVAL': 600,    # 다른 워커의 수정/평점 변화를 반영하기 위한 전체 재구성 주기(초)
+    'MEMO_RANGE': 256,          # 일치 범위가 이보다 큰 짧은 접두어는 결과를 메모
+}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'MOVIE_TYPEAHEAD', {})}
+
+
+def title_keys(title):
+    words = title.split()
+    keys = set()
+    for i in range(len(words)):
+        suffix = normalize_typed(''.join(words[i:]))
+        keys.add(decompose_jamo(suffix))
+        keys.add(choseong(suffix))
+    keys.discard('')
+    return keys
+
+
+class TitleTypeahead:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._entries = []      # 정렬된 (키, 영화 id)
+            self._movies = {}       # 영화 id → (인기 점수, 제목, 키 목록)
+            self._memo = {}
+            self.loaded_at = None
+
+    def rebuild(self, rows, warm_limit=None):
+        """
+        rows: (id, 제목, 리뷰 수, 평균 평점) 목록으로 전체를 다시 구성합니다.
+        일치 범위가 넓은 1~2자모 접두어는 미리 계산해 둬서 첫 입력도 바로 응답합니다.
+        """
+        entries, indexed = [], {}
+        for movie_id, title, rating_count, average_rating in rows:
+            keys = title_keys(title)
+            indexed[movie_id] = ((rating_count, average_rating), title, keys)
+            entries.extend((key, movie_id) for key in keys)
+        entries.sort()
+        with self._lock:
+            self._entries, self._movies, self._memo = entries, indexed, {}
+            self.loaded_at = time.monotonic()
+            if warm_limit:
+                for prefix in sorted({key[:length] for key, _ in entries for length in (1, 2)}):
+                    self._suggest_prefix(prefix, warm_limit)
+
+    def add(self, movie):
+        """영화 생성/수정 시 해당 영화의 키만 교체합니다."""
+        with self._lock:
+            self.remove(movie.pk)
+            keys = title_keys(movie.title)
+            self._movies[movie.pk] = ((movie.rating_count, movie.average_rating_cache), movie.title, keys)
+            for key in keys:
+                insort(self._entries, (key, movie.pk))
+            self._invalidate(keys)
+
+    def remove(self, movie_id):
+        with self._lock:
+            indexed = self._movies.pop(movie_id, None)
+            if indexed is None:
+                return
+            for key in indexed[2]:
+                index = bisect_left(self._entries, (key, movie_id))
+                if index < len(self._entries) and self._entries[index] == (key, movie_id):
+                    del self._entries[index]
+            self._invalidate(indexed[2])
+
+    def _invalidate(self, keys):
+        # 바뀐 키의 접두어에 해당하는 메모만 버림
+        self._memo = {
+            memo_key: results for memo_key, results in self._memo.items()
+            if not any(key.startswith(memo_key[0]) for key in keys)
+        }
+
+    def is_stale(self, interval):
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > interval
+
+    def suggest(self, text, limit):
+        prefix = decompose_jamo(normalize_typed(text))
+        return self._suggest_prefix(prefix, limit)
+
+    def _suggest_prefix(self, prefix, limit):
+        if not prefix:
+            return []
+        with self._lock:
+            memo_key = (prefix, limit)
+            if memo_key in self._memo:
+                return self._memo[memo_key]
+
+            start = bisect_left(self._entries, (prefix,))
+            end = bisect_left(self._entries, (prefix + '\uffff',), start)
+            movie_ids = {movie_id for _, movie_id in self._entries[start:end]}
+            best = heapq.nlargest(limit, movie_ids, key=lambda movie_id: (self._movies[movie_id][0], -movie_id))
+            results = [{'id': movie_id, 'title': self._movies[movie_id][1]} for movie_id in best]
+            if end - start > get_config()['MEMO_RANGE']:
+                self._memo[memo_key] = results
+            return results
+
+
+movie_typeahead = TitleTypeahead()
+
+
+def get_movie_typeahead():
+    """처음 사용할 때, 그리고 REBUILD_INTERVAL마다 DB에서 전체를 다시 읽어 구성합니다."""
+    from .models import Movie
+
+    if movie_typeahead.is_stale(get_config()['REBUILD_INTERVAL']):
+        movie_typeahead.rebuild(
+            Movie.objects.values_list('id', 'title', 'rating_count', 'average_rating_cache').iterator(),
+            warm_limit=get_config()['LIMIT'],
+        )
+    return movie_typeahead
+
+
+def update_typeahead(movie):
+    """영화 저장 후 이 워커의 자동완성 색인을 증분 갱신"""
+    if movie_typeahead.loaded_at is not None:
+        movie_typeahead.add(movie)
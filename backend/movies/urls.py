@@ -5,6 +5,8 @@ from .views import (
     MovieDetailView,
     MovieDetailEditDeleteView,
     MovieSearchView,
+    MovieSuggestView,
+    MovieForMeView,
 )
 
 urlpatterns = [
@@ -27,4 +29,12 @@ urlpatterns = [
     # 🎬 영화 검색 + OTT 필터
     # GET /api/movies/search/?search=제목키워드&ott_services=1,2
     path('search/', MovieSearchView.as_view(), name='movie-search'),
+
+    # 🎬 내 구독 OTT에서 볼 수 있는 영화 (인증 필요)
+    # GET /api/movies/for-me/?ordering=-average_rating_cache|-release_date
+    path('for-me/', MovieForMeView.as_view(), name='movie-for-me'),
+
+    # 🎬 영화 제목 자동완성 (초성 검색 지원)
+    # GET /api/movies/suggest/?q=ㄱㅅㅊ
+    path('suggest/', MovieSuggestView.as_view(), name='movie-suggest'),
 ]
\ No newline at end of file
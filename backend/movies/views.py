@@ -1,24 +1,37 @@
 from rest_framework import generics, filters
-from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticatedOrReadOnly, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.generics import ListAPIView
-from rest_framework.filters import SearchFilter, OrderingFilter 
+from rest_framework.filters import OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
 
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
+from .cache import MovieListCacheMixin
 from .models import Movie
-from .serializers import MovieSerializer
-from .filters import MovieFilter
-from django.db.models import Count
+from .serializers import MovieSerializer, MovieListSerializer
+from .filters import MovieFilter, MovieSearchFilter, filter_ott_mask
+from .typeahead import get_config as get_typeahead_config, get_movie_typeahead
+from django.db.models import F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, Greatest
 from config.authentication import CookieJWTAuthentication
+from config.conditional import ConditionalGetMixin
+from config.stale_cache import StaleWhileRevalidateMixin
+from ott.models import matching_ott_masks
+from reviews.models import Review
+from users.subscriptions import get_subscribed_ott_mask
 
 # ✅ 영화 목록 조회 (정렬 가능)
-class MovieListView(generics.ListAPIView):
+# - 비로그인 요청은 정규화한 쿼리별로 응답 캐시 (movies/cache.py, 영화/리뷰 쓰기 시 버전 카운터로 무효화)
+class MovieListView(MovieListCacheMixin, generics.ListAPIView):
     authentication_classes = [CookieJWTAuthentication] 
-    serializer_class = MovieSerializer
+    serializer_class = MovieListSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
     filter_backends = [filters.OrderingFilter]
+    cache_namespace = 'movies:list'
+    cache_query_params = ('ordering', 'page', 'cursor')
 
     # ✅ 수정: 존재하는 필드 이름으로 교체
     ordering_fields = ['average_rating_cache', 'release_date', 'title', 'review_count']
@@ -33,17 +46,25 @@ class MovieListView(generics.ListAPIView):
                 openapi.IN_QUERY,
                 description="정렬 기준 (`average_rating_cache`, `release_date`, `title`)",
                 type=openapi.TYPE_STRING
-            )
+            ),
+            openapi.Parameter(
+                'cursor',
+                openapi.IN_QUERY,
+                description="커서 (값이 있으면 page 대신 키셋 페이지네이션, 빈 값이면 첫 페이지)",
+                type=openapi.TYPE_STRING
+            ),
         ],
-        responses={200: MovieSerializer(many=True)}
+        responses={200: MovieListSerializer(many=True)}
     )
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
     def get_queryset(self):
+        # review_count는 리뷰 테이블 JOIN/COUNT 대신 증분 집계 컬럼(rating_count)을 사용
         return (
-            Movie.objects.annotate(review_count=Count('reviews'))
-            .prefetch_related('reviews', 'ott_services')
+            Movie.objects.defer('search_vector')
+            .annotate(review_count=F('rating_count'))
+            .prefetch_related('ott_services')
         )
 
 
@@ -80,17 +101,23 @@ class MovieCreateView(generics.CreateAPIView):
         movie = serializer.save()
         ott_ids = self.request.data.get('ott_services', [])
         movie.ott_services.set(ott_ids)
-
-        # 평점 캐시 기본값 설정 (영화 등록 시 평점은 기본값 0으로 설정)
-        movie.average_rating_cache = 0.0
-        movie.save()
+        # 평점 캐시는 모델 기본값(0.0), ott_mask는 m2m_changed 신호로 저장되므로 다시 save()하지 않음
+        # (전체 행 저장은 그 사이 작성된 리뷰의 평점 집계를 덮어씀)
 
 
 # ✅ 영화 상세 조회
-class MovieDetailView(generics.RetrieveAPIView):
+# - 영화 / 리뷰 첫 페이지가 바뀌지 않았으면 If-None-Match / If-Modified-Since에 304 (config/conditional.py)
+# - 응답은 사용자와 무관하므로 모든 요청이 같은 캐시 항목 사용, 만료 시 한 요청만 재생성 (config/stale_cache.py)
+class MovieDetailView(ConditionalGetMixin, StaleWhileRevalidateMixin, generics.RetrieveAPIView):
     authentication_classes = [CookieJWTAuthentication] 
     serializer_class = MovieSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    stale_cache_namespace = 'movies:detail'
+    # 응답에 포함된 리뷰(좋아요 수 / 내 투표 등)의 변경도 반영: 영화 updated_at과 가장 최근에 바뀐 리뷰 중 늦은 쪽
+    # (review_movie_updated_idx 한 항목만 읽는 서브쿼리, 리뷰 작성/삭제는 평점 집계로 영화 updated_at도 갱신)
+    last_modified_field = 'last_modified'
+    # 리뷰 첫 페이지도 사용자별 필드 없이 직렬화하므로 (PublicReviewSerializer) 모든 사용자가 같은 ETag
+    vary_on_user = False
 
     @swagger_auto_schema(
         operation_summary="영화 상세 조회",
@@ -101,7 +128,13 @@ class MovieDetailView(generics.RetrieveAPIView):
         return super().get(request, *args, **kwargs)
 
     def get_queryset(self):
-        return Movie.objects.prefetch_related('reviews__user', 'ott_services')
+        # 리뷰는 MovieSerializer에서 첫 페이지만 별도로 조회하므로 전체 리뷰를 prefetch하지 않음
+        latest_review = Review.objects.filter(movie=OuterRef('pk')).order_by('-updated_at').values('updated_at')[:1]
+        return (
+            Movie.objects.defer('search_vector')
+            .annotate(last_modified=Greatest('updated_at', Coalesce(Subquery(latest_review), 'updated_at')))
+            .prefetch_related('ott_services')
+        )
 
 
 # ✅ 영화 수정 및 삭제
@@ -129,42 +162,147 @@ class MovieDetailEditDeleteView(generics.RetrieveUpdateDestroyAPIView):
 
 
 # ✅ 영화 검색 (제목 검색 + OTT 필터)
-class MovieSearchView(ListAPIView):
+# - 비로그인 요청은 목록과 같은 방식으로 응답 캐시 (OTT ID 목록은 순서와 무관하게 같은 키)
+class MovieSearchView(MovieListCacheMixin, ListAPIView):
     authentication_classes = [CookieJWTAuthentication]
     queryset = Movie.objects.all()
-    serializer_class = MovieSerializer
-    filter_backends = [SearchFilter, DjangoFilterBackend, OrderingFilter] 
-    search_fields = ['title']
+    serializer_class = MovieListSerializer
+    # 검색은 MovieSearchFilter(전문 검색)가 담당하며, 정렬 지정이 없으면 관련도 순
+    filter_backends = [DjangoFilterBackend, OrderingFilter, MovieSearchFilter]
     filterset_class = MovieFilter
+    cache_namespace = 'movies:search'
+    cache_query_params = (
+        'search', 'fuzzy', 'title', 'ott_services', 'ott_all', 'ott_none', 'ordering', 'page', 'cursor',
+    )
+    cache_list_params = ('ott_services', 'ott_all', 'ott_none')
     ordering_fields = ['average_rating_cache', 'release_date', 'title',  'review_count']
     ordering = ['-average_rating_cache']
 
     @swagger_auto_schema(
         operation_summary="영화 검색",
-        operation_description="영화 제목으로 검색하고, 제공 OTT 기준으로 필터링할 수 있습니다.",
+        operation_description=(
+            "영화 제목/설명을 전문 검색하고, 제공 OTT 기준으로 필터링할 수 있습니다.\n"
+            "`ordering`을 지정하지 않으면 관련도(평균 평점 가중) 순으로 정렬합니다.\n"
+            "`fuzzy=1`이면 제목 트라이그램 유사도로 오타를 허용해 가장 비슷한 제목부터 반환합니다 "
+            "(예: `인터스텔러` → 인터스텔라)."
+        ),
         manual_parameters=[
             openapi.Parameter(
                 'search',
                 openapi.IN_QUERY,
-                description="영화 제목 키워드 (부분 검색 가능)",
+                description="검색어 (제목/설명, 한글은 두 글자 단위 부분 일치)",
                 type=openapi.TYPE_STRING
             ),
+            openapi.Parameter(
+                'fuzzy',
+                openapi.IN_QUERY,
+                description="`1`이면 오타 허용 제목 검색 (트라이그램 유사도 0.3 이상, 유사도 순)",
+                type=openapi.TYPE_BOOLEAN
+            ),
             openapi.Parameter(
                 'ott_services',
                 openapi.IN_QUERY,
-                description="OTT ID 필터링 (여러 개일 경우 `,`로 구분, 예: `1,2`)",
+                description="OTT ID 필터링 - 하나라도 제공 (여러 개일 경우 `,`로 구분, 예: `1,2`)",
                 type=openapi.TYPE_STRING
-            )
+            ),
+            openapi.Parameter(
+                'ott_all',
+                openapi.IN_QUERY,
+                description="OTT ID 필터링 - 모두 제공 (예: `1,2` → 1번과 2번 모두에서 볼 수 있는 영화)",
+                type=openapi.TYPE_STRING
+            ),
+            openapi.Parameter(
+                'ott_none',
+                openapi.IN_QUERY,
+                description="OTT ID 필터링 - 어느 것도 제공하지 않음 (예: `3` → 3번에 없는 영화)",
+                type=openapi.TYPE_STRING
+            ),
         ],
-        responses={200: MovieSerializer(many=True)}
+        responses={200: MovieListSerializer(many=True)}
     )
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
     
     def get_queryset(self):
+        # review_count는 리뷰 테이블 JOIN/COUNT 대신 증분 집계 컬럼(rating_count)을 사용
         return (
-            Movie.objects.annotate(review_count=Count('reviews'))
-            .prefetch_related('reviews', 'ott_services')
+            Movie.objects.defer('search_vector')
+            .annotate(review_count=F('rating_count'))
+            .prefetch_related('ott_services')
+        )
+
+
+# ✅ 내 구독 OTT에서 볼 수 있는 영화 (평점순 / 최신 개봉순)
+# - 구독 OTT 집합은 사용자별 캐시(users/subscriptions.py), 영화는 ott_mask IN (...) 로 조회 (연결 테이블 JOIN 없음)
+class MovieForMeView(ListAPIView):
+    authentication_classes = [CookieJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+    serializer_class = MovieListSerializer
+    filter_backends = [OrderingFilter]
+    ordering_fields = ['average_rating_cache', 'release_date']
+    ordering = ['-average_rating_cache']
+
+    @swagger_auto_schema(
+        operation_summary="내 구독 OTT 영화 목록",
+        operation_description=(
+            "로그인한 사용자가 구독 중인 OTT(`/api/users/subscribe/`) 중 하나 이상에서 제공하는 영화만 반환합니다.\n"
+            "구독한 OTT가 없으면 빈 목록입니다. 기본은 평점순이며 `ordering=-release_date`로 최신 개봉순 정렬합니다."
+        ),
+        manual_parameters=[
+            openapi.Parameter(
+                'ordering',
+                openapi.IN_QUERY,
+                description="정렬 기준 (`-average_rating_cache` 평점순, `-release_date` 최신 개봉순)",
+                type=openapi.TYPE_STRING
+            ),
+            openapi.Parameter(
+                'cursor',
+                openapi.IN_QUERY,
+                description="커서 (값이 있으면 page 대신 키셋 페이지네이션, 빈 값이면 첫 페이지)",
+                type=openapi.TYPE_STRING
+            ),
+        ],
+        responses={200: MovieListSerializer(many=True)}
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self):
+        movies = (
+            Movie.objects.defer('search_vector')
+            .annotate(review_count=F('rating_count'))
+            .prefetch_related('ott_services')
         )
+        mask = get_subscribed_ott_mask(self.request.user)
+        if not mask:
+            return movies.none()
+        return filter_ott_mask(movies, matching_ott_masks(any_of=mask), Q(ott_hit__gt=0), mask)
+
+
+# ✅ 영화 제목 자동완성 (초성/자모/완성형 접두어, 워커 메모리 색인만 사용 - DB 조회 없음)
+class MovieSuggestView(APIView):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        operation_summary="영화 제목 자동완성",
+        operation_description=(
+            "입력 중인 검색어로 시작하는 영화 제목을 인기순(리뷰 수, 평점)으로 추천합니다.\n"
+            "완성형(`기생`), 입력 중인 글자(`기새`), 초성(`ㄱㅅㅊ`)을 모두 지원하며 "
+            "제목 중간 어절(`추억` → 살인의 추억)부터도 일치합니다."
+        ),
+        manual_parameters=[
+            openapi.Parameter('q', openapi.IN_QUERY, description="검색어 (예: `ㄱㅅㅊ`)", type=openapi.TYPE_STRING),
+            openapi.Parameter('limit', openapi.IN_QUERY, description="추천 개수 (기본 10, 최대 20)", type=openapi.TYPE_INTEGER),
+        ],
+    )
+    def get(self, request):
+        config = get_typeahead_config()
+        try:
+            limit = min(max(int(request.query_params.get('limit', config['LIMIT'])), 1), config['MAX_LIMIT'])
+        except ValueError:
+            limit = config['LIMIT']
+        return Response(get_movie_typeahead().suggest(request.query_params.get('q', ''), limit))
+
 
-#PR용 주석
\ No newline at end of file
+#PR용 주석
@@ -19,4 +19,46 @@ class OTT(models.Model):
     )
 
     def __str__(self):
-        return self.name  # 관리자 페이지에서 객체 표시 시 이름 출력
\ No newline at end of file
+        return self.name  # 관리자 페이지에서 객체 표시 시 이름 출력
+
+
+# ✅ OTT 조합 비트마스크 (Movie.ott_mask 등 비정규화 컬럼용)
+# - OTT id n → 비트 1 << (n - 1), BIGINT 부호 비트를 피하기 위해 id 1~63까지만 표현
+# - 64 이상의 id는 비트마스크에서 제외(저장/구독 캐시 모두)하고, 필터는 그 id만 연결 테이블로 확인
+# - 비트 연산 조건((mask & x) > 0)은 인덱스를 쓰지 못하고 행 수 추정도 부정확하므로,
+#   등록된 OTT로 만들 수 있는 조합 중 조건을 만족하는 값을 나열해 mask IN (...) 으로 조회
+MAX_BITMASK_OTT_ID = 63
+MAX_ENUMERATED_MASKS = 1024     # 이보다 조합이 많으면(OTT 11개 이상) 비트 연산 조건으로 대체
+
+
+def ott_bitmask(ott_ids):
+    """OTT id 목록 → 비트마스크 (범위 밖의 id는 ValueError)"""
+    mask = 0
+    for ott_id in ott_ids:
+        ott_id = int(ott_id)
+        if not 1 <= ott_id <= MAX_BITMASK_OTT_ID:
+            raise ValueError(f"비트마스크로 표현할 수 없는 OTT id입니다: {ott_id}")
+        mask |= 1 << (ott_id - 1)
+    return mask
+
+
+def ott_ids_from_bitmask(mask):
+    return [bit + 1 for bit in range(MAX_BITMASK_OTT_ID) if mask >> bit & 1]
+
+
+def matching_ott_masks(any_of=0, all_of=0, none_of=0):
+    """
+    현재 등록된 OTT로 만들 수 있는 비트마스크 중
+    any_of 비트를 하나라도, all_of 비트를 모두 포함하고 none_of 비트는 포함하지 않는 값 목록
+    (나열할 조합이 MAX_ENUMERATED_MASKS보다 많으면 None)
+    """
+    known = ott_bitmask(ott_id for ott_id in OTT.objects.values_list('id', flat=True) if ott_id <= MAX_BITMASK_OTT_ID)
+    if all_of & ~known:
+        return []
+    free = [1 << bit for bit in range(MAX_BITMASK_OTT_ID) if (known & ~all_of & ~none_of) >> bit & 1]
+    if 2 ** len(free) > MAX_ENUMERATED_MASKS:
+        return None
+    masks = [all_of]
+    for bit in free:
+        masks += [mask | bit for mask in masks]
+    return [mask for mask in masks if not any_of or mask & any_of]
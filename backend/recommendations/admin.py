@@ -0,0 +1,16 @@
+from django.contrib import admin
+from .models import MovieNeighbor, NeighborSource
+
+
+@admin.register(MovieNeighbor)
+class MovieNeighborAdmin(admin.ModelAdmin):
+    list_display = ('id', 'kind', 'movie', 'rank', 'neighbor', 'score')
+    list_filter = ('kind',)
+    raw_id_fields = ('movie', 'neighbor')
+
+
+@admin.register(NeighborSource)
+class NeighborSourceAdmin(admin.ModelAdmin):
+    list_display = ('id', 'kind', 'movie', 'signature', 'built_at')
+    list_filter = ('kind',)
+    raw_id_fields = ('movie',)
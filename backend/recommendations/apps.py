@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_save
+
+
+class RecommendationsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'recommendations'
+
+    def ready(self):
+        from movies.models import Movie
+        from .content import handle_movie_saved
+
+        # ✅ 영화가 생성되거나 설명이 바뀌면 콘텐츠(설명 TF-IDF) 유사 영화 목록 증분 갱신
+        post_save.connect(handle_movie_saved, sender=Movie, dispatch_uid='recommendations:content')
@@ -0,0 +1,42 @@
+import numpy as np
+from scipy import sparse
+
+from reviews.models import Review
+
+from .neighbors import ItemVectors, signature_hash
+
+# ---------------------------------------------------------------------
+# ✅ 평점 기반 아이템-아이템 협업 필터링 벡터
+# - 리뷰 평점으로 (사용자 × 영화) 희소 행렬을 만들고, 영화별 평균 평점을 빼서 중심화(Pearson 유사도와 같은 효과)
+#   → 영화 벡터가 그 영화의 리뷰만으로 정해지므로, 리뷰가 바뀐 영화만 다시 계산해도 다른 영화 벡터는 그대로
+# - 서명: (사용자 id, 평점) 쌍 해시의 합 (리뷰 추가/삭제/평점 수정 모두 반영)
+# ---------------------------------------------------------------------
+KIND = 'rating'
+
+
+def load_ratings():
+    """(사용자 id, 영화 id, 평점) 배열 세 개"""
+    rows = Review.objects.order_by().values_list('user_id', 'movie_id', 'rating')
+    ratings = np.array(list(rows.iterator(chunk_size=10000)), dtype=np.float64).reshape(-1, 3)
+    return ratings[:, 0].astype(np.int64), ratings[:, 1].astype(np.int64), ratings[:, 2]
+
+
+def rating_vectors(user_ids, movie_ids, ratings):
+    movies, movie_index = np.unique(movie_ids, return_inverse=True)
+    _, user_index = np.unique(user_ids, return_inverse=True)
+    counts = np.bincount(movie_index, minlength=len(movies))
+    centered = ratings - (np.bincount(movie_index, weights=ratings, minlength=len(movies)) / counts)[movie_index]
+    norms = np.sqrt(np.bincount(movie_index, weights=centered ** 2, minlength=len(movies)))
+    values = np.divide(centered, norms[movie_index], out=np.zeros_like(centered), where=norms[movie_index] > 0)
+
+    shape = (int(user_index.max()) + 1 if len(user_index) else 0, len(movies))
+    matrix = sparse.csc_matrix((values.astype(np.float32), (user_index, movie_index)), shape=shape)
+    observed = sparse.csc_matrix((np.ones(len(ratings), dtype=np.float32), (user_index, movie_index)), shape=shape)
+
+    signatures = np.zeros(len(movies), dtype=np.uint64)
+    np.add.at(signatures, movie_index, signature_hash(user_ids, np.round(ratings * 100)))
+    return ItemVectors(movie_ids=movies, matrix=matrix, signatures=signatures.view(np.int64), observed=observed)
+
+
+def build_rating_vectors():
+    return rating_vectors(*load_ratings())
@@ -0,0 +1,167 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from scipy import sparse
+
+from config.search import document_terms, normalize
+from movies.models import Movie
+
+from .models import NeighborSource
+from .neighbors import ItemVectors, build_lock, build_neighbors
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------
+# ✅ 영화 설명 기반 콘텐츠 유사도 벡터 (TF-IDF)
+# - 설명을 검색 색인과 같은 한국어 n-gram(한글 2-gram + 마지막 음절, 영문/숫자는 단어)으로 쪼개고
+#   (1 + log tf) × idf 가중치, 영화별 L2 정규화 → 코사인 유사도
+# - 리뷰가 없는 새 영화도 설명만으로 비슷한 영화 목록을 가짐
+# - 서명: 정규화한 설명의 해시 → 설명이 바뀐(또는 새) 영화만 다시 계산
+#   (영화 수가 늘면 idf가 조금씩 바뀌지만 다른 영화 목록은 --full 때 반영)
+# ---------------------------------------------------------------------
+KIND = 'content'
+
+DEFAULT_CONFIG = {
+    'MIN_DF': 2,                # 이보다 적은 영화에만 나온 n-gram은 유사도에 기여하지 않으므로 행렬에서 제외 (정규화에는 포함)
+    'MAX_DF_RATIO': 0.5,        # 이보다 많은 비율의 영화에 나온 n-gram은 불용어로 보고 제외
+    'ASYNC': True,              # False면 커밋 직후 요청 스레드에서 바로 갱신 (테스트/디버깅용)
+    'UPDATE_DELAY': 5.0,        # 첫 변경 후 다른 변경을 모으기 위해 기다리는 시간(초)
+}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'MOVIE_CONTENT_NEIGHBORS', {})}
+
+
+def description_signature(text):
+    digest = hashlib.blake2b(normalize(text).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'little', signed=True)
+
+
+def content_vectors(movie_ids, descriptions, min_df=2, max_df_ratio=0.5):
+    vocabulary, terms, lengths = {}, [], []
+    signatures = np.empty(len(movie_ids), dtype=np.int64)
+    for column, text in enumerate(descriptions):
+        grams = document_terms(text)
+        terms.extend(vocabulary.setdefault(gram, len(vocabulary)) for gram in grams)
+        lengths.append(len(grams))
+        signatures[column] = description_signature(text)
+
+    count = len(movie_ids)
+    matrix = sparse.csc_matrix(
+        (np.ones(len(terms), dtype=np.float32), (np.array(terms, dtype=np.int64), np.repeat(np.arange(count), lengths))),
+        shape=(len(vocabulary), count),
+    )
+    matrix.sum_duplicates()
+    df = np.bincount(matrix.indices, minlength=len(vocabulary))
+    idf = (np.log((1 + count) / (1 + df)) + 1).astype(np.float32)
+    matrix.data = (1 + np.log(matrix.data)) * idf[matrix.indices]
+    matrix = matrix.tocsr()[df <= max_df_ratio * count]
+    df = df[df <= max_df_ratio * count]
+
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=0)).ravel())
+    matrix = matrix[df >= min_df].tocsc()
+    matrix.data /= np.repeat(norms, np.diff(matrix.indptr))
+    return ItemVectors(movie_ids=np.asarray(movie_ids, dtype=np.int64), matrix=matrix, signatures=signatures)
+
+
+def build_content_vectors():
+    config = get_config()
+    rows = Movie.objects.order_by('id').values_list('id', 'description').iterator(chunk_size=10000)
+    movie_ids, descriptions = [], []
+    for movie_id, description in rows:
+        movie_ids.append(movie_id)
+        descriptions.append(description)
+    return content_vectors(movie_ids, descriptions, config['MIN_DF'], config['MAX_DF_RATIO'])
+
+
+class ContentNeighborUpdater:
+    """
+    영화 설명이 저장되면 커밋 후 백그라운드 스레드가 변경을 모아 content 목록을 증분 갱신합니다.
+
+    - 서명으로 바뀐 영화를 찾으므로 어떤 영화가 바뀌었는지는 기록하지 않고 "갱신 필요" 표시만 둠
+    - 증분 갱신만 함: 아직 계산한 적 없거나 바뀐 영화 비율이 FULL_REBUILD_RATIO를 넘으면 건너뛰고
+      전체 계산은 build_movie_neighbors에 맡김 (웹 워커에서 수백 초 / 수백 MB 계산을 하지 않도록)
+    - 다른 프로세스가 계산 중이면(build_lock) UPDATE_DELAY 뒤 다시 시도
+    - 실패하면 서명이 저장되지 않으므로 다음 갱신(또는 build_movie_neighbors)에서 다시 계산
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._worker = None
+
+    def _ensure_process(self):
+        # fork된 워커는 부모의 스레드를 물려받지 않도록 새로 초기화
+        if self._pid != os.getpid():
+            self._reset()
+
+    def schedule(self):
+        self._ensure_process()
+        if not get_config()['ASYNC']:
+            self.update()
+            return
+        self._start_worker()
+        self._wakeup.set()
+
+    def update(self):
+        try:
+            with build_lock(KIND) as acquired:
+                if not acquired:
+                    return {'mode': 'locked'}
+                # 아직 계산한 적 없으면 설명 토큰화(전체 영화) 없이 바로 건너뜀
+                if not NeighborSource.objects.filter(kind=KIND).exists():
+                    logger.info("콘텐츠 유사 영화가 아직 계산되지 않아 증분 갱신을 건너뜀 (build_movie_neighbors --kind content)")
+                    return {'mode': 'skipped'}
+                stats = build_neighbors(KIND, build_content_vectors(), incremental_only=True)
+            if stats['mode'] == 'skipped':
+                logger.warning(
+                    "바뀐 영화 %s개로 콘텐츠 유사 영화 전체 계산이 필요해 증분 갱신을 건너뜀 (build_movie_neighbors --kind content)",
+                    stats['changed'],
+                )
+            return stats
+        except Exception:
+            logger.exception("콘텐츠 유사 영화 갱신 실패")
+            return None
+
+    def _start_worker(self):
+        if self._worker is not None:
+            return
+        with self._lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(target=self._run_worker, daemon=True)
+            self._worker.start()
+
+    def _run_worker(self):
+        while True:
+            self._wakeup.wait()
+            time.sleep(get_config()['UPDATE_DELAY'])
+            self._wakeup.clear()
+            close_old_connections()
+            try:
+                if (self.update() or {}).get('mode') == 'locked':
+                    self._wakeup.set()
+            finally:
+                # 백그라운드 스레드 전용 DB 연결 정리
+                connection.close()
+
+
+content_neighbor_updater = ContentNeighborUpdater()
+
+
+def handle_movie_saved(sender, instance, update_fields=None, raw=False, **kwargs):
+    """영화 생성 / 설명 수정 → 커밋 후 콘텐츠 유사 영화 갱신 예약 (apps.py에서 연결)"""
+    if raw or (update_fields is not None and 'description' not in update_fields):
+        return
+    transaction.on_commit(content_neighbor_updater.schedule, using=kwargs.get('using'))
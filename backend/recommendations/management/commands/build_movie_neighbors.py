@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from recommendations.collaborative import KIND as RATING_KIND, build_rating_vectors
+from recommendations.content import KIND as CONTENT_KIND, build_content_vectors
+from recommendations.neighbors import build_lock, build_neighbors
+
+VECTOR_BUILDERS = {
+    RATING_KIND: build_rating_vectors,
+    CONTENT_KIND: build_content_vectors,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "영화별 유사 영화 상위 K개를 계산해 저장합니다. "
+        "기본은 지난 실행 이후 입력(리뷰 평점, 영화 설명)이 바뀐 영화만 다시 계산하며, --full이면 전체를 다시 계산합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--kind', action='append', choices=list(VECTOR_BUILDERS),
+            help='계산할 유사도 종류 (여러 번 지정 가능, 기본값: 전체)',
+        )
+        parser.add_argument('--full', action='store_true', help='바뀐 영화만이 아니라 전체를 다시 계산')
+
+    def handle(self, *args, **options):
+        for kind in options['kind'] or list(VECTOR_BUILDERS):
+            with build_lock(kind) as acquired:
+                if not acquired:
+                    raise CommandError(f"[{kind}] 다른 프로세스가 계산 중입니다. 끝난 뒤 다시 실행하세요.")
+                self.build(kind, options['full'])
+
+    def build(self, kind, full):
+        started = time.perf_counter()
+        vectors = VECTOR_BUILDERS[kind]()
+        loaded = time.perf_counter()
+        self.stdout.write(
+            f"[{kind}] 벡터 {len(vectors.movie_ids):,}개 ({vectors.matrix.shape[0]:,}차원, "
+            f"0이 아닌 값 {vectors.matrix.nnz:,}개) {loaded - started:.1f}초"
+        )
+        stats = build_neighbors(kind, vectors, full=full, stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS(
+            f"[{kind}] {stats['mode']}: 재계산 {stats['changed']:,}개, 병합 {stats['affected']:,}개, "
+            f"제외 {stats['removed']:,}개, 저장 {stats['rows']:,}행 {time.perf_counter() - loaded:.1f}초"
+        ))
@@ -0,0 +1,43 @@
+# Generated by Django 5.2 on 2026-10-18 21:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('movies', '0006_movie_ott_mask'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MovieNeighbor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('rating', '평점 협업 필터링')], max_length=10, verbose_name='유사도 종류')),
+                ('rank', models.PositiveSmallIntegerField(help_text='0부터 시작, 작을수록 유사', verbose_name='순위')),
+                ('score', models.FloatField(verbose_name='유사도')),
+                ('movie', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='movies.movie', verbose_name='영화')),
+                ('neighbor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='movies.movie', verbose_name='유사 영화')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('kind', 'movie', 'rank'), name='movie_neighbor_unique_rank')],
+            },
+        ),
+        migrations.CreateModel(
+            name='NeighborSource',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('rating', '평점 협업 필터링')], max_length=10, verbose_name='유사도 종류')),
+                ('signature', models.BigIntegerField(help_text='평점 목록 등 벡터 입력의 해시', verbose_name='입력 서명')),
+                ('built_at', models.DateTimeField(auto_now=True, verbose_name='계산 일시')),
+                ('movie', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='movies.movie', verbose_name='영화')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('kind', 'movie'), name='neighbor_source_unique_movie')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-18 22:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommendations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='movieneighbor',
+            name='kind',
+            field=models.CharField(choices=[('rating', '평점 협업 필터링'), ('content', '설명 TF-IDF')], max_length=10, verbose_name='유사도 종류'),
+        ),
+        migrations.AlterField(
+            model_name='neighborsource',
+            name='kind',
+            field=models.CharField(choices=[('rating', '평점 협업 필터링'), ('content', '설명 TF-IDF')], max_length=10, verbose_name='유사도 종류'),
+        ),
+    ]
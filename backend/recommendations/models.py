@@ -0,0 +1,42 @@
+from django.db import models
+
+from movies.models import Movie
+
+
+# ✅ 영화별 유사 영화 상위 K개 (build_movie_neighbors 명령이 미리 계산해 저장)
+# - (kind, movie, rank) 유니크 인덱스 하나로 "이 영화와 비슷한 영화" 목록을 순서대로 조회
+class MovieNeighbor(models.Model):
+    KIND_CHOICES = [
+        ('rating', '평점 협업 필터링'),
+        ('content', '설명 TF-IDF'),
+    ]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, verbose_name="유사도 종류")
+    movie = models.ForeignKey(Movie, on_delete=models.CASCADE, related_name='+', verbose_name="영화")
+    neighbor = models.ForeignKey(Movie, on_delete=models.CASCADE, related_name='+', verbose_name="유사 영화")
+    rank = models.PositiveSmallIntegerField(verbose_name="순위", help_text="0부터 시작, 작을수록 유사")
+    score = models.FloatField(verbose_name="유사도")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'movie', 'rank'], name='movie_neighbor_unique_rank'),
+        ]
+
+    def __str__(self):
+        return f"[{self.kind}] {self.movie_id} → {self.neighbor_id} ({self.score:.3f})"
+
+
+# ✅ 마지막 계산 때 영화별 입력 서명 (다음 실행에서 서명이 바뀐 영화만 다시 계산)
+class NeighborSource(models.Model):
+    kind = models.CharField(max_length=10, choices=MovieNeighbor.KIND_CHOICES, verbose_name="유사도 종류")
+    movie = models.ForeignKey(Movie, on_delete=models.CASCADE, related_name='+', verbose_name="영화")
+    signature = models.BigIntegerField(verbose_name="입력 서명", help_text="평점 목록 등 벡터 입력의 해시")
+    built_at = models.DateTimeField(auto_now=True, verbose_name="계산 일시")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'movie'], name='neighbor_source_unique_movie'),
+        ]
+
+    def __str__(self):
+        return f"[{self.kind}] {self.movie_id} ({self.signature})"
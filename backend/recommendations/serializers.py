@@ -0,0 +1,14 @@
+from rest_framework import serializers
+
+
+# ✅ 유사 영화 / 추천 영화 (MovieNeighbor 조회 결과 한 행 = 영화 하나)
+class NeighborMovieSerializer(serializers.Serializer):
+    id = serializers.IntegerField(source='neighbor_id')
+    title = serializers.CharField(source='neighbor__title')
+    thumbnail_url = serializers.URLField(source='neighbor__thumbnail_url', allow_null=True)
+    release_date = serializers.DateField(source='neighbor__release_date')
+    average_rating = serializers.SerializerMethodField(help_text="영화의 평균 평점 (소수점 첫째자리까지, 캐시 값)")
+    score = serializers.FloatField(help_text="유사도 (추천은 좋아한 영화들과의 유사도 합)")
+
+    def get_average_rating(self, obj):
+        return round(obj['neighbor__average_rating_cache'], 1)
@@ -0,0 +1,184 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.test.utils import override_settings
+from rest_framework.test import APIClient
+
+from config.checks import check_shared_cache
+from movies.models import Movie
+from reviews.models import Review
+from .content import KIND as CONTENT_KIND, content_neighbor_updater
+from .models import MovieNeighbor, NeighborSource
+from .neighbors import build_lock
+
+User = get_user_model()
+
+
+@override_settings(MOVIE_NEIGHBORS={'TOP_K': 3, 'BATCH_SIZE': 2, 'SHRINKAGE': 0, 'FULL_REBUILD_RATIO': 0.5})
+class MovieNeighborTest(TestCase):
+    # 사용자별 평점 (영화 제목 → 평점): 액션1/액션2, 멜로1/멜로2를 같은 사람들이 비슷하게 평가
+    RATINGS = {
+        'u1': {'액션1': 5, '액션2': 5, '멜로1': 1, '멜로2': 2},
+        'u2': {'액션1': 4, '액션2': 5, '멜로1': 2, '멜로2': 1},
+        'u3': {'액션1': 1, '액션2': 2, '멜로1': 5, '멜로2': 5},
+        'u4': {'액션1': 2, '액션2': 1, '멜로1': 4, '멜로2': 5, '다큐': 3},
+        'u5': {'액션1': 5, '다큐': 4},
+    }
+
+    def setUp(self):
+        self.movies = {
+            title: Movie.objects.create(title=title, description='설명', release_date='2020-01-01')
+            for title in ('액션1', '액션2', '멜로1', '멜로2', '다큐')
+        }
+        self.users = {
+            name: User.objects.create_user(username=name, email=f'{name}@example.com', password='pass1234')
+            for name in self.RATINGS
+        }
+        for name, ratings in self.RATINGS.items():
+            for title, rating in ratings.items():
+                Review.objects.create(user=self.users[name], movie=self.movies[title], rating=rating)
+        self.client = APIClient()
+
+    def build(self, *args):
+        out = StringIO()
+        call_command('build_movie_neighbors', *args, stdout=out)
+        return out.getvalue()
+
+    def similar(self, title):
+        response = self.client.get(f'/api/movies/{self.movies[title].pk}/similar/')
+        self.assertEqual(response.status_code, 200)
+        return [movie['title'] for movie in response.json()]
+
+    def stored_lists(self):
+        return sorted(MovieNeighbor.objects.values_list('movie_id', 'rank', 'neighbor_id'))
+
+    def test_similar_movies_from_rating_patterns(self):
+        self.assertIn('full', self.build())
+        self.assertEqual(self.similar('액션1')[0], '액션2')
+        self.assertEqual(self.similar('멜로2')[0], '멜로1')
+        with self.assertNumQueries(1):
+            self.client.get(f'/api/movies/{self.movies["액션1"].pk}/similar/')
+        self.assertEqual(self.client.get('/api/movies/999999/similar/').status_code, 404)
+
+    def test_recommended_excludes_reviewed_movies(self):
+        self.build()
+        newcomer = User.objects.create_user(username='new', email='new@example.com', password='pass1234')
+        Review.objects.create(user=newcomer, movie=self.movies['멜로1'], rating=5)
+        self.client.force_authenticate(newcomer)
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/movies/recommended/')
+        titles = [movie['title'] for movie in response.json()]
+        self.assertEqual(titles[0], '멜로2')
+        self.assertNotIn('멜로1', titles)
+
+        self.client.force_authenticate(None)
+        self.assertIn(self.client.get('/api/movies/recommended/').status_code, (401, 403))
+
+    def test_incremental_rebuild_matches_full_rebuild(self):
+        self.build()
+        self.assertIn('[rating] incremental: 재계산 0개', self.build())
+
+        # 다큐를 액션 팬들이 높게 평가 → 다큐만 다시 계산하고 다른 영화 목록에는 병합
+        Review.objects.create(user=self.users['u1'], movie=self.movies['다큐'], rating=5)
+        Review.objects.create(user=self.users['u2'], movie=self.movies['다큐'], rating=5)
+        Review.objects.create(user=self.users['u3'], movie=self.movies['다큐'], rating=1)
+        Review.objects.filter(user=self.users['u4'], movie=self.movies['다큐']).get().delete()
+        output = self.build()
+        self.assertIn('[rating] incremental: 재계산 1개', output)
+        self.assertIn('[content] incremental: 재계산 0개', output)
+        incremental = self.stored_lists()
+
+        self.build('--full', '--kind', 'rating')
+        self.assertEqual(incremental, self.stored_lists())
+        self.assertIn('다큐', self.similar('액션1'))
+
+
+@override_settings(
+    MOVIE_NEIGHBORS={'TOP_K': 3},
+    MOVIE_CONTENT_NEIGHBORS={'ASYNC': False, 'MAX_DF_RATIO': 0.9},
+    SEARCH_INDEX={'ASYNC': False},
+)
+class ContentNeighborTest(TestCase):
+    DESCRIPTIONS = {
+        '우주 전쟁': '우주선을 타고 은하계를 탐험하는 우주 비행사들의 모험',
+        '우주 탐험': '우주 비행사가 은하계 너머 미지의 행성을 탐험한다',
+        '요리 대결': '최고의 요리사들이 주방에서 벌이는 요리 대결',
+        '요리 여행': '요리사가 전국의 맛집과 주방을 찾아 떠나는 여행',
+    }
+
+    def setUp(self):
+        self.movies = {
+            title: Movie.objects.create(title=title, description=description, release_date='2020-01-01')
+            for title, description in self.DESCRIPTIONS.items()
+        }
+        call_command('build_movie_neighbors', '--kind', 'content', stdout=StringIO())
+        self.client = APIClient()
+
+    def similar(self, movie, mode='content'):
+        response = self.client.get(f'/api/movies/{movie.pk}/similar/', {'mode': mode})
+        self.assertEqual(response.status_code, 200)
+        return [item['title'] for item in response.json()]
+
+    def test_similar_by_description(self):
+        self.assertEqual(self.similar(self.movies['우주 전쟁'])[0], '우주 탐험')
+        self.assertEqual(self.similar(self.movies['요리 여행'])[0], '요리 대결')
+        self.assertEqual(self.similar(self.movies['우주 전쟁'], mode='rating'), [])
+        response = self.client.get(f'/api/movies/{self.movies["우주 전쟁"].pk}/similar/', {'mode': 'unknown'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_new_and_edited_movies_update_on_commit(self):
+        # 리뷰가 없는 새 영화도 저장 직후 설명으로 비슷한 영화가 생김
+        with self.captureOnCommitCallbacks(execute=True):
+            movie = Movie.objects.create(title='새 영화', description='은하계 우주선 비행사 이야기', release_date='2024-01-01')
+        self.assertEqual(self.similar(movie)[0][:2], '우주')
+
+        trip = self.movies['요리 여행']
+        trip.description = '우주 비행사들이 은하계의 미지의 행성으로 떠나는 여행'
+        with self.captureOnCommitCallbacks(execute=True):
+            trip.save(update_fields=['description'])
+        self.assertEqual(self.similar(trip)[0][:2], '우주')
+        self.assertIn('요리 여행', self.similar(self.movies['우주 탐험']))
+
+        # 설명 외 필드만 저장하면 갱신 예약 없음
+        with self.captureOnCommitCallbacks() as callbacks:
+            trip.save(update_fields=['title'])
+        self.assertNotIn(content_neighbor_updater.schedule, callbacks)
+
+    def test_hook_never_runs_full_build(self):
+        # 아직 계산한 적 없으면 (배포 후 첫 수정) 건너뛰고 전체 계산은 관리 명령에 맡김
+        MovieNeighbor.objects.filter(kind=CONTENT_KIND).delete()
+        NeighborSource.objects.filter(kind=CONTENT_KIND).delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            Movie.objects.create(title='새 영화', description='은하계 우주선 비행사 이야기', release_date='2024-01-01')
+        self.assertFalse(MovieNeighbor.objects.filter(kind=CONTENT_KIND).exists())
+        self.assertFalse(NeighborSource.objects.filter(kind=CONTENT_KIND).exists())
+
+        # 바뀐 영화 비율이 FULL_REBUILD_RATIO를 넘어도 건너뜀
+        call_command('build_movie_neighbors', '--kind', 'content', stdout=StringIO())
+        before = list(MovieNeighbor.objects.filter(kind=CONTENT_KIND).values_list('movie_id', 'neighbor_id', 'rank'))
+        for movie in self.movies.values():
+            movie.description += ' 그리고 결말'
+            movie.save(update_fields=['description'])
+        self.assertEqual(content_neighbor_updater.update()['mode'], 'skipped')
+        after = list(MovieNeighbor.objects.filter(kind=CONTENT_KIND).values_list('movie_id', 'neighbor_id', 'rank'))
+        self.assertEqual(after, before)
+
+    def test_builds_are_serialized_across_processes(self):
+        movie = self.movies['요리 여행']
+        movie.description = '우주 비행사들이 은하계의 미지의 행성으로 떠나는 여행'
+        movie.save(update_fields=['description'])
+        with build_lock(CONTENT_KIND) as acquired:
+            self.assertTrue(acquired)
+            self.assertEqual(content_neighbor_updater.update(), {'mode': 'locked'})
+            with self.assertRaises(CommandError):
+                call_command('build_movie_neighbors', '--kind', 'content', stdout=StringIO())
+        # 잠금이 풀리면 다시 계산됨
+        self.assertEqual(content_neighbor_updater.update()['mode'], 'incremental')
+        self.assertEqual(self.similar(movie)[0][:2], '우주')
+
+    def test_process_local_cache_is_reported_at_startup(self):
+        with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+            warnings = [error.msg for error in check_shared_cache(None) if error.id == 'config.W001']
+        self.assertTrue(any('MOVIE_NEIGHBORS' in msg for msg in warnings))
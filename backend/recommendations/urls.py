@@ -0,0 +1,12 @@
+from django.urls import path
+from .views import MovieRecommendedView, MovieSimilarView
+
+urlpatterns = [
+    # 🎬 비슷한 영화 (평점 협업 필터링)
+    # GET /api/movies/<int:pk>/similar/?limit=20
+    path('<int:pk>/similar/', MovieSimilarView.as_view(), name='movie-similar'),
+
+    # 🎬 내게 맞는 추천 영화 (인증 필요)
+    # GET /api/movies/recommended/?limit=20
+    path('recommended/', MovieRecommendedView.as_view(), name='movie-recommended'),
+]
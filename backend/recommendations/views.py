@@ -0,0 +1,95 @@
+from django.db.models import Sum
+from rest_framework.exceptions import NotFound
+from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from config.authentication import CookieJWTAuthentication
+from movies.models import Movie
+from reviews.models import Review
+from .collaborative import KIND as RATING_KIND
+from .content import KIND as CONTENT_KIND
+from .models import MovieNeighbor
+from .neighbors import get_config
+from .serializers import NeighborMovieSerializer
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 50
+NEIGHBOR_FIELDS = (
+    'neighbor_id', 'neighbor__title', 'neighbor__thumbnail_url', 'neighbor__release_date',
+    'neighbor__average_rating_cache',
+)
+SIMILAR_MODES = (RATING_KIND, CONTENT_KIND)
+MODE_PARAMETER = openapi.Parameter(
+    'mode', openapi.IN_QUERY, type=openapi.TYPE_STRING, enum=list(SIMILAR_MODES), default=RATING_KIND,
+    description="rating: 평점 협업 필터링 / content: 설명 TF-IDF (리뷰가 없는 새 영화도 결과가 있음)",
+)
+LIMIT_PARAMETER = openapi.Parameter(
+    'limit', openapi.IN_QUERY, description=f"결과 수 (기본 {DEFAULT_LIMIT}, 최대 {MAX_LIMIT})", type=openapi.TYPE_INTEGER,
+)
+
+
+def get_limit(request):
+    try:
+        return min(max(int(request.query_params.get('limit', DEFAULT_LIMIT)), 1), MAX_LIMIT)
+    except ValueError:
+        return DEFAULT_LIMIT
+
+
+# ✅ 비슷한 영화 (미리 계산된 MovieNeighbor에서 (종류, 영화, 순위) 인덱스로 한 번에 조회)
+class MovieSimilarView(APIView):
+    authentication_classes = [CookieJWTAuthentication]
+    permission_classes = [IsAuthenticatedOrReadOnly]
+
+    @swagger_auto_schema(
+        operation_summary="비슷한 영화",
+        operation_description=(
+            "비슷한 영화를 유사도 순으로 반환합니다.\n"
+            "- `mode=rating`(기본): 이 영화를 높게/낮게 평가한 사용자들이 비슷하게 평가한 영화 "
+            "(`build_movie_neighbors` 명령으로 주기적으로 갱신, 리뷰가 적은 영화는 결과가 없을 수 있음)\n"
+            "- `mode=content`: 영화 설명의 한국어 n-gram TF-IDF 유사도 (영화 생성/설명 수정 시 자동 갱신)"
+        ),
+        manual_parameters=[MODE_PARAMETER, LIMIT_PARAMETER],
+        responses={200: NeighborMovieSerializer(many=True)},
+    )
+    def get(self, request, pk):
+        mode = request.query_params.get('mode', RATING_KIND)
+        if mode not in SIMILAR_MODES:
+            raise NotFound(f"알 수 없는 유사도 종류입니다: {mode}")
+        neighbors = list(
+            MovieNeighbor.objects.filter(kind=mode, movie_id=pk)
+            .order_by('rank').values(*NEIGHBOR_FIELDS, 'score')[:get_limit(request)]
+        )
+        if not neighbors and not Movie.objects.filter(pk=pk).exists():
+            raise NotFound("영화를 찾을 수 없습니다.")
+        return Response(NeighborMovieSerializer(neighbors, many=True).data)
+
+
+# ✅ 내게 맞는 추천 영화 (좋아한 영화들의 유사 영화 목록을 합산, 이미 리뷰한 영화 제외 - 쿼리 한 번)
+class MovieRecommendedView(APIView):
+    authentication_classes = [CookieJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_summary="추천 영화",
+        operation_description=(
+            "내가 높게 평가한(기본 4점 이상) 영화들과 비슷한 영화를 유사도 합이 큰 순으로 추천합니다.\n"
+            "이미 리뷰한 영화는 제외하며, 높게 평가한 영화가 없으면 빈 목록입니다."
+        ),
+        manual_parameters=[LIMIT_PARAMETER],
+        responses={200: NeighborMovieSerializer(many=True)},
+    )
+    def get(self, request):
+        reviews = Review.objects.filter(user=request.user).order_by()
+        liked = reviews.filter(rating__gte=get_config()['RECOMMEND_MIN_RATING']).values('movie_id')
+        recommended = (
+            MovieNeighbor.objects.filter(kind=RATING_KIND, movie_id__in=liked)
+            .exclude(neighbor_id__in=reviews.values('movie_id'))
+            .values(*NEIGHBOR_FIELDS)
+            .annotate(score=Sum('score'))
+            .order_by('-score', 'neighbor_id')[:get_limit(request)]
+        )
+        return Response(NeighborMovieSerializer(recommended, many=True).data)
@@ -1,6 +1,14 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class ReviewsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'reviews'
+
+    def ready(self):
+        from .models import ReviewImage, handle_review_image_changed
+
+        # ✅ 이미지 추가/삭제 → 리뷰 updated_at 갱신 (상세 조회 ETag)
+        post_save.connect(handle_review_image_changed, sender=ReviewImage, dispatch_uid='reviews:image_saved')
+        post_delete.connect(handle_review_image_changed, sender=ReviewImage, dispatch_uid='reviews:image_deleted')
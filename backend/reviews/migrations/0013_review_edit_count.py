@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-18 18:27
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_edit_count(apps, schema_editor):
+    Review = apps.get_model('reviews', 'Review')
+    ReviewHistory = apps.get_model('reviews', 'ReviewHistory')
+
+    histories = (
+        ReviewHistory.objects.filter(review_id=OuterRef('pk'))
+        .order_by()
+        .values('review_id')
+        .annotate(count=Count('id'))
+        .values('count')
+    )
+    Review.objects.update(
+        edit_count=Coalesce(Subquery(histories, output_field=IntegerField()), 0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0012_delete_reviewlike'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='review',
+            name='edit_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_edit_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2 on 2026-10-18 21:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0007_movie_updated_at'),
+        ('reviews', '0014_keyset_pagination_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['movie', '-updated_at'], name='review_movie_updated_idx'),
+        ),
+    ]
@@ -1,4 +1,5 @@
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models.functions import Now
 from django.contrib.auth import get_user_model
 from movies.models import Movie
 
@@ -13,27 +14,100 @@ class Review(models.Model):
     rating = models.FloatField() # 평점 (1~5)
     comment = models.TextField(blank=True)  # 코멘트 (선택 사항)
     created_at = models.DateTimeField(auto_now_add=True)  # 작성 일시
-    updated_at = models.DateTimeField(auto_now=True)      # 수정 일시
+    updated_at = models.DateTimeField(auto_now=True)      # 수정 일시 (좋아요 수 / 이미지 변경 포함, 상세 조회 ETag 검증값)
     like_count = models.PositiveIntegerField(default=0)   # 좋아요 수
     dislike_count = models.PositiveIntegerField(default=0)  # 싫어요 수
     is_spoiler = models.BooleanField(default=False)       # 스포일러 여부
+    edit_count = models.PositiveIntegerField(default=0)   # 수정 횟수 (수정 이력 수를 비정규화)
+
+    # 영화 평점 집계에 영향을 주는 필드 (저장/삭제 시 DB에 저장돼 있던 값과 비교해 증감 계산)
+    AGGREGATE_FIELDS = ('movie_id', 'rating')
+
+    def _lock_stored_aggregate_fields(self):
+        """
+        저장돼 있던 평점/대상 영화를 행 잠금과 함께 읽습니다 (없으면 빈 dict)
+        메모리의 값은 불러온 뒤 다른 요청이 바꿨을 수 있으므로, 같은 리뷰를 동시에 수정/삭제해도
+        각 요청이 직전에 저장된 값 기준의 증감만 집계에 반영하도록 같은 트랜잭션에서 잠그고 읽음
+        """
+        return Review.objects.select_for_update().filter(pk=self.pk).values(*self.AGGREGATE_FIELDS).first() or {}
 
     def save(self, *args, **kwargs):
         """
-        저장 시 영화의 평균 평점 자동 갱신
+        저장 시 평점/대상 영화가 실제로 바뀐 경우에만 영화의 평점 집계를 증분 갱신
+        (좋아요 수, 스포일러 여부 등 다른 필드만 저장할 때는 movies 테이블을 건드리지 않음)
         """
         is_new_review = self._state.adding
-        super().save(*args, **kwargs)
-        if is_new_review or self._state.db == 'default':
-            self.movie.update_average_rating()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'updated_at' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'updated_at']
+        if not is_new_review and update_fields is not None:
+            touches_aggregate = bool({'movie', 'movie_id', 'rating'} & set(update_fields))
+        else:
+            touches_aggregate = True
+
+        if not touches_aggregate:
+            super().save(*args, **kwargs)
+            return
+
+        with transaction.atomic():
+            previous = {} if is_new_review else self._lock_stored_aggregate_fields()
+            super().save(*args, **kwargs)
+            if is_new_review or not previous:
+                Movie.apply_rating_delta(self.movie_id, self.rating, 1)
+            elif previous['movie_id'] != self.movie_id:
+                Movie.apply_rating_delta(previous['movie_id'], -previous['rating'], -1)
+                Movie.apply_rating_delta(self.movie_id, self.rating, 1)
+            elif previous['rating'] != self.rating:
+                Movie.apply_rating_delta(self.movie_id, self.rating - previous['rating'])
+
+    @classmethod
+    def apply_reaction_delta(cls, review_id, like_delta=0, dislike_delta=0):
+        """
+        좋아요/싫어요 수를 F() 증감으로 한 번의 UPDATE ... RETURNING 으로 갱신하고
+        갱신된 (like_count, dislike_count)를 반환합니다. 리뷰가 없으면 None을 반환합니다.
+        (응답에 보이는 값이 바뀌므로 updated_at도 같은 UPDATE에서 DB 시각(Now())으로 갱신, 다른 갱신 경로와 같은 시계)
+        """
+        table = connection.ops.quote_name(cls._meta.db_table)
+        like_column = connection.ops.quote_name(cls._meta.get_field('like_count').column)
+        dislike_column = connection.ops.quote_name(cls._meta.get_field('dislike_count').column)
+        updated_column = connection.ops.quote_name(cls._meta.get_field('updated_at').column)
+        pk_column = connection.ops.quote_name(cls._meta.pk.column)
+        now_sql, now_params = cls.objects.all().query.get_compiler(connection=connection).compile(Now())
+        sql = (
+            f"UPDATE {table} SET {like_column} = {like_column} + %s, "
+            f"{dislike_column} = {dislike_column} + %s, {updated_column} = {now_sql} WHERE {pk_column} = %s"
+        )
+        params = [like_delta, dislike_delta, *now_params, review_id]
+        with connection.cursor() as cursor:
+            if connection.features.can_return_columns_from_insert:
+                cursor.execute(f"{sql} RETURNING {like_column}, {dislike_column}", params)
+                row = cursor.fetchone()
+            else:
+                # RETURNING 미지원 DB: 같은 트랜잭션 안에서 갱신 후 다시 조회
+                cursor.execute(sql, params)
+                row = cls.objects.filter(pk=review_id).values_list('like_count', 'dislike_count').first()
+        return tuple(row) if row else None
 
     def delete(self, *args, **kwargs):
         """
-        삭제 시에도 영화의 평균 평점 자동 갱신
+        삭제 시에도 영화의 평점 집계를 증분 갱신 (DB에 저장돼 있던 값 기준)
         """
-        movie = self.movie
-        super().delete(*args, **kwargs)
-        movie.update_average_rating()
+        with transaction.atomic():
+            stored = self._lock_stored_aggregate_fields()
+            result = super().delete(*args, **kwargs)
+            if stored:
+                Movie.apply_rating_delta(stored['movie_id'], -stored['rating'], -1)
+        return result
+
+    class Meta:
+        indexes = [
+            # 리뷰 목록 키셋 페이지네이션: 영화별 최신순/추천순, 전체 최신순
+            models.Index(fields=['movie', '-created_at', '-id'], name='review_movie_created_idx'),
+            models.Index(fields=['movie', '-like_count', '-id'], name='review_movie_like_idx'),
+            models.Index(fields=['-created_at', '-id'], name='review_created_id_idx'),
+            # 영화 상세 ETag: 영화별 가장 최근에 바뀐 리뷰 시각 (인덱스 한 항목만 읽음)
+            models.Index(fields=['movie', '-updated_at'], name='review_movie_updated_idx'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.movie.title} ({self.rating}점)"
@@ -102,4 +176,12 @@ class ReviewImage(models.Model):
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
-        return f"Image for Review {self.review.id}"
\ No newline at end of file
+        return f"Image for Review {self.review.id}"
+
+# ---------------------------------------------------------------------
+# ✅ 이미지 추가/삭제 → 리뷰 변경 시각 갱신 (apps.py에서 연결, QuerySet.delete()도 신호 발생)
+# ---------------------------------------------------------------------
+def handle_review_image_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    Review.objects.filter(pk=instance.review_id).update(updated_at=Now())
@@ -0,0 +1,40 @@
+from django.urls import reverse
+
+from config.pagination import ApproximateCountPagination, KeysetCursorPagination
+
+
+# ---------------------------------------------------------------------
+# ✅ 리뷰 커서 페이지네이션 (기본 최신순, 작성일 동률 시 id로 순서 고정)
+# ---------------------------------------------------------------------
+class ReviewCursorPagination(KeysetCursorPagination):
+    page_size = 20
+    ordering = ('-created_at', '-id')
+
+
+# ---------------------------------------------------------------------
+# ✅ 리뷰 목록 페이지네이션
+# - cursor 파라미터가 있으면 커서 기반, 없으면 기존 페이지 번호 기반으로 동작
+# - 페이지 번호 방식의 전체 개수는 리뷰가 많으면 근사치 사용
+# ---------------------------------------------------------------------
+class ReviewPagination(ApproximateCountPagination):
+    cursor_pagination_class = ReviewCursorPagination
+
+
+def paginate_movie_reviews(movie, queryset, request):
+    """
+    영화 상세 응답에 포함할 첫 페이지 리뷰와,
+    이어서 조회할 리뷰 목록 API(/api/reviews/?movie=<id>&cursor=...) 링크를 반환합니다.
+
+    상세 요청의 쿼리 파라미터(cursor 등)와 무관하게 항상 첫 페이지 (다음 페이지는 reviews_next로)
+    """
+    paginator = ReviewCursorPagination()
+    rows = list(queryset.order_by(*paginator.ordering)[:paginator.page_size + 1])
+    page = rows[:paginator.page_size]
+    if request is None or len(rows) <= paginator.page_size:
+        return page, None
+
+    paginator.page, paginator.has_next = page, True
+    paginator.base_url = request.build_absolute_uri(
+        f"{reverse('review-list-create')}?movie={movie.pk}"
+    )
+    return page, paginator.get_next_link()
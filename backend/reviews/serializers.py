@@ -35,10 +35,17 @@ class ReviewSerializer(serializers.ModelSerializer):
     my_vote = serializers.SerializerMethodField()
     is_owner = serializers.SerializerMethodField()
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        리뷰 목록 직렬화에 필요한 연관 데이터를 고정된 쿼리 수로 미리 불러옵니다.
+        """
+        return queryset.select_related('user').prefetch_related('images')
+
     def get_is_owner(self, obj):
         request = self.context.get('request')
         return (
-            request and request.user and request.user.is_authenticated and obj.user == request.user
+            request and request.user and request.user.is_authenticated and obj.user_id == request.user.id
         )
 
     def get_my_vote(self, obj):
@@ -51,8 +58,15 @@ class ReviewSerializer(serializers.ModelSerializer):
         return 1 if reaction.is_like else -1
 
     def get_is_edited(self, obj):
-        return obj.histories.exists()
+        return obj.edit_count > 0
     
+    def update(self, instance, validated_data):
+        # 변경된 필드만 저장 (동시에 갱신되는 like_count / dislike_count / edit_count를 덮어쓰지 않도록)
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        return instance
+
     def validate_rating(self, value):
         if value * 2 != int(value * 2):
             raise serializers.ValidationError("평점은 0.5점 단위로만 입력할 수 있습니다.")
@@ -76,6 +90,18 @@ class ReviewSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['user', 'created_at', 'like_count', 'dislike_count', 'is_edited', 'is_owner']
 
+# ---------------------------------------------------------------------
+# ✅ 리뷰 목록 Serializer: 사용자와 무관한 본문만 (my_vote / is_owner 제외)
+# - 누가 요청해도 같은 응답이므로 공유 캐시 가능, 내 반응은 /api/me/reactions/?reviews=...로 덮어씀
+# ---------------------------------------------------------------------
+class PublicReviewSerializer(ReviewSerializer):
+    my_vote = None
+    is_owner = None
+
+    class Meta(ReviewSerializer.Meta):
+        fields = [field for field in ReviewSerializer.Meta.fields if field not in ('my_vote', 'is_owner')]
+        read_only_fields = [field for field in ReviewSerializer.Meta.read_only_fields if field != 'is_owner']
+
 # ---------------------------------------------------------------------
 # ✅ 리뷰 댓글 Serializer
 # ---------------------------------------------------------------------
@@ -1,7 +1,15 @@
-from django.test import TestCase
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
 from movies.models import Movie
-from reviews.models import Review, ReviewComment
+from reviews.models import Review, ReviewComment, ReviewCommentReaction, ReviewHistory, ReviewImage, ReviewReaction
 
 User = get_user_model()
 
@@ -29,6 +37,29 @@ class ReviewModelTest(TestCase):
         self.movie.update_average_rating()
         self.assertEqual(self.movie.average_rating_cache, 2.0)
 
+    def test_rating_aggregates_follow_review_writes(self):
+        review = Review.objects.create(user=self.user, movie=self.movie, rating=4)
+        Review.objects.create(user=self.user, movie=self.movie, rating=2)
+        self.movie.refresh_from_db()
+        self.assertEqual((self.movie.rating_sum, self.movie.rating_count), (6.0, 2))
+        self.assertEqual(self.movie.average_rating_cache, 3.0)
+
+        review.rating = 5
+        review.save()
+        self.movie.refresh_from_db()
+        self.assertEqual((self.movie.rating_sum, self.movie.rating_count), (7.0, 2))
+        self.assertEqual(self.movie.average_rating_cache, 3.5)
+
+        review.delete()
+        self.movie.refresh_from_db()
+        self.assertEqual((self.movie.rating_sum, self.movie.rating_count), (2.0, 1))
+        self.assertEqual(self.movie.average_rating_cache, 2.0)
+
+        Review.objects.get().delete()
+        self.movie.refresh_from_db()
+        self.assertEqual((self.movie.rating_sum, self.movie.rating_count), (0.0, 0))
+        self.assertEqual(self.movie.average_rating_cache, 0.0)
+
 class ReviewCommentTest(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(
@@ -43,4 +74,321 @@ class ReviewCommentTest(TestCase):
         comment = ReviewComment.objects.create(user=self.user, review=self.review, content='동의합니다')
         self.assertEqual(comment.review, self.review)
         self.assertEqual(comment.content, '동의합니다')
-        self.assertEqual(str(comment), f"{self.user.username}: {comment.content[:20]}")
\ No newline at end of file
+        self.assertEqual(str(comment), f"{self.user.username}: {comment.content[:20]}")
+
+class ReviewAggregateDirtyTrackingTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='voter',
+            email='voter@example.com',
+            password='pass1234'
+        )
+        self.movie = Movie.objects.create(title='추천 테스트 영화', description='설명', release_date='2024-01-01')
+        self.review = Review.objects.create(user=self.user, movie=self.movie, rating=4, comment='좋아요')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def assertNoMovieQueries(self, queries):
+        movie_table = Movie._meta.db_table
+        touched = [q['sql'] for q in queries if movie_table in q['sql']]
+        self.assertEqual(touched, [])
+
+    def test_like_toggle_does_not_touch_movies_table(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(f'/api/reviews/{self.review.id}/like/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['like_count'], 1)
+        self.assertNoMovieQueries(ctx.captured_queries)
+
+    def test_non_rating_save_does_not_touch_movies_table(self):
+        review = Review.objects.get(pk=self.review.pk)
+        review.is_spoiler = True
+        with CaptureQueriesContext(connection) as ctx:
+            review.save()
+        self.assertNoMovieQueries(ctx.captured_queries)
+
+    def test_rating_change_updates_aggregates_once(self):
+        review = Review.objects.get(pk=self.review.pk)
+        review.rating = 2
+        with CaptureQueriesContext(connection) as ctx:
+            review.save()
+        movie_table = Movie._meta.db_table
+        self.assertEqual(len([q for q in ctx.captured_queries if movie_table in q['sql']]), 1)
+        self.movie.refresh_from_db()
+        self.assertEqual((self.movie.rating_sum, self.movie.rating_count), (2.0, 1))
+
+    def test_stale_instances_apply_delta_from_stored_rating(self):
+        # 같은 리뷰를 두 요청이 각자 불러와 수정 → 나중 저장도 직전에 저장된 평점 기준으로 증감
+        first, second = Review.objects.get(pk=self.review.pk), Review.objects.get(pk=self.review.pk)
+        first.rating = 2
+        first.save()
+        second.rating = 5
+        second.save()
+        self.movie.refresh_from_db()
+        self.assertEqual((self.movie.rating_sum, self.movie.rating_count), (5.0, 1))
+
+        # 불러온 뒤 평점이 바뀐 인스턴스를 삭제해도 저장돼 있던 평점만큼 빠짐
+        first.delete()
+        self.movie.refresh_from_db()
+        self.assertEqual((self.movie.rating_sum, self.movie.rating_count), (0.0, 0))
+
+
+class ReviewListQueryCountTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='reader',
+            email='reader@example.com',
+            password='pass1234'
+        )
+        self.small_movie = Movie.objects.create(title='리뷰 적은 영화', description='설명', release_date='2024-01-01')
+        self.big_movie = Movie.objects.create(title='리뷰 많은 영화', description='설명', release_date='2024-01-01')
+        self.writer = User.objects.create_user(
+            username='writer',
+            email='writer@example.com',
+            password='pass1234'
+        )
+        for movie, count in ((self.small_movie, 2), (self.big_movie, 20)):
+            for i in range(count):
+                review = Review.objects.create(user=self.writer, movie=movie, rating=3)
+                ReviewReaction.objects.create(user=self.user, review=review, is_like=i % 2 == 0)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def count_list_queries(self, movie):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/reviews/', {'movie': movie.id})
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response.json()['results']
+
+    def test_page_costs_constant_number_of_queries(self):
+        small_queries, _ = self.count_list_queries(self.small_movie)
+        big_queries, results = self.count_list_queries(self.big_movie)
+        self.assertEqual(big_queries, small_queries)
+        self.assertEqual(len(results), 20)
+        # 목록은 사용자와 무관 → 내 투표는 /api/me/reactions/ 한 쿼리로
+        self.assertNotIn('my_vote', results[0])
+        ids = ','.join(str(review['id']) for review in results)
+        with self.assertNumQueries(1):
+            reactions = self.client.get('/api/me/reactions/', {'reviews': ids}).json()['reviews']
+        self.assertEqual({reaction['my_vote'] for reaction in reactions.values()}, {1, -1})
+
+    def test_edit_marks_review_as_edited(self):
+        review = Review.objects.filter(movie=self.small_movie).first()
+        self.client.force_authenticate(review.user)
+        response = self.client.patch(f'/api/reviews/{review.id}/', {'comment': '수정했어요'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['is_edited'])
+        review.refresh_from_db()
+        self.assertEqual(review.edit_count, 1)
+
+    def test_rejected_or_failed_edit_leaves_no_history(self):
+        review = Review.objects.filter(movie=self.small_movie).first()
+        self.client.force_authenticate(review.user)
+        url = f'/api/reviews/{review.id}/'
+        # 검증 실패(평점 범위 밖) → 이력 / 수정 횟수 그대로
+        self.assertEqual(self.client.patch(url, {'rating': 9}, format='json').status_code, 400)
+        # 저장 중 오류 → 같은 트랜잭션의 이력도 롤백
+        with mock.patch.object(Review, 'save', side_effect=RuntimeError('저장 실패')):
+            with self.assertRaises(RuntimeError):
+                self.client.patch(url, {'comment': '수정'}, format='json')
+        review.refresh_from_db()
+        self.assertEqual(review.edit_count, 0)
+        self.assertFalse(ReviewHistory.objects.filter(review=review).exists())
+
+
+class ReviewConditionalGetTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='owner', email='owner@example.com', password='pass1234')
+        movie = Movie.objects.create(title='조건부 리뷰 영화', description='설명', release_date='2024-01-01')
+        self.review = Review.objects.create(user=self.user, movie=movie, rating=4)
+        self.url = f'/api/reviews/{self.review.id}/'
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_etag_changes_with_reactions_images_and_edits(self):
+        response = self.client.get(self.url)
+        etag = response['ETag']
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+
+        # 작성자가 아니면 ETag가 맞아도 304 대신 원래 권한 응답
+        stranger = User.objects.create_user(username='stranger', email='stranger@example.com', password='pass1234')
+        client = APIClient()
+        client.force_authenticate(stranger)
+        self.assertEqual(client.get(self.url, headers={'If-None-Match': etag}).status_code, 403)
+        self.assertEqual(APIClient().get(self.url, headers={'If-None-Match': etag}).status_code, 401)
+
+        etags = {etag}
+        self.client.post(f'/api/reviews/{self.review.id}/like/')
+        etags.add(self.client.get(self.url)['ETag'])
+        image = ReviewImage.objects.create(review=self.review, image='review_images/poster.png')
+        etags.add(self.client.get(self.url)['ETag'])
+        image.delete()
+        etags.add(self.client.get(self.url)['ETag'])
+        self.client.patch(self.url, {'comment': '수정'}, format='json')
+        response = self.client.get(self.url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['my_vote'], 1)
+        etags.add(response['ETag'])
+        self.assertEqual(len(etags), 5)
+
+
+class ToggleReviewReactionTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='toggler',
+            email='toggler@example.com',
+            password='pass1234'
+        )
+        self.movie = Movie.objects.create(title='토글 영화', description='설명', release_date='2024-01-01')
+        self.review = Review.objects.create(user=self.user, movie=self.movie, rating=4)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def toggle(self, reaction_type):
+        response = self.client.post(f'/api/reviews/{self.review.id}/{reaction_type}/')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        return data['my_vote'], data['like_count'], data['dislike_count']
+
+    def test_toggle_transitions(self):
+        self.assertEqual(self.toggle('like'), (1, 1, 0))
+        self.assertEqual(self.toggle('dislike'), (-1, 0, 1))
+        self.assertEqual(self.toggle('dislike'), (0, 0, 0))
+        self.review.refresh_from_db()
+        self.assertEqual((self.review.like_count, self.review.dislike_count), (0, 0))
+        self.assertFalse(ReviewReaction.objects.exists())
+
+    def test_toggle_missing_review_returns_404(self):
+        response = self.client.post('/api/reviews/999999/like/')
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(ReviewReaction.objects.exists())
+
+    def test_reaction_stamps_updated_at_with_database_clock(self):
+        # 앱 서버 시계가 틀려도 updated_at은 다른 갱신 경로(Now())와 같은 DB 시각
+        skewed = self.review.updated_at - timedelta(days=365)
+        with mock.patch('django.utils.timezone.now', return_value=skewed):
+            Review.apply_reaction_delta(self.review.id, like_delta=1)
+        previous = self.review.updated_at
+        self.review.refresh_from_db()
+        self.assertGreaterEqual(self.review.updated_at, previous)
+
+
+@skipUnlessDBFeature('has_select_for_update')
+@override_settings(MOVIE_CONTENT_NEIGHBORS={'ASYNC': False})
+class ToggleReviewReactionConcurrencyTest(TransactionTestCase):
+    THREADS_PER_USER = 2
+    USERS = 8
+    TOGGLES_PER_THREAD = 125  # 총 2,000회 동시 토글
+
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(
+                username=f'stress{i}',
+                email=f'stress{i}@example.com',
+                password='pass1234'
+            )
+            for i in range(self.USERS)
+        ]
+        movie = Movie.objects.create(title='동시성 영화', description='설명', release_date='2024-01-01')
+        self.review = Review.objects.create(user=self.users[0], movie=movie, rating=4)
+
+    def run_toggles(self, user, seed):
+        rng = random.Random(seed)
+        client = APIClient()
+        client.force_authenticate(user)
+        try:
+            for _ in range(self.TOGGLES_PER_THREAD):
+                reaction_type = rng.choice(['like', 'dislike'])
+                response = client.post(f'/api/reviews/{self.review.id}/{reaction_type}/')
+                assert response.status_code == 200, response.content
+        finally:
+            connection.close()
+
+    def test_concurrent_toggles_keep_counters_exact(self):
+        jobs = [
+            (user, seed)
+            for seed, user in enumerate(self.users * self.THREADS_PER_USER)
+        ]
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            for future in [executor.submit(self.run_toggles, *job) for job in jobs]:
+                future.result()
+
+        self.review.refresh_from_db()
+        reactions = ReviewReaction.objects.filter(review=self.review)
+        self.assertEqual(self.review.like_count, reactions.filter(is_like=True).count())
+        self.assertEqual(self.review.dislike_count, reactions.filter(is_like=False).count())
+
+
+class ToggleReviewCommentReactionTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='commentliker',
+            email='commentliker@example.com',
+            password='pass1234'
+        )
+        movie = Movie.objects.create(title='댓글 좋아요 영화', description='설명', release_date='2024-01-01')
+        review = Review.objects.create(user=self.user, movie=movie, rating=4)
+        self.comment = ReviewComment.objects.create(user=self.user, review=review, content='좋아요')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_toggle_updates_like_count(self):
+        response = self.client.post(f'/api/reviews/comments/{self.comment.id}/like/')
+        self.assertEqual((response.status_code, response.json()), (201, {'liked': True}))
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.like_count, 1)
+
+        response = self.client.post(f'/api/reviews/comments/{self.comment.id}/like/')
+        self.assertEqual((response.status_code, response.json()), (200, {'liked': False}))
+        self.comment.refresh_from_db()
+        self.assertEqual(self.comment.like_count, 0)
+
+    def test_toggle_missing_comment_returns_404(self):
+        response = self.client.post('/api/reviews/comments/999999/like/')
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(ReviewCommentReaction.objects.exists())
+
+
+@skipUnlessDBFeature('has_select_for_update')
+@override_settings(MOVIE_CONTENT_NEIGHBORS={'ASYNC': False})
+class ToggleReviewCommentReactionConcurrencyTest(TransactionTestCase):
+    THREADS_PER_USER = 2
+    USERS = 8
+    TOGGLES_PER_THREAD = 125
+
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(
+                username=f'commentstress{i}',
+                email=f'commentstress{i}@example.com',
+                password='pass1234'
+            )
+            for i in range(self.USERS)
+        ]
+        movie = Movie.objects.create(title='댓글 동시성 영화', description='설명', release_date='2024-01-01')
+        review = Review.objects.create(user=self.users[0], movie=movie, rating=4)
+        self.comment = ReviewComment.objects.create(user=self.users[0], review=review, content='인기 댓글')
+
+    def run_toggles(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+        try:
+            for _ in range(self.TOGGLES_PER_THREAD):
+                response = client.post(f'/api/reviews/comments/{self.comment.id}/like/')
+                assert response.status_code in (200, 201), response.content
+        finally:
+            connection.close()
+
+    def test_concurrent_toggles_keep_like_count_exact(self):
+        users = self.users * self.THREADS_PER_USER
+        with ThreadPoolExecutor(max_workers=len(users)) as executor:
+            for future in [executor.submit(self.run_toggles, user) for user in users]:
+                future.result()
+
+        self.comment.refresh_from_db()
+        self.assertEqual(
+            self.comment.like_count,
+            ReviewCommentReaction.objects.filter(comment=self.comment).count()
+        )
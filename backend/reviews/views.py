@@ -1,3 +1,6 @@
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Now
 from rest_framework import status, generics, permissions
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -6,22 +9,25 @@ from rest_framework.filters import OrderingFilter
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
+from config.conditional import ConditionalGetMixin
+
 from .models import (
     Review, ReviewCommentReaction, ReviewHistory,
     ReviewComment, ReviewReaction, ReviewImage
 )
 from .serializers import (
-    ReviewImageSerializer, ReviewSerializer, ReviewCommentSerializer,
+    PublicReviewSerializer, ReviewImageSerializer, ReviewSerializer, ReviewCommentSerializer,
     ReviewReactionSerializer, ReviewHistorySerializer
 )
 from .permissions import IsOwnerOrReadOnly
+from .pagination import ReviewPagination
 
 # ---------------------------------------------------------------------
 # ✅ 리뷰 목록 조회 및 작성
 # ---------------------------------------------------------------------
 class ReviewListCreateView(generics.ListCreateAPIView):
-    serializer_class = ReviewSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = ReviewPagination
     filter_backends = [OrderingFilter]
     ordering_fields = ['created_at', 'rating', 'like_count']
     ordering = ['-created_at']
@@ -35,12 +41,19 @@ class ReviewListCreateView(generics.ListCreateAPIView):
         manual_parameters=[
             openapi.Parameter('movie', openapi.IN_QUERY, description="영화 ID", type=openapi.TYPE_INTEGER),
             openapi.Parameter('ordering', openapi.IN_QUERY, description="정렬 기준", type=openapi.TYPE_STRING),
+            openapi.Parameter('cursor', openapi.IN_QUERY, description="커서 (영화 상세의 reviews_next 링크로 이어서 조회)", type=openapi.TYPE_STRING),
         ],
-        responses={200: ReviewSerializer(many=True)}
+        responses={200: PublicReviewSerializer(many=True)}
     )
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
+    def get_serializer_class(self):
+        # 목록은 사용자와 무관한 본문 (내 투표 / 작성자 여부는 /api/me/reactions/), 작성 응답은 상세와 같은 형태
+        if self.request.method == 'GET':
+            return PublicReviewSerializer
+        return ReviewSerializer
+
     @swagger_auto_schema(
         operation_summary="리뷰 작성",
         operation_description="특정 영화에 대해 평점과 코멘트를 작성합니다.",
@@ -56,7 +69,7 @@ class ReviewListCreateView(generics.ListCreateAPIView):
         if movie_id:
             qs = qs.filter(movie_id=movie_id)
         # annotate 불필요! (like_count는 모델 필드)
-        return qs
+        return PublicReviewSerializer.setup_eager_loading(qs)
 
     def perform_create(self, serializer):
         review = serializer.save(user=self.request.user)
@@ -72,7 +85,7 @@ class ReviewListCreateView(generics.ListCreateAPIView):
 # ---------------------------------------------------------------------
 # ✅ 리뷰 상세 조회 / 수정 / 삭제 및 수정 이력 저장
 # ---------------------------------------------------------------------
-class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
+class ReviewDetailView(ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Review.objects.all()
     serializer_class = ReviewSerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsOwnerOrReadOnly]
@@ -81,15 +94,28 @@ class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
-    @swagger_auto_schema(operation_summary="리뷰 수정", request_body=ReviewSerializer)
-    def put(self, request, *args, **kwargs):
-        instance = self.get_object()
+    def get_last_modified_queryset(self):
+        # IsOwnerOrReadOnly는 조회도 작성자에게만 허용하므로 304 판단도 본인 리뷰에서만
+        if not self.request.user.is_authenticated:
+            return Review.objects.none()
+        return Review.objects.filter(user=self.request.user)
+
+    def record_history(self, instance):
+        """
+        수정 전 내용을 이력으로 남기고, 리뷰의 수정 횟수(edit_count)를 원자적으로 증가
+        (검증을 통과한 뒤 리뷰 저장과 같은 트랜잭션에서 호출 → 실패한 수정은 이력/횟수에 남지 않음)
+        """
         ReviewHistory.objects.create(
             review=instance,
-            user=request.user,
+            user=self.request.user,
             previous_rating=instance.rating,
             previous_comment=instance.comment
         )
+        Review.objects.filter(pk=instance.pk).update(edit_count=F('edit_count') + 1, updated_at=Now())
+        instance.edit_count += 1    # 응답(is_edited)용, 저장은 변경된 필드만 하므로 DB 값을 덮어쓰지 않음
+
+    @swagger_auto_schema(operation_summary="리뷰 수정", request_body=ReviewSerializer)
+    def put(self, request, *args, **kwargs):
         return super().put(request, *args, **kwargs)
 
     @swagger_auto_schema(operation_summary="리뷰 삭제")
@@ -102,30 +128,23 @@ class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
         return context
 
     def perform_update(self, serializer):
-        review = serializer.save()
-        images = self.request.FILES.getlist('images')
-        for image in images:
-            ReviewImage.objects.create(review=review, image=image)
-        # 삭제할 이미지 id 처리
-        delete_image_ids = self.request.data.get('delete_image_ids', [])
-        if isinstance(delete_image_ids, str):
-            try:
-                import json
-                delete_image_ids = json.loads(delete_image_ids)
-            except Exception:
-                delete_image_ids = []
-        for img_id in delete_image_ids:
-            ReviewImage.objects.filter(id=img_id, review=review).delete()
-    
-    def patch(self, request, *args, **kwargs):
-        instance = self.get_object()
-        ReviewHistory.objects.create(
-            review=instance,
-            user=request.user,
-            previous_rating=instance.rating,
-            previous_comment=instance.comment
-        )
-        return super().patch(request, *args, **kwargs)
+        # 검증을 통과한 수정만 이력으로 남기고, 이력 / 수정 횟수 / 리뷰 / 이미지 변경을 한 트랜잭션으로
+        with transaction.atomic():
+            self.record_history(serializer.instance)
+            review = serializer.save()
+            images = self.request.FILES.getlist('images')
+            for image in images:
+                ReviewImage.objects.create(review=review, image=image)
+            # 삭제할 이미지 id 처리
+            delete_image_ids = self.request.data.get('delete_image_ids', [])
+            if isinstance(delete_image_ids, str):
+                try:
+                    import json
+                    delete_image_ids = json.loads(delete_image_ids)
+                except Exception:
+                    delete_image_ids = []
+            for img_id in delete_image_ids:
+                ReviewImage.objects.filter(id=img_id, review=review).delete()
 
 # ---------------------------------------------------------------------
 # ✅ 리뷰 이미지 개별 삭제 API
@@ -151,41 +170,49 @@ class ToggleReviewReaction(APIView):
         responses={200: openapi.Response(description="성공")}
     )
     def post(self, request, review_id, reaction_type):
-        user = request.user
         is_like = reaction_type == 'like'
 
         try:
-            review = Review.objects.get(id=review_id)
+            my_vote, (like_count, dislike_count) = self.toggle(request.user, review_id, is_like)
         except Review.DoesNotExist:
             return Response({"error": "리뷰를 찾을 수 없습니다."}, status=404)
 
-        try:
-            reaction = ReviewReaction.objects.get(user=user, review=review)
-            if reaction.is_like == is_like:
-                reaction.delete()
-            else:
-                reaction.is_like = is_like
-                reaction.save()
-        except ReviewReaction.DoesNotExist:
-            ReviewReaction.objects.create(user=user, review=review, is_like=is_like)
-        # ✅ 항상 like_count/dislike_count 필드값을 최신화!
-        review.like_count = review.reactions.filter(is_like=True).count()
-        review.dislike_count = review.reactions.filter(is_like=False).count()
-        review.save(update_fields=['like_count', 'dislike_count'])
-
-        # my_vote 값도 계산
-        my_vote = 0
-        user_reaction = ReviewReaction.objects.filter(user=user, review=review).first()
-        if user_reaction:
-            my_vote = 1 if user_reaction.is_like else -1
-
         return Response({
             "message": "투표 결과가 반영되었습니다.",
             "my_vote": my_vote,
-            "like_count": review.like_count,
-            "dislike_count": review.dislike_count,
+            "like_count": like_count,
+            "dislike_count": dislike_count,
         }, status=200)
 
+    @staticmethod
+    def toggle(user, review_id, is_like):
+        """
+        하나의 트랜잭션에서 리뷰 행을 잠근 뒤 반응을 토글하고,
+        이전 상태 기준의 증감(delta)만 리뷰 카운터에 반영합니다.
+        (리뷰 행 잠금으로 같은 리뷰에 대한 토글이 직렬화되어 카운터와 반응 행이 항상 일치)
+        반환값: (my_vote, (like_count, dislike_count))
+        """
+        with transaction.atomic():
+            if not Review.objects.select_for_update().filter(pk=review_id).exists():
+                raise Review.DoesNotExist
+
+            reaction = ReviewReaction.objects.filter(user=user, review_id=review_id).first()
+            if reaction is None:
+                ReviewReaction.objects.create(user=user, review_id=review_id, is_like=is_like)
+                like_delta, dislike_delta = (1, 0) if is_like else (0, 1)
+                my_vote = 1 if is_like else -1
+            elif reaction.is_like == is_like:
+                reaction.delete()
+                like_delta, dislike_delta = (-1, 0) if is_like else (0, -1)
+                my_vote = 0
+            else:
+                ReviewReaction.objects.filter(pk=reaction.pk).update(is_like=is_like)
+                like_delta, dislike_delta = (1, -1) if is_like else (-1, 1)
+                my_vote = 1 if is_like else -1
+
+            counts = Review.apply_reaction_delta(review_id, like_delta, dislike_delta)
+        return my_vote, counts
+
 # ---------------------------------------------------------------------
 # ✅ 리뷰 댓글 목록 조회 + 작성 (상위 3개 추천순 정렬 포함)
 # ---------------------------------------------------------------------
@@ -245,21 +272,32 @@ class ToggleReviewCommentReaction(APIView):
         }
     )
     def post(self, request, comment_id):
-        user = request.user
         try:
-            comment = ReviewComment.objects.get(id=comment_id)
+            liked = self.toggle(request.user, comment_id)
         except ReviewComment.DoesNotExist:
             return Response({"error": "댓글을 찾을 수 없습니다."}, status=404)
-
-        reaction, created = ReviewCommentReaction.objects.get_or_create(user=user, comment=comment)
-        if not created:
-            reaction.delete()
-            comment.like_count -= 1
-            comment.save()
-            return Response({'liked': False}, status=200)
-        comment.like_count += 1
-        comment.save()
-        return Response({'liked': True}, status=201)
+        return Response({'liked': liked}, status=201 if liked else 200)
+
+    @staticmethod
+    def toggle(user, comment_id):
+        """
+        하나의 트랜잭션에서 댓글 행을 잠근 뒤 좋아요 행을 생성/삭제하고,
+        like_count 컬럼만 F() ± 1로 갱신합니다. (읽고-수정-저장 없이 원자적으로 반영)
+        반환값: 토글 후 좋아요 상태 (True=좋아요)
+        """
+        with transaction.atomic():
+            if not ReviewComment.objects.select_for_update().filter(pk=comment_id).exists():
+                raise ReviewComment.DoesNotExist
+
+            reaction, created = ReviewCommentReaction.objects.get_or_create(
+                user=user, comment_id=comment_id
+            )
+            if not created:
+                reaction.delete()
+            ReviewComment.objects.filter(pk=comment_id).update(
+                like_count=F('like_count') + (1 if created else -1)
+            )
+        return created
 
 # ---------------------------------------------------------------------
 # ✅ 리뷰 수정 이력 조회 API
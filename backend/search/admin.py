@@ -0,0 +1,9 @@
+from django.contrib import admin
+from .models import SearchDocument
+
+
+@admin.register(SearchDocument)
+class SearchDocumentAdmin(admin.ModelAdmin):
+    list_display = ('id', 'doc_type', 'object_id', 'title', 'indexed_at')
+    search_fields = ('title',)
+    list_filter = ('doc_type',)
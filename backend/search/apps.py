@@ -0,0 +1,17 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+
+class SearchConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'search'
+
+    def ready(self):
+        from .documents import DOCUMENT_TYPES
+        from .indexer import handle_source_deleted, handle_source_saved
+
+        # ✅ 영화/리뷰/게시글이 저장·삭제되면 통합 검색 색인 큐에 추가
+        for document_type in DOCUMENT_TYPES.values():
+            model, uid = document_type.model, f'search:{document_type.name}'
+            post_save.connect(handle_source_saved, sender=model, dispatch_uid=f'{uid}:save')
+            post_delete.connect(handle_source_deleted, sender=model, dispatch_uid=f'{uid}:delete')
@@ -0,0 +1,99 @@
+from django.apps import apps
+from django.utils.html import strip_tags
+
+from config.search import DocumentSearch, highlight
+
+# ---------------------------------------------------------------------
+# ✅ 통합 검색 문서 종류
+# - model: 원본 모델, watch_fields: 이 필드가 바뀔 때만 재색인 (update_fields 기준)
+# - document(obj): 색인할 (제목, 본문), 본문이 비면 색인하지 않음
+# - describe(obj, query): 검색 결과에 내려줄 원본 요약
+# ---------------------------------------------------------------------
+class DocumentType:
+    def __init__(self, name, model, watch_fields, select_related=(), defer=()):
+        self.name = name
+        self.model_label = model
+        self.watch_fields = set(watch_fields)
+        self.select_related = select_related
+        self.defer = defer
+
+    @property
+    def model(self):
+        return apps.get_model(self.model_label)
+
+    def load(self, ids):
+        """원본 id 목록 → {id: 인스턴스} (없어진 원본은 빠짐)"""
+        queryset = self.model._default_manager.select_related(*self.select_related).defer(*self.defer)
+        return queryset.in_bulk(ids)
+
+    def document(self, obj):
+        raise NotImplementedError
+
+    def describe(self, obj, query):
+        raise NotImplementedError
+
+
+class MovieDocument(DocumentType):
+    def document(self, movie):
+        return movie.title, movie.description or ''
+
+    def describe(self, movie, query):
+        return {
+            'id': movie.id,
+            'title': movie.title,
+            'highlight': highlight(movie.description, query),
+            'thumbnail_url': movie.thumbnail_url,
+            'release_date': movie.release_date,
+            'average_rating': movie.average_rating_cache,
+        }
+
+
+class ReviewDocument(DocumentType):
+    def document(self, review):
+        return '', review.comment
+
+    def describe(self, review, query):
+        return {
+            'id': review.id,
+            'movie_id': review.movie_id,
+            'movie_title': review.movie.title,
+            'rating': review.rating,
+            'is_spoiler': review.is_spoiler,
+            # 스포일러 리뷰는 본문 일부도 노출하지 않음
+            'highlight': '' if review.is_spoiler else highlight(review.comment, query),
+        }
+
+
+class BoardPostDocument(DocumentType):
+    def document(self, post):
+        return post.title, strip_tags(post.content)
+
+    def describe(self, post, query):
+        return {
+            'id': post.id,
+            'title': post.title,
+            'highlight': highlight(strip_tags(post.content), query),
+            'category': post.category.slug,
+            'created_at': post.created_at,
+        }
+
+
+DOCUMENT_TYPES = {
+    document_type.name: document_type for document_type in (
+        MovieDocument('movie', 'movies.Movie', watch_fields=('title', 'description'), defer=('search_vector',)),
+        ReviewDocument('review', 'reviews.Review', watch_fields=('comment',), select_related=('movie',),
+                       defer=('movie__search_vector',)),
+        BoardPostDocument('board_post', 'board.BoardPost', watch_fields=('title', 'content'),
+                          select_related=('category',), defer=('search_vector',)),
+    )
+}
+
+document_search = DocumentSearch({'title': 'A', 'body': 'B'})
+
+
+def document_type_for(model):
+    label = model._meta.label
+    for document_type in DOCUMENT_TYPES.values():
+        if document_type.model_label == label:
+            return document_type
+    return None
@@ -0,0 +1,185 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+
+from config.search import uses_postgres
+
+from .documents import DOCUMENT_TYPES, document_search, document_type_for
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG = {
+    'ASYNC': True,          # False면 커밋 직후 요청 스레드에서 바로 색인 (관리 명령/디버깅용)
+    'BATCH_DELAY': 1.0,     # 변경을 모아서 처리하기 위해 첫 변경 후 기다리는 시간(초)
+    'BATCH_SIZE': 500,      # 한 번에 다시 읽어 색인할 원본 수
+}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'SEARCH_INDEX', {})}
+
+
+def index_documents(doc_type, object_ids, using='default'):
+    """
+    원본을 다시 읽어 검색 문서를 upsert 하고, 없어졌거나 본문이 빈 원본의 문서는 삭제합니다.
+    """
+    from .models import SearchDocument
+
+    document_type = DOCUMENT_TYPES[doc_type]
+    postgres = uses_postgres(using)
+    removed, documents = set(object_ids), []
+    for object_id, obj in document_type.load(object_ids).items():
+        title, body = document_type.document(obj)
+        if not (title.strip() or body.strip()):
+            continue
+        removed.discard(object_id)
+        documents.append(SearchDocument(
+            doc_type=doc_type, object_id=object_id, title=title[:200], body=body,
+            search_vector=document_search.vector({'title': title, 'body': body}) if postgres else None,
+        ))
+
+    manager = SearchDocument.objects.using(using)
+    fallback = not postgres and document_search.index.loaded
+    if fallback:
+        for pk in manager.filter(doc_type=doc_type, object_id__in=removed).values_list('pk', flat=True):
+            document_search.index.remove(pk)
+
+    with transaction.atomic(using=using):
+        manager.filter(doc_type=doc_type, object_id__in=removed).delete()
+        manager.bulk_create(
+            documents,
+            update_conflicts=True,
+            unique_fields=['doc_type', 'object_id'],
+            update_fields=['title', 'body', 'search_vector', 'indexed_at'],
+        )
+
+    if fallback:
+        # PostgreSQL 외 DB는 프로세스 내 역색인을 함께 갱신
+        rows = manager.filter(doc_type=doc_type, object_id__in=[doc.object_id for doc in documents])
+        for pk, title, body in rows.values_list('pk', 'title', 'body'):
+            document_search.index.add(pk, {'title': title, 'body': body})
+    return len(documents)
+
+
+class SearchIndexQueue:
+    """
+    원본 저장/삭제 시 (문서 종류, id)만 큐에 넣고 백그라운드 스레드가 모아서 색인하는 큐.
+
+    - 쓰기 요청은 색인 비용(원본 재조회 + tsvector 생성 + upsert)을 기다리지 않음
+    - 같은 원본이 짧은 시간에 여러 번 수정되어도 한 번만 색인
+    - 항상 원본을 다시 읽어 색인하므로 처리 순서가 바뀌어도 최신 상태로 수렴
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._pending = {}              # (문서 종류, 원본 id) → None (삽입 순서 유지)
+        self._wakeup = threading.Event()
+        self._worker = None
+
+    def _ensure_process(self):
+        # fork된 워커는 부모의 큐/스레드를 물려받지 않도록 새로 초기화
+        if self._pid != os.getpid():
+            self._reset()
+
+    def enqueue(self, doc_type, object_id):
+        self._ensure_process()
+        with self._lock:
+            self._pending[(doc_type, object_id)] = None
+        if not get_config()['ASYNC']:
+            self.flush()
+            return
+        self._start_worker()
+        self._wakeup.set()
+
+    def pending_count(self):
+        self._ensure_process()
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self):
+        """
+        쌓인 변경을 BATCH_SIZE씩 처리합니다. 색인한 문서 수를 반환하며,
+        실패한 배치는 큐에 되돌려 다음 flush에서 다시 시도합니다.
+        """
+        self._ensure_process()
+        batch_size = get_config()['BATCH_SIZE']
+        indexed = 0
+        while True:
+            with self._lock:
+                keys = list(self._pending)[:batch_size]
+                for key in keys:
+                    del self._pending[key]
+            if not keys:
+                return indexed
+
+            by_type = defaultdict(list)
+            for doc_type, object_id in keys:
+                by_type[doc_type].append(object_id)
+            try:
+                for doc_type, object_ids in by_type.items():
+                    indexed += index_documents(doc_type, object_ids)
+            except Exception:
+                logger.exception("검색 색인 실패, 변경을 큐에 되돌립니다.")
+                with self._lock:
+                    for key in keys:
+                        self._pending.setdefault(key, None)
+                return indexed
+
+    def _start_worker(self):
+        if self._worker is not None:
+            return
+        with self._lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(target=self._run_worker, daemon=True)
+            self._worker.start()
+
+    def _run_worker(self):
+        while True:
+            self._wakeup.wait()
+            time.sleep(get_config()['BATCH_DELAY'])
+            self._wakeup.clear()
+            close_old_connections()
+            try:
+                self.flush()
+            finally:
+                # 백그라운드 스레드 전용 DB 연결 정리
+                connection.close()
+
+
+search_index_queue = SearchIndexQueue()
+atexit.register(search_index_queue.flush)
+
+
+# ---------------------------------------------------------------------
+# ✅ 원본 모델 저장/삭제 신호 → 커밋 후 색인 큐에 추가 (apps.py에서 연결)
+# ---------------------------------------------------------------------
+def handle_source_saved(sender, instance, update_fields=None, raw=False, **kwargs):
+    document_type = document_type_for(sender)
+    if raw or document_type is None:
+        return
+    if update_fields is not None and not document_type.watch_fields & set(update_fields):
+        return
+    transaction.on_commit(
+        lambda: search_index_queue.enqueue(document_type.name, instance.pk), using=kwargs.get('using')
+    )
+
+
+def handle_source_deleted(sender, instance, **kwargs):
+    document_type = document_type_for(sender)
+    if document_type is None:
+        return
+    object_id = instance.pk
+    transaction.on_commit(
+        lambda: search_index_queue.enqueue(document_type.name, object_id), using=kwargs.get('using')
+    )
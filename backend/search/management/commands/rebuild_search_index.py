@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from search.documents import DOCUMENT_TYPES
+from search.indexer import index_documents
+from search.models import SearchDocument
+
+
+class Command(BaseCommand):
+    help = (
+        '원본(영화/리뷰/게시글)을 기준으로 통합 검색 색인을 다시 만듭니다. '
+        'QuerySet.update()처럼 저장 신호 없이 바뀐 데이터를 반영할 때 사용합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--types',
+            default=','.join(DOCUMENT_TYPES),
+            help='다시 색인할 종류 (쉼표 구분, 기본값: 전체)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='한 번에 색인할 원본 수 (기본값: 1000)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(options['batch_size'], 1)
+        for doc_type in options['types'].split(','):
+            document_type = DOCUMENT_TYPES[doc_type]
+            # 원본에 없는 문서는 index_documents가 삭제하므로 기존 문서 id도 함께 대상에 포함
+            source_ids = set(document_type.model._default_manager.values_list('pk', flat=True))
+            source_ids |= set(SearchDocument.objects.filter(doc_type=doc_type).values_list('object_id', flat=True))
+            ids = sorted(source_ids)
+
+            indexed = 0
+            for start in range(0, len(ids), batch_size):
+                indexed += index_documents(doc_type, ids[start:start + batch_size])
+            self.stdout.write(self.style.SUCCESS(f'{doc_type}: {indexed}개 문서를 색인했습니다.'))
@@ -0,0 +1,122 @@
+# Generated by Django 5.2 on 2026-10-18 19:45
+
+import re
+import unicodedata
+from collections import defaultdict
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+from django.db.models import Value
+from django.db.models.functions import Cast
+from django.utils.html import strip_tags
+
+# ---------------------------------------------------------------------
+# 이 마이그레이션 시점의 토크나이저 / tsvector 생성 고정 복사본 (config/search.py)
+# 앱 코드를 import하면 이후 토크나이저가 바뀔 때 과거 마이그레이션의 백필 결과도 바뀌므로 복사해 둠
+# ---------------------------------------------------------------------
+HANGUL_RUN_RE = re.compile(r'[가-힣]+|[^\W_가-힣]+')
+MAX_WORD_LENGTH = 64
+
+
+def document_terms(text):
+    terms = []
+    for word in HANGUL_RUN_RE.findall(unicodedata.normalize('NFKC', text or '').lower()):
+        if '가' <= word[0] <= '힣':
+            terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+            terms.append(word[-1])
+        else:
+            terms.append(word[:MAX_WORD_LENGTH])
+    return terms
+
+
+def _quote(term):
+    return "'" + term.replace("'", "''").replace('\\', '\\\\') + "'"
+
+
+def search_vector(weighted_texts, qualified_weights=''):
+    """[(텍스트, 'A'), (텍스트, 'B')] → tsvector 리터럴 캐스팅 표현식"""
+    lexemes, position = defaultdict(list), 0
+    for text, weight in weighted_texts:
+        for term in document_terms(text):
+            position = min(position + 1, 16383)
+            lexemes[term].append(f"{position}{weight}")
+            if weight in qualified_weights:
+                lexemes[f"{weight}:{term}"].append(f"{position}{weight}")
+    literal = ' '.join(f"{_quote(term)}:{','.join(positions)}" for term, positions in lexemes.items())
+    return Cast(Value(literal), django.contrib.postgres.search.SearchVectorField())
+
+
+DOC_TYPES = ('movie', 'review', 'board_post')
+
+
+def backfill_documents(apps, schema_editor):
+    """기존 영화/리뷰 코멘트/게시글을 색인 (원본 저장 신호는 이후 변경분만 처리)"""
+    SearchDocument = apps.get_model('search', 'SearchDocument')
+    postgres = schema_editor.connection.vendor == 'postgresql'
+    sources = [
+        ('movie', apps.get_model('movies', 'Movie').objects.values_list('pk', 'title', 'description')),
+        ('review', apps.get_model('reviews', 'Review').objects.exclude(comment='').values_list('pk', 'comment')),
+        ('board_post', apps.get_model('board', 'BoardPost').objects.values_list('pk', 'title', 'content')),
+    ]
+    for doc_type, rows in sources:
+        batch = []
+        for pk, *texts in rows.iterator():
+            title, body = texts if len(texts) == 2 else ('', texts[0])
+            body = strip_tags(body or '') if doc_type == 'board_post' else body or ''
+            batch.append(SearchDocument(
+                doc_type=doc_type, object_id=pk, title=title[:200], body=body,
+                search_vector=search_vector([(title, 'A'), (body, 'B')]) if postgres else None,
+            ))
+            if len(batch) >= 1000:
+                SearchDocument.objects.bulk_create(batch)
+                batch = []
+        SearchDocument.objects.bulk_create(batch)
+
+
+def create_search_index(apps, schema_editor):
+    """종류별 부분 GIN 인덱스 (흔한 단어도 다른 종류의 일치 행을 건너뛰지 않고 해당 종류만 읽음)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for doc_type in DOC_TYPES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS search_document_{doc_type}_vector_gin '
+            f"ON search_searchdocument USING gin (search_vector) WHERE doc_type = '{doc_type}'"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for doc_type in DOC_TYPES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS search_document_{doc_type}_vector_gin')
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('board', '0010_boardpost_search_vector'),
+        ('movies', '0005_movie_search_vector'),
+        ('reviews', '0014_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('doc_type', models.CharField(choices=[('movie', '영화'), ('review', '리뷰'), ('board_post', '게시글')], max_length=20, verbose_name='문서 종류')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='원본 id')),
+                ('title', models.CharField(blank=True, max_length=200, verbose_name='제목')),
+                ('body', models.TextField(blank=True, verbose_name='본문')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='검색 벡터')),
+                ('indexed_at', models.DateTimeField(auto_now=True, verbose_name='색인 일시')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('doc_type', 'object_id'), name='search_document_unique_source')],
+            },
+        ),
+        migrations.RunPython(backfill_documents, migrations.RunPython.noop),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,29 @@
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+
+# ✅ 통합 검색 문서 (영화 / 리뷰 코멘트 / 게시글을 한 테이블에 색인)
+# - 원본 모델이 저장될 때 search/indexer.py의 큐를 거쳐 비동기로 갱신
+# - 결과를 보여줄 때는 (doc_type, object_id)로 원본을 다시 조회
+class SearchDocument(models.Model):
+    DOC_TYPE_CHOICES = [
+        ('movie', '영화'),
+        ('review', '리뷰'),
+        ('board_post', '게시글'),
+    ]
+
+    doc_type = models.CharField(max_length=20, choices=DOC_TYPE_CHOICES, verbose_name="문서 종류")
+    object_id = models.PositiveBigIntegerField(verbose_name="원본 id")
+    title = models.CharField(max_length=200, blank=True, verbose_name="제목")
+    body = models.TextField(blank=True, verbose_name="본문")
+    # ✅ 제목 A / 본문 B n-gram tsvector (PostgreSQL에서만 채워짐, 종류별 부분 GIN 인덱스는 마이그레이션 0001에서 생성)
+    search_vector = SearchVectorField(null=True, editable=False, verbose_name="검색 벡터")
+    indexed_at = models.DateTimeField(auto_now=True, verbose_name="색인 일시")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['doc_type', 'object_id'], name='search_document_unique_source'),
+        ]
+
+    def __str__(self):
+        return f"[{self.doc_type}] {self.object_id} {self.title}"
@@ -0,0 +1,128 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from board.models import BoardCategory, BoardPost
+from movies.models import Movie
+from reviews.models import Review
+from search.documents import document_search
+from search.indexer import SearchIndexQueue, search_index_queue
+from search.models import SearchDocument
+
+User = get_user_model()
+
+
+@override_settings(SEARCH_INDEX={'ASYNC': False}, MOVIE_CONTENT_NEIGHBORS={'ASYNC': False})
+class UnifiedSearchTest(TestCase):
+    def setUp(self):
+        # 프로세스 내 역색인(SQLite 대체 경로)은 테스트 간 롤백을 모르므로 매번 초기화
+        document_search.index.reset()
+        search_index_queue.flush()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='searcher', email='searcher@example.com', password='pass1234')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.movie = Movie.objects.create(
+                title='기생충', description='반지하 가족의 이야기', release_date='2019-05-30',
+            )
+            self.other_movie = Movie.objects.create(
+                title='괴물', description='한강에 나타난 기생충 같은 괴물', release_date='2006-07-27',
+            )
+            self.review = Review.objects.create(
+                user=self.user, movie=self.other_movie, rating=4, comment='기생충보다 무서웠다',
+            )
+            self.spoiler = Review.objects.create(
+                user=self.user, movie=self.movie, rating=5, comment='기생충 결말은 충격', is_spoiler=True,
+            )
+            category = BoardCategory.objects.create(name='자유', slug='free')
+            self.post = BoardPost.objects.create(
+                category=category, user=self.user, title='기생충 후기', content='<p>명작입니다</p>',
+            )
+
+    def search(self, **params):
+        response = self.client.get('/api/search/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['groups']
+
+    def ids(self, group):
+        return [result['id'] for result in group['results']]
+
+    def test_groups_are_ranked_per_type(self):
+        groups = self.search(q='기생충')
+        self.assertEqual(list(groups), ['movie', 'review', 'board_post'])
+        # 제목 일치(A)가 설명 일치(B)보다 먼저
+        self.assertEqual(self.ids(groups['movie']), [self.movie.id, self.other_movie.id])
+        self.assertEqual(groups['movie']['count'], 2)
+        self.assertEqual(sorted(self.ids(groups['review'])), sorted([self.review.id, self.spoiler.id]))
+        self.assertEqual(self.ids(groups['board_post']), [self.post.id])
+        self.assertEqual(groups['movie']['results'][1]['highlight'], '한강에 나타난 <mark>기생충</mark> 같은 괴물')
+
+        reviews = {result['id']: result for result in groups['review']['results']}
+        self.assertEqual(reviews[self.review.id]['movie_title'], '괴물')
+        self.assertEqual(reviews[self.spoiler.id]['highlight'], '')
+
+    def test_each_group_is_paginated_separately(self):
+        groups = self.search(q='기생충', page_size=1)
+        movies = groups['movie']
+        self.assertEqual(self.ids(movies), [self.movie.id])
+        self.assertIn('types=movie', movies['next'])
+        self.assertIn('movie_page=2', movies['next'])
+
+        response = self.client.get(movies['next'])
+        groups = response.json()['groups']
+        self.assertEqual(list(groups), ['movie'])
+        self.assertEqual(self.ids(groups['movie']), [self.other_movie.id])
+        self.assertIsNone(groups['movie']['next'])
+        self.assertIsNotNone(groups['movie']['previous'])
+
+        self.assertEqual(self.client.get('/api/search/', {'q': '기생충', 'types': 'actor'}).status_code, 404)
+
+    def test_matches_outside_rank_window_are_kept(self):
+        # 최신 일치 1개만 순위 계산 → 제목 일치(movie)도 빠지지 않고 그 뒤에 최신순으로
+        with mock.patch('search.views.RANK_WINDOW', 1):
+            movies = self.search(q='기생충', types='movie')['movie']
+            self.assertEqual(self.ids(movies), [self.other_movie.id, self.movie.id])
+            self.assertEqual(movies['count'], 2)
+
+            movies = self.search(q='기생충', types='movie', page_size=1, movie_page=2)['movie']
+            self.assertEqual(self.ids(movies), [self.movie.id])
+            self.assertIsNone(movies['next'])
+
+    def test_index_follows_source_changes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.title = '괴물 후기'
+            self.post.save()
+            self.review.comment = ''
+            self.review.save(update_fields=['comment'])
+            self.movie.delete()
+        groups = self.search(q='기생충')
+        self.assertEqual(self.ids(groups['movie']), [self.other_movie.id])
+        # 코멘트가 비워진 리뷰와 영화 삭제로 함께 지워진 리뷰 모두 색인에서 빠짐
+        self.assertEqual(self.ids(groups['review']), [])
+        self.assertEqual(self.ids(groups['board_post']), [])
+        self.assertEqual(self.ids(self.search(q='괴물 후기')['board_post']), [self.post.id])
+        self.assertFalse(SearchDocument.objects.filter(doc_type='movie', object_id=self.movie.id).exists())
+
+    def test_unrelated_updates_are_not_queued(self):
+        queue = SearchIndexQueue()
+        with override_settings(SEARCH_INDEX={'ASYNC': True, 'BATCH_DELAY': 60}):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.post.like_count = 3
+                self.post.save(update_fields=['like_count'])
+            self.assertEqual(search_index_queue.pending_count(), 0)
+
+            queue.enqueue('board_post', self.post.id)
+            queue.enqueue('board_post', self.post.id)
+            self.assertEqual(queue.pending_count(), 1)
+        self.assertEqual(queue.flush(), 1)
+        self.assertEqual(queue.pending_count(), 0)
+
+    def test_rebuild_command_restores_missing_documents(self):
+        SearchDocument.objects.all().delete()
+        document_search.index.reset()
+        call_command('rebuild_search_index', stdout=StringIO())
+        self.assertEqual(SearchDocument.objects.count(), 5)
+        self.assertEqual(self.ids(self.search(q='명작')['board_post']), [self.post.id])
@@ -0,0 +1,8 @@
+from django.urls import path
+from .views import UnifiedSearchView
+
+urlpatterns = [
+    # 🔎 통합 검색 (영화 / 리뷰 / 게시글)
+    # GET /api/search/?q=키워드&types=movie,review,board_post&page_size=5&movie_page=2
+    path('', UnifiedSearchView.as_view(), name='unified-search'),
+]
@@ -0,0 +1,118 @@
+from django.core.paginator import EmptyPage, InvalidPage
+from rest_framework.exceptions import NotFound
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from rest_framework.views import APIView
+
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from config.pagination import ApproximateCountPaginator
+from .documents import DOCUMENT_TYPES, document_search
+from .models import SearchDocument
+
+DEFAULT_PAGE_SIZE = 5
+MAX_PAGE_SIZE = 50
+# 종류별로 관련도 순위를 매기는 최신 일치 문서 수 (나머지 일치 문서는 그 뒤에 최신순, board/search.py와 같은 방식)
+RANK_WINDOW = 200
+RECENT_SCAN = 4000
+
+
+# ✅ 통합 검색 (영화 / 리뷰 / 게시글을 하나의 색인에서 검색해 종류별로 묶어 반환)
+class UnifiedSearchView(APIView):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        operation_summary="통합 검색",
+        operation_description=(
+            "영화(제목/설명), 리뷰 코멘트, 게시글(제목/본문)을 한 번에 검색합니다.\n"
+            "결과는 종류별로 관련도순 정렬되어 `groups`에 묶이며, 종류마다 따로 페이지를 넘깁니다.\n"
+            "각 그룹의 `next`/`previous` 링크는 해당 종류만 조회하도록 `types`가 지정되어 있습니다.\n"
+            f"관련도 순위는 종류별로 가장 최근에 일치한 {RANK_WINDOW}개 안에서 매기고, 나머지 일치 결과는 그 뒤에 "
+            "최신순으로 이어집니다 (`count`는 전체 일치 수).\n"
+            "색인은 저장 후 비동기로 갱신되므로 방금 작성한 글은 잠시 뒤에 검색될 수 있습니다."
+        ),
+        manual_parameters=[
+            openapi.Parameter('q', openapi.IN_QUERY, description="검색어", type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter(
+                'types', openapi.IN_QUERY,
+                description="검색할 종류 (쉼표 구분: `movie`, `review`, `board_post`, 기본값: 전체)",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                'page_size', openapi.IN_QUERY,
+                description=f"종류별 결과 수 (기본 {DEFAULT_PAGE_SIZE}, 최대 {MAX_PAGE_SIZE})",
+                type=openapi.TYPE_INTEGER,
+            ),
+            *[
+                openapi.Parameter(f'{doc_type}_page', openapi.IN_QUERY, description=f"{doc_type} 그룹 페이지 번호",
+                                  type=openapi.TYPE_INTEGER)
+                for doc_type in DOCUMENT_TYPES
+            ],
+        ],
+    )
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        types = [doc_type for doc_type in request.query_params.get('types', '').split(',') if doc_type]
+        if not types:
+            types = list(DOCUMENT_TYPES)
+        unknown = [doc_type for doc_type in types if doc_type not in DOCUMENT_TYPES]
+        if unknown:
+            raise NotFound(f"알 수 없는 검색 종류입니다: {', '.join(unknown)}")
+        try:
+            page_size = min(max(int(request.query_params.get('page_size', DEFAULT_PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+        except ValueError:
+            page_size = DEFAULT_PAGE_SIZE
+
+        groups = {}
+        for doc_type in types:
+            groups[doc_type] = self.search_group(request, doc_type, query, page_size) if query else {
+                'count': 0, 'count_is_approximate': False, 'next': None, 'previous': None, 'results': [],
+            }
+        return Response({'query': query, 'groups': groups})
+
+    def search_group(self, request, doc_type, query, page_size):
+        """한 종류의 검색 결과 한 페이지 (색인에서 id만 고른 뒤 원본을 한 번에 조회)"""
+        page_param = f'{doc_type}_page'
+        documents = SearchDocument.objects.filter(doc_type=doc_type).only('id', 'object_id')
+        # (doc_type, object_id) 유니크 인덱스를 역순으로 읽어 최신 원본부터 스캔
+        ranked = document_search.rank(documents, query, (('-object_id',), RANK_WINDOW, RECENT_SCAN))
+
+        # 전체 일치 수 (크면 실행 계획 추정치)
+        paginator = ApproximateCountPaginator(ranked, page_size)
+        try:
+            page = paginator.page(request.query_params.get(page_param, 1))
+        except EmptyPage:
+            page = None
+        except InvalidPage:
+            raise NotFound(f"잘못된 페이지 번호입니다: {page_param}")
+
+        results = []
+        if page is not None:
+            document_type = DOCUMENT_TYPES[doc_type]
+            sources = document_type.load([document.object_id for document in page])
+            # 색인 갱신 전에 삭제된 원본은 건너뜀
+            results = [
+                {**document_type.describe(sources[document.object_id], query), 'score': document.search_score}
+                for document in page if document.object_id in sources
+            ]
+
+        url = replace_query_param(request.build_absolute_uri(), 'types', doc_type)
+        next_url = previous_url = None
+        if page is not None and page.has_next():
+            next_url = replace_query_param(url, page_param, page.next_page_number())
+        if page is not None and page.has_previous():
+            previous_number = page.previous_page_number()
+            previous_url = (
+                remove_query_param(url, page_param) if previous_number == 1
+                else replace_query_param(url, page_param, previous_number)
+            )
+        return {
+            'count': paginator.count,
+            'count_is_approximate': paginator.is_approximate,
+            'next': next_url,
+            'previous': previous_url,
+            'results': results,
+        }
@@ -1,6 +1,16 @@
 from django.apps import AppConfig
+from django.db.models.signals import m2m_changed
 
 
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
+
+    def ready(self):
+        from .models import User
+        from .subscriptions import handle_subscribed_ott_changed
+
+        # ✅ 구독 OTT가 바뀌면 사용자별 구독 캐시 삭제
+        m2m_changed.connect(
+            handle_subscribed_ott_changed, sender=User.subscribed_ott.through, dispatch_uid='users:subscribed_ott',
+        )
@@ -0,0 +1,62 @@
+from django.db.models import BooleanField, ExpressionWrapper, OuterRef, Q, Subquery, Value
+from rest_framework import serializers
+
+from board.models import BoardPost, BoardPostLike
+from reviews.models import Review, ReviewReaction
+
+# ---------------------------------------------------------------------
+# ✅ 내 반응 오버레이 (/api/me/reactions/?reviews=1,2,3&posts=4,5)
+# - 리뷰/게시글 목록 응답은 사용자와 무관한 본문만 담고 (공유 캐시 가능),
+#   화면에 보이는 id들의 내 투표 / 작성자 여부는 이 API로 한 번에 받아 덮어씀
+# - 종류별로 PK IN (...) + (user, 대상) unique 인덱스 서브쿼리, 두 종류는 UNION ALL 한 쿼리
+# - 없는 id는 응답에서 빠짐
+# ---------------------------------------------------------------------
+MAX_IDS = 100   # 종류별 최대 id 수 (목록 한 페이지보다 넉넉하게)
+
+
+def parse_ids(params, name):
+    raw = params.get(name, '')
+    try:
+        ids = {int(part) for part in raw.split(',') if part.strip()}
+    except ValueError:
+        ids = None
+    if ids is None or any(not 0 < value < 2 ** 63 for value in ids):
+        raise serializers.ValidationError({name: '쉼표로 구분한 양의 정수 id 목록이어야 합니다.'})
+    if len(ids) > MAX_IDS:
+        raise serializers.ValidationError({name: f'한 번에 최대 {MAX_IDS}개까지 조회할 수 있습니다.'})
+    return sorted(ids)
+
+
+def get_my_reactions(user, review_ids=(), post_ids=()):
+    """
+    {'reviews': {id: {'my_vote': 1 | -1 | 0, 'is_owner': bool}},
+     'posts': {id: {'my_like': True | False | None, 'is_owner': bool}}}
+    """
+    querysets = []
+    for kind, model, like_model, target_field, ids in (
+        ('reviews', Review, ReviewReaction, 'review', review_ids),
+        ('posts', BoardPost, BoardPostLike, 'post', post_ids),
+    ):
+        if not ids:
+            continue
+        my_like = like_model.objects.filter(user=user, **{target_field: OuterRef('pk')}).values('is_like')[:1]
+        querysets.append(
+            model.objects.filter(pk__in=ids)
+            .annotate(
+                kind=Value(kind),
+                is_owner=ExpressionWrapper(Q(user=user), output_field=BooleanField()),
+                my_like=Subquery(my_like, output_field=BooleanField()),
+            )
+            .values_list('kind', 'id', 'is_owner', 'my_like')
+        )
+
+    result = {'reviews': {}, 'posts': {}}
+    if not querysets:
+        return result
+    rows = querysets[0].union(*querysets[1:], all=True) if len(querysets) > 1 else querysets[0]
+    for kind, target_id, is_owner, my_like in rows:
+        if kind == 'reviews':
+            result[kind][target_id] = {'my_vote': {True: 1, False: -1}.get(my_like, 0), 'is_owner': is_owner}
+        else:
+            result[kind][target_id] = {'my_like': my_like, 'is_owner': is_owner}
+    return result
@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.core.cache import caches
+
+from ott.models import MAX_BITMASK_OTT_ID, ott_bitmask
+
+# ---------------------------------------------------------------------
+# ✅ 사용자별 구독 OTT 캐시 (구독 OTT id 집합을 비트마스크 하나로 저장)
+# - /api/movies/for-me/ 요청마다 구독 연결 테이블을 읽지 않도록 캐시에서 조회
+# - subscribe_ott / 관리자 화면 등으로 subscribed_ott가 바뀌면 m2m_changed 신호로 즉시 삭제
+# - 캐시가 워커별 LocMemCache이면 다른 워커는 CACHE_TIMEOUT 동안 이전 값을 볼 수 있으므로
+#   운영에서는 공유 캐시(Redis 등) 별칭을 지정
+# ---------------------------------------------------------------------
+DEFAULT_CONFIG = {
+    'CACHE_ALIAS': 'default',
+    'CACHE_TIMEOUT': 300,       # 초
+}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'OTT_SUBSCRIPTION_CACHE', {})}
+
+
+def subscription_cache_key(user_id):
+    return f"users:subscribed_ott_mask:{user_id}"
+
+
+def get_subscribed_ott_mask(user):
+    config = get_config()
+    cache = caches[config['CACHE_ALIAS']]
+    key = subscription_cache_key(user.pk)
+    mask = cache.get(key)
+    if mask is None:
+        ott_ids = user.subscribed_ott.values_list('id', flat=True)
+        mask = ott_bitmask(ott_id for ott_id in ott_ids if ott_id <= MAX_BITMASK_OTT_ID)
+        cache.set(key, mask, config['CACHE_TIMEOUT'])
+    return mask
+
+
+def invalidate_subscribed_ott(user_id):
+    caches[get_config()['CACHE_ALIAS']].delete(subscription_cache_key(user_id))
+
+
+def handle_subscribed_ott_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """사용자 쪽(user.subscribed_ott.set) / OTT 쪽(ott.subscribers.add) 변경 모두 해당 사용자 캐시 삭제"""
+    if action not in ('post_add', 'post_remove', 'post_clear', 'pre_clear'):
+        return
+    if not reverse:
+        invalidate_subscribed_ott(instance.pk)
+        return
+    # OTT 쪽 clear()는 post_clear에서 대상 사용자를 알 수 없으므로 pre_clear에서 미리 삭제
+    user_ids = pk_set if pk_set is not None else instance.subscribers.values_list('id', flat=True)
+    for user_id in user_ids:
+        invalidate_subscribed_ott(user_id)
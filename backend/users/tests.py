@@ -1,3 +1,57 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from board.models import BoardCategory, BoardPost, BoardPostLike
+from movies.models import Movie
+from reviews.models import Review, ReviewReaction
+from users.reactions import MAX_IDS
+
+User = get_user_model()
+
+
+class MyReactionsTest(TestCase):
+    def setUp(self):
+        self.me = User.objects.create_user(username='me', email='me@example.com', password='pass1234')
+        other = User.objects.create_user(username='other', email='other@example.com', password='pass1234')
+        movie = Movie.objects.create(title='반응 영화', description='설명', release_date='2024-01-01')
+        self.my_review = Review.objects.create(user=self.me, movie=movie, rating=4)
+        self.liked_review = Review.objects.create(user=other, movie=movie, rating=3)
+        ReviewReaction.objects.create(user=self.me, review=self.liked_review, is_like=False)
+        category = BoardCategory.objects.create(name='자유', slug='free')
+        self.my_post = BoardPost.objects.create(category=category, user=self.me, title='내 글', content='내용')
+        self.other_post = BoardPost.objects.create(category=category, user=other, title='남의 글', content='내용')
+        BoardPostLike.objects.create(user=self.me, post=self.other_post, is_like=True)
+        self.client = APIClient()
+        self.client.force_authenticate(self.me)
+
+    def test_votes_and_ownership_in_one_query(self):
+        params = {
+            'reviews': f'{self.my_review.id},{self.liked_review.id},999999',
+            'posts': f'{self.my_post.id},{self.other_post.id}',
+        }
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/me/reactions/', params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'reviews': {
+                str(self.my_review.id): {'my_vote': 0, 'is_owner': True},
+                str(self.liked_review.id): {'my_vote': -1, 'is_owner': False},
+            },
+            'posts': {
+                str(self.my_post.id): {'my_like': None, 'is_owner': True},
+                str(self.other_post.id): {'my_like': True, 'is_owner': False},
+            },
+        })
+        self.assertIn('private', response['Cache-Control'])
+
+        # 게시글 목록 본문에는 사용자별 필드 없음
+        results = self.client.get('/api/board/posts/').json()['results']
+        self.assertNotIn('my_like', results[0])
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.client.get('/api/me/reactions/', {'reviews': '1,a'}).status_code, 400)
+        too_many = ','.join(str(i) for i in range(1, MAX_IDS + 2))
+        self.assertEqual(self.client.get('/api/me/reactions/', {'posts': too_many}).status_code, 400)
+        self.assertEqual(self.client.get('/api/me/reactions/').json(), {'reviews': {}, 'posts': {}})
+        self.assertIn(APIClient().get('/api/me/reactions/', {'reviews': '1'}).status_code, (401, 403))
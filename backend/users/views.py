@@ -5,6 +5,8 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework_simplejwt.exceptions import InvalidToken
 from rest_framework_simplejwt.views import TokenRefreshView
+from django.utils.cache import patch_cache_control
+from .reactions import get_my_reactions, parse_ids
 from .serializers import RegisterSerializer
 from ott.models import OTT
 
@@ -190,6 +192,7 @@ def subscribe_ott(request):
         return Response({'error': 'ott_ids는 리스트여야 합니다.'}, status=400)
 
     user = request.user
+    # 구독 OTT 캐시(/api/movies/for-me/)는 m2m_changed 신호로 삭제됨 (users/subscriptions.py)
     user.subscribed_ott.set(ott_ids)
     return Response({'message': '구독 정보가 갱신되었습니다.'})
 
@@ -203,4 +206,37 @@ def update_profile(request):
         user.username = username
         user.save()
         return Response({'message': '프로필이 수정되었습니다.'})
-    return Response({'error': '닉네임이 없습니다.'}, status=400)
\ No newline at end of file
+    return Response({'error': '닉네임이 없습니다.'}, status=400)
+
+
+# ✅ 내 반응 오버레이 (목록 응답은 사용자와 무관하게 캐시하고, 내 투표/작성자 여부는 여기서 한 번에)
+class MyReactionsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_summary="내 반응 조회 (리뷰 투표 / 게시글 추천 / 작성자 여부)",
+        operation_description=(
+            "리뷰/게시글 목록 응답에는 사용자별 필드(my_vote, is_owner, my_like)가 없으므로, "
+            "화면에 보이는 id들을 모아 한 번에 조회합니다. 종류별 최대 100개, 없는 id는 응답에서 빠집니다."
+        ),
+        manual_parameters=[
+            openapi.Parameter('reviews', openapi.IN_QUERY, description="리뷰 id 목록 (쉼표 구분)", type=openapi.TYPE_STRING),
+            openapi.Parameter('posts', openapi.IN_QUERY, description="게시글 id 목록 (쉼표 구분)", type=openapi.TYPE_STRING),
+        ],
+        responses={200: openapi.Response(
+            description="id별 내 반응",
+            examples={"application/json": {
+                "reviews": {"12": {"my_vote": 1, "is_owner": False}},
+                "posts": {"7": {"my_like": None, "is_owner": True}},
+            }}
+        )}
+    )
+    def get(self, request):
+        reactions = get_my_reactions(
+            request.user,
+            review_ids=parse_ids(request.query_params, 'reviews'),
+            post_ids=parse_ids(request.query_params, 'posts'),
+        )
+        response = Response(reactions)
+        patch_cache_control(response, private=True)
+        return response
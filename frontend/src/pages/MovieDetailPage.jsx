@@ -143,7 +143,18 @@ const MovieDetailPage = ({ isLoggedIn, username } ) => {
     setReviewsLoading(true);
     try {
       const response = await axios.get(`/reviews/?movie=${id}&ordering=${ordering}`);
-      setReviews(Array.isArray(response.data) ? response.data : (Array.isArray(response.data.results) ? response.data.results : []));
+      const list = Array.isArray(response.data) ? response.data : (Array.isArray(response.data.results) ? response.data.results : []);
+      // 목록 응답에는 사용자별 필드가 없으므로 내 투표/작성자 여부를 한 번에 받아 덮어씀
+      if (isLoggedIn && list.length > 0) {
+        try {
+          const mine = await axios.get('/me/reactions/', { params: { reviews: list.map(r => r.id).join(',') } });
+          setReviews(list.map(r => ({ ...r, ...(mine.data.reviews[r.id] || {}) })));
+        } catch {
+          setReviews(list);
+        }
+      } else {
+        setReviews(list);
+      }
     } catch {
       setReviews([]);
     }
@@ -151,7 +162,7 @@ const MovieDetailPage = ({ isLoggedIn, username } ) => {
   };
   useEffect(() => {
     if (id) fetchReviews();
-  }, [id, ordering]);
+  }, [id, ordering, isLoggedIn]);
 
 
   // 리뷰 작성
@@ -544,7 +555,7 @@ const MovieDetailPage = ({ isLoggedIn, username } ) => {
           <div className="movie-average-rating">
             {renderAverageStars(movie.average_rating)}
             <span className="rating-num">{movie.average_rating} / 5</span>
-            <span className="rating-count">({movie.reviews.length}명 참여)</span>
+            <span className="rating-count">({movie.review_count}명 참여)</span>
           </div>
           <p className="movie-description">{movie.description}</p>
         </div>